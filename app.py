@@ -9,8 +9,14 @@ from flask_caching import Cache
 
 from config import get_config
 from models import db
-from services import register_all_exchanges  # <-- 'cache' прибрано звідси
+from services import (  # <-- 'cache' прибрано звідси
+    register_all_exchanges, init_health_monitor, init_shared_snapshot, init_snapshot_distribution,
+    init_sharded_engine
+)
 from cli import register_commands
+from utils.json_provider import init_json_provider
+from utils.admission import init_admission_control
+from utils.freshness import init_freshness_control
 
 # Ініціалізація розширень як глобальних об'єктів
 migrate = Migrate()
@@ -31,6 +37,7 @@ def create_app(config_name=None):
     # 1. Завантаження конфігурації
     config = get_config(config_name)
     app.config.from_object(config)
+    init_json_provider(app)
 
     # 2. Налаштування логування
     if not app.debug and not app.testing:
@@ -41,19 +48,29 @@ def create_app(config_name=None):
     cache.init_app(app)  # Ініціалізуємо кеш з конфігурацією додатку
     limiter.init_app(app)
     migrate.init_app(app, db)
+    init_admission_control(app)
+    init_freshness_control(app)
 
     # 4. Реєстрація Blueprints (маршрутів)
     from routes.arbitrage import arbitrage_bp
     from routes.tokens import tokens_bp
     from routes.networks import networks_bp
+    from routes.batch import batch_bp
+    from routes.snapshot import snapshot_bp
 
     app.register_blueprint(arbitrage_bp, url_prefix='/api/v1')
     app.register_blueprint(tokens_bp, url_prefix='/api/v1')
     app.register_blueprint(networks_bp, url_prefix='/api/v1')
+    app.register_blueprint(batch_bp, url_prefix='/api/v1')
+    app.register_blueprint(snapshot_bp, url_prefix='/api/v1')
 
     # 5. Ініціалізація сервісів (виконується в контексті додатку)
     with app.app_context():
         register_all_exchanges()
+    init_health_monitor(app)
+    init_snapshot_distribution(app)
+    init_shared_snapshot(app)
+    init_sharded_engine(app)
 
     # 6. Реєстрація CLI команд
     register_commands(app)
@@ -118,10 +135,14 @@ def register_blueprints(app):
         from routes.arbitrage import arbitrage_bp
         from routes.tokens import tokens_bp
         from routes.networks import networks_bp
+        from routes.batch import batch_bp
+        from routes.snapshot import snapshot_bp
 
         app.register_blueprint(arbitrage_bp, url_prefix='/api/v1')
         app.register_blueprint(tokens_bp, url_prefix='/api/v1')
         app.register_blueprint(networks_bp, url_prefix='/api/v1')
+        app.register_blueprint(batch_bp, url_prefix='/api/v1')
+        app.register_blueprint(snapshot_bp, url_prefix='/api/v1')
 
         app.logger.info("All blueprints registered successfully")
 
@@ -0,0 +1,13 @@
+"""
+ASGI entry point for long-lived streaming and long-poll clients
+
+Usage:
+    uvicorn asgi:app --host 0.0.0.0 --port 5000
+"""
+
+import os
+from app import create_app
+from utils.asgi import AsgiApplication
+
+# Create ASGI application
+app = AsgiApplication(create_app(os.getenv('FLASK_ENV', 'production')))
@@ -26,6 +26,9 @@ class Config:
     CACHE_TYPE = 'simple'
     CACHE_DEFAULT_TIMEOUT = 300
 
+    # JSON serialization ('orjson' or 'stdlib')
+    JSON_PROVIDER = os.getenv('JSON_PROVIDER', 'orjson')
+
     # Exchange API Keys
     BINANCE_API_KEY = os.getenv('BINANCE_API_KEY')
     BINANCE_API_SECRET = os.getenv('BINANCE_API_SECRET')
@@ -62,6 +65,75 @@ class Config:
     CACHE_DURATION = int(os.getenv('CACHE_DURATION', 3600))  # 1 hour
     MIN_ARBITRAGE_SPREAD = float(os.getenv('MIN_ARBITRAGE_SPREAD', 0.1))  # 0.1%
 
+    # Snapshot long-poll and streaming
+    SNAPSHOT_POLL_INTERVAL = float(os.getenv('SNAPSHOT_POLL_INTERVAL', 1.0))  # seconds between snapshot checks
+    LONG_POLL_TIMEOUT = float(os.getenv('LONG_POLL_TIMEOUT', 30))  # max seconds a long-poll waits
+
+    # Shared market snapshot: one ingestor process publishes, all server processes map it
+    SHARED_SNAPSHOT_ENABLED = os.getenv('SHARED_SNAPSHOT_ENABLED', 'false').lower() == 'true'
+    SHARED_SNAPSHOT_DIR = os.getenv('SHARED_SNAPSHOT_DIR')  # default: <tmp>/arbitrage-bot
+    SHARED_SNAPSHOT_INTERVAL = float(os.getenv('SHARED_SNAPSHOT_INTERVAL', 1.0))  # seconds between ingest rounds
+    SHARED_SNAPSHOT_REFRESH_INTERVAL = float(os.getenv('SHARED_SNAPSHOT_REFRESH_INTERVAL', 30))  # max trading data age the ingestor keeps
+
+    # Snapshot distribution between API nodes
+    SNAPSHOT_BROKER = os.getenv('SNAPSHOT_BROKER', '')  # '' (off), 'redis' or 'memory' (single process)
+    SNAPSHOT_BROKER_URL = os.getenv('SNAPSHOT_BROKER_URL', os.getenv('REDIS_URL', 'redis://localhost:6379'))
+    SNAPSHOT_CHANNEL = os.getenv('SNAPSHOT_CHANNEL', 'arbitrage:snapshots')
+    SNAPSHOT_PUBLISHER = os.getenv('SNAPSHOT_PUBLISHER', 'true').lower() == 'true'  # may hold the publisher lease
+    SNAPSHOT_PUBLISH_INTERVAL = float(os.getenv('SNAPSHOT_PUBLISH_INTERVAL', 1.0))  # seconds between publish rounds
+    SNAPSHOT_FULL_EVERY = int(os.getenv('SNAPSHOT_FULL_EVERY', 30))  # versions between full snapshots
+    SNAPSHOT_STREAM_MAXLEN = int(os.getenv('SNAPSHOT_STREAM_MAXLEN', 1000))  # messages kept for catch-up
+
+    # Sharded arbitrage ranking
+    ENGINE_SHARDS = int(os.getenv('ENGINE_SHARDS', 0))  # shard processes, 0 or 1 ranks in-process
+    ENGINE_SHARD_REPLICAS = int(os.getenv('ENGINE_SHARD_REPLICAS', 100))  # hash ring points per shard
+    ENGINE_SHARD_TIMEOUT = float(os.getenv('ENGINE_SHARD_TIMEOUT', 30))  # seconds before a shard is ranked locally
+
+    # Background cache refresh
+    REFRESH_WORKERS = int(os.getenv('REFRESH_WORKERS', 8))  # parallel exchange fetches per refresh job
+
+    # Exchange API circuit breakers
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', 3))  # consecutive failures to open
+    CIRCUIT_BACKOFF_BASE = float(os.getenv('CIRCUIT_BACKOFF_BASE', 5.0))  # first open period, doubled per failed trial
+    CIRCUIT_BACKOFF_MAX = float(os.getenv('CIRCUIT_BACKOFF_MAX', 300.0))  # longest open period
+    CIRCUIT_NEGATIVE_TTL = float(os.getenv('CIRCUIT_NEGATIVE_TTL', 2.0))  # no retries this long after a failure
+
+    # Exchange REST connection pools
+    HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', 8))  # keep-alive connections per exchange host
+    HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', 3.05))  # seconds
+    HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', 10))  # seconds
+    HTTP_RETRIES = int(os.getenv('HTTP_RETRIES', 2))  # retries of connect/read errors and 5xx responses
+    HTTP_RETRY_BACKOFF = float(os.getenv('HTTP_RETRY_BACKOFF', 0.3))  # exponential backoff factor
+    EXCHANGE_API_HOSTS = {}  # exchange name -> equivalent API hosts, overrides the adapter's API_HOSTS
+
+    # Hedged ticker requests
+    HEDGE_ENABLED = os.getenv('HEDGE_ENABLED', 'false').lower() == 'true'
+    HEDGE_PERCENTILE = float(os.getenv('HEDGE_PERCENTILE', 95))  # latency percentile after which a duplicate is sent
+    HEDGE_MIN_DELAY = float(os.getenv('HEDGE_MIN_DELAY', 0.05))  # seconds, floor of the hedge delay
+
+    # Ticker parsing in a process pool (workers are spawned and re-import the entry script)
+    PARSE_POOL_ENABLED = os.getenv('PARSE_POOL_ENABLED', 'false').lower() == 'true'
+    PARSE_POOL_WORKERS = int(os.getenv('PARSE_POOL_WORKERS', 0))  # 0: one per CPU
+    PARSE_POOL_MIN_BYTES = int(os.getenv('PARSE_POOL_MIN_BYTES', 256 * 1024))  # smaller bodies are parsed inline
+    PARSE_POOL_TIMEOUT = float(os.getenv('PARSE_POOL_TIMEOUT', 30))  # seconds
+
+    # Client-side exchange rate budgets
+    RATE_BUDGET_SAFETY = float(os.getenv('RATE_BUDGET_SAFETY', 0.9))  # fraction of published limits we may spend
+
+    # Scheduled exchange health probes
+    HEALTH_PROBE_ENABLED = os.getenv('HEALTH_PROBE_ENABLED', 'true').lower() == 'true'
+    HEALTH_PROBE_INTERVAL = float(os.getenv('HEALTH_PROBE_INTERVAL', 60))  # seconds between probe rounds
+
+    # Targeted refreshes for max_age requests
+    FRESHNESS_DEFAULT_WAIT = float(os.getenv('FRESHNESS_DEFAULT_WAIT', 2.0))  # seconds awaited for stale data
+    FRESHNESS_MAX_WAIT = float(os.getenv('FRESHNESS_MAX_WAIT', 10.0))  # cap of the max_wait parameter
+
+    # Admission control for expensive routes
+    ADMISSION_ENABLED = os.getenv('ADMISSION_ENABLED', 'true').lower() == 'true'
+    ADMISSION_BUDGET = int(os.getenv('ADMISSION_BUDGET', 16))  # cost units of heavy requests in flight
+    ADMISSION_MAX_WAIT = float(os.getenv('ADMISSION_MAX_WAIT', 2.0))  # seconds queued before shedding
+    ADMISSION_RETRY_AFTER = int(os.getenv('ADMISSION_RETRY_AFTER', 2))  # Retry-After of 503 responses
+
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -88,6 +160,7 @@ class TestingConfig(Config):
     """Testing configuration"""
     DEBUG = True
     TESTING = True
+    HEALTH_PROBE_ENABLED = False
 
     # In-memory database for tests
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
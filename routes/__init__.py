@@ -3,4 +3,4 @@ Routes package initialization
 """
 
 # Routes will be imported in app.py as needed
-__all__ = ['arbitrage', 'tokens', 'networks']# Initialize the routes package
+__all__ = ['arbitrage', 'tokens', 'networks', 'batch', 'snapshot']# Initialize the routes package
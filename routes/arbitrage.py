@@ -2,12 +2,21 @@
 Arbitrage API routes
 """
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request, url_for
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 import logging
 
-from services import ArbitrageService, get_all_exchange_services
+from services import (
+    ArbitrageService,
+    get_all_exchange_services,
+    get_health_monitor,
+    get_refresh_job_manager,
+    get_sharded_engine,
+    get_snapshot_ingestor
+)
+from utils.admission import get_admission_controller
+from utils.helpers import get_projection_params, project_fields
 
 # Create blueprint
 arbitrage_bp = Blueprint('arbitrage', __name__)
@@ -43,13 +52,15 @@ def api_dashboard():
 def api_arbitrage():
     """
     API endpoint for arbitrage opportunities
-    Supports filtering by min_spread and exchange
+    Supports filtering by min_spread and exchange,
+    'fields' projection and format=raw for native numbers
     """
     try:
         # Get query parameters
         min_spread = request.args.get('min_spread', 0.1, type=float)
         exchange_filter = request.args.get('exchange', None)
         limit = request.args.get('limit', 50, type=int)
+        projection = get_projection_params(request.args)
 
         # Validate parameters
         if min_spread < 0 or min_spread > 100:
@@ -75,7 +86,9 @@ def api_arbitrage():
 
         # Format for React UI
         formatted_opportunities = arbitrage_service.format_opportunities_for_api(
-            limited_opportunities
+            limited_opportunities,
+            raw=projection['raw'],
+            fields=projection['fields']
         )
 
         return jsonify({
@@ -151,23 +164,30 @@ def api_arbitrage_stats():
 def api_exchanges():
     """
     Get list of available exchanges and their status
+    Reads cached data sizes and the latest scheduled health probes, never calls exchanges
     """
     try:
         exchange_services = get_all_exchange_services()
+        health_monitor = get_health_monitor()
         exchanges = []
 
         for name, service in exchange_services.items():
             try:
-                # Test if exchange is responsive
-                data = service.get_cached_trading_data()
-                symbol_count = len(data)
+                stats = service.get_cache_stats()
+                probe = health_monitor.get_status(name) or {}
+                symbol_count = stats['symbol_count']
                 status = 'active' if symbol_count > 0 else 'inactive'
 
                 exchanges.append({
                     'name': name,
                     'status': status,
                     'symbol_count': symbol_count,
-                    'last_updated': service._trading_cache_time if hasattr(service, '_trading_cache_time') else None
+                    'last_updated': stats['trading_updated'],
+                    'circuit': stats['circuit'],
+                    'stale': stats['stale'],
+                    'connected': probe.get('connected'),
+                    'latency_ms': probe.get('latency_ms'),
+                    'last_checked': probe.get('last_checked')
                 })
 
             except Exception as e:
@@ -196,15 +216,143 @@ def api_exchanges():
         }), 500
 
 
+@arbitrage_bp.route('/exchanges/health')
+def api_exchanges_health():
+    """
+    Get latest scheduled health probe results of all exchanges
+    """
+    try:
+        probes = get_health_monitor().get_all()
+        exchanges = [
+            probes.get(name, {'name': name, 'connected': None, 'last_checked': None})
+            for name in get_all_exchange_services()
+        ]
+
+        return jsonify({
+            'status': 'success',
+            'data': {
+                'exchanges': exchanges,
+                'total': len(exchanges),
+                'connected': len([ex for ex in exchanges if ex['connected']])
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"Exchanges health API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Failed to load exchange health'
+        }), 500
+
+
+@arbitrage_bp.route('/exchanges/rate-budget')
+def api_exchanges_rate_budget():
+    """
+    Get client-side rate budget of each exchange: available weight, deferred fetches
+    and seconds until the next trading data fetch may run
+    """
+    try:
+        exchanges = [
+            dict(service.get_rate_budget_status(), name=name, trading_refresh_in=round(service.get_refresh_delay(), 3))
+            for name, service in get_all_exchange_services().items()
+        ]
+
+        return jsonify({
+            'status': 'success',
+            'data': {
+                'exchanges': exchanges,
+                'total': len(exchanges)
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"Rate budget API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Failed to load rate budgets'
+        }), 500
+
+
+@arbitrage_bp.route('/exchanges/latency')
+def api_exchanges_latency():
+    """
+    Get ticker request latency percentiles, hedged request counters and
+    API hosts in routing order of each exchange
+    """
+    try:
+        exchanges = [
+            dict(service.get_latency_stats(), name=name, endpoints=service.get_endpoint_status())
+            for name, service in get_all_exchange_services().items()
+        ]
+
+        return jsonify({
+            'status': 'success',
+            'data': {
+                'exchanges': exchanges,
+                'total': len(exchanges),
+                'hedged': sum(ex['hedged'] for ex in exchanges),
+                'hedge_wins': sum(ex['hedge_wins'] for ex in exchanges)
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"Exchange latency API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Failed to load exchange latency'
+        }), 500
+
+
+@arbitrage_bp.route('/arbitrage/engine')
+def api_arbitrage_engine():
+    """
+    Get the arbitrage ranking mode and, when sharded, symbols per shard
+    """
+    try:
+        engine = get_sharded_engine()
+        return jsonify({
+            'status': 'success',
+            'data': dict(engine.get_status(), mode='sharded') if engine is not None else {'mode': 'local'}
+        })
+
+    except Exception as e:
+        logger.error(f"Arbitrage engine API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Failed to load arbitrage engine status'
+        }), 500
+
+
+@arbitrage_bp.route('/admission/stats')
+def api_admission_stats():
+    """
+    Get admission control budget usage and per-endpoint queue wait and shed counts
+    """
+    try:
+        return jsonify({
+            'status': 'success',
+            'data': get_admission_controller().get_stats()
+        })
+
+    except Exception as e:
+        logger.error(f"Admission stats API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Failed to load admission stats'
+        }), 500
+
+
 @arbitrage_bp.route('/tokens')
 def api_tokens():
     """
     Get tokens with arbitrage opportunities
+    Supports 'fields' projection of token rows
     """
     try:
         exchange_filter = request.args.get('exchange', None)
         sort_by = request.args.get('sort', 'spread')  # spread, volume, symbol
         order = request.args.get('order', 'desc')  # asc, desc
+        projection = get_projection_params(request.args)
 
         opportunities = arbitrage_service.find_arbitrage_opportunities(
             exchange_filter=exchange_filter
@@ -243,7 +391,7 @@ def api_tokens():
         return jsonify({
             'status': 'success',
             'data': {
-                'tokens': tokens_list,
+                'tokens': project_fields(tokens_list, projection['fields']),
                 'total': len(tokens_list),
                 'filters': {
                     'exchange': exchange_filter,
@@ -261,37 +409,38 @@ def api_tokens():
         }), 500
 
 
-@arbitrage_bp.route('/refresh')
+@arbitrage_bp.route('/refresh', methods=['GET', 'POST'])
 def api_refresh_cache():
     """
-    Force refresh of exchange data caches
+    Start a background refresh of exchange data caches
+    Returns 202 with the job ID; current data is served until new data arrives.
+    With shared snapshots, processes other than the ingestor forward the refresh to it
     """
     try:
-        exchange_services = get_all_exchange_services()
-
-        # Clear all caches
-        refreshed = []
-        errors = []
+        ingestor = get_snapshot_ingestor()
+        if ingestor is not None and not ingestor.is_leader:
+            ingestor.store.request_refresh()
+            return jsonify({
+                'status': 'success',
+                'data': {
+                    'job_id': None,
+                    'forwarded_to': 'ingestor'
+                }
+            }), 202
 
-        for name, service in exchange_services.items():
-            try:
-                service.clear_cache()
-                # Force refresh by requesting new data
-                service.get_cached_trading_data()
-                service.get_cached_networks_data()
-                refreshed.append(name)
-            except Exception as e:
-                logger.error(f"Failed to refresh {name}: {e}")
-                errors.append({'exchange': name, 'error': str(e)})
+        job = get_refresh_job_manager().submit(
+            current_app._get_current_object(),
+            get_all_exchange_services()
+        )
 
         return jsonify({
             'status': 'success',
             'data': {
-                'refreshed': refreshed,
-                'errors': errors,
-                'total_refreshed': len(refreshed)
+                'job_id': job['id'],
+                'status_url': url_for('arbitrage.api_refresh_status', job_id=job['id']),
+                'job': job
             }
-        })
+        }), 202
 
     except Exception as e:
         logger.error(f"Cache refresh API error: {e}")
@@ -301,6 +450,33 @@ def api_refresh_cache():
         }), 500
 
 
+@arbitrage_bp.route('/refresh/<job_id>')
+def api_refresh_status(job_id):
+    """
+    Get status of a refresh job with per-exchange timings and errors
+    """
+    try:
+        job = get_refresh_job_manager().get_job(job_id)
+
+        if job is None:
+            return jsonify({
+                'status': 'error',
+                'message': f'Refresh job "{job_id}" not found'
+            }), 404
+
+        return jsonify({
+            'status': 'success',
+            'data': job
+        })
+
+    except Exception as e:
+        logger.error(f"Refresh status API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Failed to load refresh job status'
+        }), 500
+
+
 # Legacy endpoints for backward compatibility
 @arbitrage_bp.route('/data')
 def legacy_api_data():
@@ -0,0 +1,153 @@
+"""
+Batch API routes
+Evaluates several read-only API queries against one pinned market snapshot.
+Data freshness applies to the whole batch (POST /batch?max_age=...), and
+admission control charges the summed cost of the sub-queries
+"""
+
+from flask import Blueprint, current_app, jsonify, request
+from werkzeug.exceptions import HTTPException
+from typing import Optional
+import logging
+
+from services import pin_market_snapshot
+
+# Create blueprint
+batch_bp = Blueprint('batch', __name__)
+logger = logging.getLogger(__name__)
+
+API_PREFIX = '/api/v1'
+
+# Maximum number of sub-queries in one batch request
+MAX_BATCH_QUERIES = 20
+
+# Read-only endpoints that may be used as sub-queries
+BATCH_ENDPOINTS = {
+    'arbitrage.api_dashboard',
+    'arbitrage.api_arbitrage',
+    'arbitrage.api_arbitrage_stats',
+    'arbitrage.api_exchanges',
+    'arbitrage.api_tokens',
+    'arbitrage.legacy_api_data',
+    'tokens.api_all_tokens',
+    'tokens.api_tokens_by_exchange',
+    'tokens.api_search_tokens',
+    'tokens.api_top_tokens',
+    'tokens.api_compare_token',
+    'tokens.api_compare_tokens_batch',
+    'networks.api_all_networks',
+    'networks.api_token_networks',
+    'networks.api_compare_network_fees',
+    'networks.api_cheapest_networks',
+    'networks.api_supported_networks',
+    'networks.api_networks_status',
+}
+
+
+# Query parameters that only apply to the batch request itself
+BATCH_LEVEL_PARAMS = ('max_age', 'max_wait')
+
+
+def _query_path(query: dict) -> str:
+    """Sub-query path under the API prefix"""
+    path = query.get('path', '')
+    if not path.startswith(API_PREFIX + '/'):
+        path = API_PREFIX + '/' + path.lstrip('/')
+    return path
+
+
+def get_query_endpoint(query) -> Optional[str]:
+    """Endpoint a sub-query is dispatched to, None if it is not a supported query"""
+    if not isinstance(query, dict) or not isinstance(query.get('path'), str):
+        return None
+    try:
+        endpoint, _ = current_app.url_map.bind('localhost').match(
+            _query_path(query).split('?', 1)[0], method='GET'
+        )
+    except HTTPException:
+        return None
+    return endpoint if endpoint in BATCH_ENDPOINTS else None
+
+
+def _run_query(query: dict) -> tuple:
+    """
+    Dispatch one sub-query to its view in the current app context
+    Request hooks do not run for sub-queries: they share the batch's
+    snapshot and admission budget
+
+    Returns:
+        Tuple of (HTTP status code, JSON body)
+    """
+    path = _query_path(query)
+
+    with current_app.test_request_context(path, method='GET', query_string=query.get('params') or None) as ctx:
+        sub_request = ctx.request
+        if sub_request.routing_exception is not None or sub_request.url_rule.endpoint not in BATCH_ENDPOINTS:
+            return 404, {'status': 'error', 'message': f'Unsupported query path "{query.get("path", "")}"'}
+
+        if any(param in sub_request.args for param in BATCH_LEVEL_PARAMS):
+            return 400, {
+                'status': 'error',
+                'message': 'max_age and max_wait apply to the whole batch, pass them to /batch'
+            }
+
+        view = current_app.view_functions[sub_request.url_rule.endpoint]
+        response = current_app.make_response(view(**sub_request.view_args))
+        return response.status_code, response.get_json()
+
+
+@batch_bp.route('/batch', methods=['POST'])
+def api_batch():
+    """
+    Evaluate several API queries against one market snapshot
+    Body: {"queries": [{"id": "arb", "path": "/arbitrage", "params": {"limit": 10}}, ...]}
+    Query: max_age, max_wait (freshness of the snapshot shared by all queries)
+    Intermediate results (opportunities, rankings, indexes) are shared between queries
+    """
+    try:
+        payload = request.get_json(silent=True)
+        queries = payload.get('queries') if isinstance(payload, dict) else None
+
+        if not isinstance(queries, list) or not queries:
+            return jsonify({
+                'status': 'error',
+                'message': 'queries must be a non-empty list'
+            }), 400
+
+        if len(queries) > MAX_BATCH_QUERIES:
+            return jsonify({
+                'status': 'error',
+                'message': f'At most {MAX_BATCH_QUERIES} queries per batch'
+            }), 400
+
+        if not all(isinstance(query, dict) and isinstance(query.get('path'), str) for query in queries):
+            return jsonify({
+                'status': 'error',
+                'message': 'Every query must have a "path"'
+            }), 400
+
+        results = []
+        with pin_market_snapshot() as snapshot:
+            for index, query in enumerate(queries):
+                status_code, body = _run_query(query)
+                results.append({
+                    'id': query.get('id', index),
+                    'path': query['path'],
+                    'status_code': status_code,
+                    'body': body
+                })
+
+        return jsonify({
+            'status': 'success',
+            'data': {
+                'results': results,
+                'snapshot_version': snapshot.version
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"Batch API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Failed to process batch request'
+        }), 500
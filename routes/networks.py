@@ -7,21 +7,53 @@ from flask import Blueprint, jsonify, request
 import logging
 from collections import defaultdict
 
-from services import get_all_exchange_services
+from services import get_all_exchange_services, get_network_index
 from services.exchanges.base import BaseExchangeService
+from utils.helpers import get_projection_params, project_fields, safe_float
 
 # Create blueprint
 networks_bp = Blueprint('networks', __name__)
 logger = logging.getLogger(__name__)
 
 
+def _network_entry(network: dict, raw: bool = False) -> dict:
+    """
+    Build API row for a single network entry
+    Fee and withdrawal limits stay as exchange strings unless raw numbers are requested
+    """
+    fee = network.get('fee', '0')
+    min_withdraw = network.get('min_withdraw', '0')
+    max_withdraw = network.get('max_withdraw', '0')
+
+    if raw:
+        fee, min_withdraw, max_withdraw = safe_float(fee), safe_float(min_withdraw), safe_float(max_withdraw)
+
+    return {
+        'network': network.get('name', ''),
+        'deposit': network.get('deposit', False),
+        'withdraw': network.get('withdraw', False),
+        'fee': fee,
+        'min_withdraw': min_withdraw,
+        'max_withdraw': max_withdraw,
+        'confirm_times': network.get('confirm_times', 0)
+    }
+
+
+def _withdraw_limit(network: dict, raw: bool = False):
+    """Minimum withdrawal amount as exchange string, or float in raw mode"""
+    min_withdraw = network.get('min_withdraw', '0')
+    return safe_float(min_withdraw) if raw else min_withdraw
+
+
 @networks_bp.route('/networks')
 def api_all_networks():
     """
     Get all networks data from all exchanges
     Returns comprehensive network information
+    Supports 'fields' projection and format=raw for numeric fees
     """
     try:
+        projection = get_projection_params(request.args)
         exchange_services = get_all_exchange_services()
         networks_data = []
 
@@ -34,13 +66,7 @@ def api_all_networks():
                         networks_data.append({
                             'token': token,
                             'exchange': exchange_name,
-                            'network': network.get('name', ''),
-                            'deposit': network.get('deposit', False),
-                            'withdraw': network.get('withdraw', False),
-                            'fee': network.get('fee', '0'),
-                            'min_withdraw': network.get('min_withdraw', '0'),
-                            'max_withdraw': network.get('max_withdraw', '0'),
-                            'confirm_times': network.get('confirm_times', 0)
+                            **_network_entry(network, projection['raw'])
                         })
 
             except Exception as e:
@@ -50,7 +76,7 @@ def api_all_networks():
         return jsonify({
             'status': 'success',
             'data': {
-                'networks': networks_data,
+                'networks': project_fields(networks_data, projection['fields']),
                 'total': len(networks_data),
                 'unique_tokens': len(set(n['token'] for n in networks_data)),
                 'unique_networks': len(set(n['network'] for n in networks_data))
@@ -69,9 +95,11 @@ def api_all_networks():
 def api_token_networks(token):
     """
     Get network information for specific token
+    Supports 'fields' projection and format=raw for numeric fees
     """
     try:
         token = token.upper()
+        projection = get_projection_params(request.args)
         exchange_services = get_all_exchange_services()
         token_networks = []
 
@@ -83,13 +111,7 @@ def api_token_networks(token):
                     for network in exchange_networks[token]:
                         token_networks.append({
                             'exchange': exchange_name,
-                            'network': network.get('name', ''),
-                            'deposit': network.get('deposit', False),
-                            'withdraw': network.get('withdraw', False),
-                            'fee': network.get('fee', '0'),
-                            'min_withdraw': network.get('min_withdraw', '0'),
-                            'max_withdraw': network.get('max_withdraw', '0'),
-                            'confirm_times': network.get('confirm_times', 0)
+                            **_network_entry(network, projection['raw'])
                         })
 
             except Exception as e:
@@ -107,6 +129,12 @@ def api_token_networks(token):
         for network in token_networks:
             grouped_networks[network['network']].append(network)
 
+        if projection['fields']:
+            grouped_networks = {
+                name: project_fields(entries, projection['fields'])
+                for name, entries in grouped_networks.items()
+            }
+
         return jsonify({
             'status': 'success',
             'data': {
@@ -130,52 +158,32 @@ def api_token_networks(token):
 def api_compare_network_fees(token):
     """
     Compare withdrawal fees for a token across all exchanges and networks
+    Served from the materialized fee index, optionally filtered by network
     """
     try:
         token = token.upper()
-        exchange_services = get_all_exchange_services()
-        fee_comparison = []
-
-        for exchange_name, service in exchange_services.items():
-            try:
-                exchange_networks = service.get_cached_networks_data()
-
-                if token in exchange_networks:
-                    for network in exchange_networks[token]:
-                        if network.get('withdraw', False):
-                            try:
-                                fee = float(network.get('fee', 0))
-                                fee_comparison.append({
-                                    'exchange': exchange_name,
-                                    'network': network.get('name', ''),
-                                    'fee': fee,
-                                    'fee_str': network.get('fee', '0'),
-                                    'min_withdraw': network.get('min_withdraw', '0'),
-                                    'confirm_times': network.get('confirm_times', 0)
-                                })
-                            except ValueError:
-                                # Handle non-numeric fees
-                                fee_comparison.append({
-                                    'exchange': exchange_name,
-                                    'network': network.get('name', ''),
-                                    'fee': 0,
-                                    'fee_str': network.get('fee', '0'),
-                                    'min_withdraw': network.get('min_withdraw', '0'),
-                                    'confirm_times': network.get('confirm_times', 0)
-                                })
+        network_filter = request.args.get('network', None)
+        projection = get_projection_params(request.args)
 
-            except Exception as e:
-                logger.warning(f"Error comparing fees for {token} from {exchange_name}: {e}")
-                continue
+        options = get_network_index().get_token_options(token, network_filter)
 
-        if not fee_comparison:
+        if not options:
             return jsonify({
                 'status': 'error',
                 'message': f'No withdrawal data found for token "{token}"'
             }), 404
 
-        # Sort by fee (lowest first)
-        fee_comparison.sort(key=lambda x: x['fee'])
+        fee_comparison = [
+            {
+                'exchange': option['exchange'],
+                'network': option['network'],
+                'fee': option['fee'] if option['fee'] is not None else 0,
+                'fee_str': option['fee_str'],
+                'min_withdraw': _withdraw_limit(option, projection['raw']),
+                'confirm_times': option['confirm_times']
+            }
+            for option in options
+        ]
 
         # Calculate statistics
         fees = [f['fee'] for f in fee_comparison if f['fee'] > 0]
@@ -193,7 +201,7 @@ def api_compare_network_fees(token):
             'status': 'success',
             'data': {
                 'token': token,
-                'fee_comparison': fee_comparison,
+                'fee_comparison': project_fields(fee_comparison, projection['fields']),
                 'statistics': stats,
                 'total_options': len(fee_comparison)
             }
@@ -211,69 +219,26 @@ def api_compare_network_fees(token):
 def api_cheapest_networks():
     """
     Get cheapest withdrawal options for all tokens
+    Served as a slice of the materialized fee index
     """
     try:
         limit = request.args.get('limit', 50, type=int)
         network_filter = request.args.get('network', None)
+        projection = get_projection_params(request.args)
 
-        exchange_services = get_all_exchange_services()
-        cheapest_options = []
-
-        # Collect all tokens
-        all_tokens = set()
-        for service in exchange_services.values():
-            try:
-                networks_data = service.get_cached_networks_data()
-                all_tokens.update(networks_data.keys())
-            except Exception as e:
-                logger.warning(f"Error collecting tokens: {e}")
-                continue
-
-        # Find cheapest option for each token
-        for token in all_tokens:
-            token_options = []
-
-            for exchange_name, service in exchange_services.items():
-                try:
-                    exchange_networks = service.get_cached_networks_data()
-
-                    if token in exchange_networks:
-                        for network in exchange_networks[token]:
-                            if network.get('withdraw', False):
-                                # Apply network filter
-                                if network_filter and network_filter.lower() not in network.get('name', '').lower():
-                                    continue
-
-                                try:
-                                    fee = float(network.get('fee', 0))
-                                    token_options.append({
-                                        'token': token,
-                                        'exchange': exchange_name,
-                                        'network': network.get('name', ''),
-                                        'fee': fee,
-                                        'fee_str': network.get('fee', '0'),
-                                        'min_withdraw': network.get('min_withdraw', '0')
-                                    })
-                                except ValueError:
-                                    continue
-
-                except Exception as e:
-                    logger.warning(f"Error processing {token} from {exchange_name}: {e}")
-                    continue
-
-            # Find cheapest option for this token
-            if token_options:
-                cheapest = min(token_options, key=lambda x: x['fee'])
-                cheapest_options.append(cheapest)
-
-        # Sort by fee and apply limit
-        cheapest_options.sort(key=lambda x: x['fee'])
+        cheapest_options = get_network_index().get_cheapest_options(network_filter)
         limited_options = cheapest_options[:limit]
 
+        if projection['raw']:
+            limited_options = [
+                {**option, 'min_withdraw': _withdraw_limit(option, True)}
+                for option in limited_options
+            ]
+
         return jsonify({
             'status': 'success',
             'data': {
-                'cheapest_options': limited_options,
+                'cheapest_options': project_fields(limited_options, projection['fields']),
                 'total_analyzed': len(cheapest_options),
                 'returned': len(limited_options),
                 'filters': {
@@ -295,45 +260,10 @@ def api_cheapest_networks():
 def api_supported_networks():
     """
     Get list of all supported networks across exchanges
+    Served from the incrementally maintained network aggregates
     """
     try:
-        exchange_services = get_all_exchange_services()
-        network_stats = defaultdict(lambda: {
-            'exchanges': [],
-            'tokens': set(),
-            'total_pairs': 0
-        })
-
-        for exchange_name, service in exchange_services.items():
-            try:
-                exchange_networks = service.get_cached_networks_data()
-
-                for token, networks in exchange_networks.items():
-                    for network in networks:
-                        network_name = network.get('name', '')
-                        if network_name:
-                            network_stats[network_name]['exchanges'].append(exchange_name)
-                            network_stats[network_name]['tokens'].add(token)
-                            network_stats[network_name]['total_pairs'] += 1
-
-            except Exception as e:
-                logger.warning(f"Error processing networks from {exchange_name}: {e}")
-                continue
-
-        # Format results
-        formatted_networks = []
-        for network_name, stats in network_stats.items():
-            formatted_networks.append({
-                'network': network_name,
-                'supported_exchanges': list(set(stats['exchanges'])),
-                'exchange_count': len(set(stats['exchanges'])),
-                'supported_tokens': list(stats['tokens']),
-                'token_count': len(stats['tokens']),
-                'total_pairs': stats['total_pairs']
-            })
-
-        # Sort by popularity (exchange count)
-        formatted_networks.sort(key=lambda x: x['exchange_count'], reverse=True)
+        formatted_networks = get_network_index().get_supported_networks()
 
         return jsonify({
             'status': 'success',
@@ -356,72 +286,12 @@ def api_supported_networks():
 def api_networks_status():
     """
     Get network status summary across all exchanges
+    Served from the incrementally maintained network aggregates
     """
     try:
-        exchange_services = get_all_exchange_services()
-        status_summary = {
-            'exchanges': {},
-            'totals': {
-                'total_tokens': 0,
-                'total_networks': 0,
-                'deposit_enabled': 0,
-                'withdraw_enabled': 0
-            }
-        }
-
-        all_tokens = set()
-        all_networks = set()
-
-        for exchange_name, service in exchange_services.items():
-            try:
-                exchange_networks = service.get_cached_networks_data()
-
-                exchange_stats = {
-                    'tokens': len(exchange_networks),
-                    'total_networks': 0,
-                    'deposit_enabled': 0,
-                    'withdraw_enabled': 0,
-                    'last_updated': getattr(service, '_networks_cache_time', None)
-                }
-
-                for token, networks in exchange_networks.items():
-                    all_tokens.add(token)
-
-                    for network in networks:
-                        network_name = network.get('name', '')
-                        if network_name:
-                            all_networks.add(network_name)
-                            exchange_stats['total_networks'] += 1
-
-                            if network.get('deposit', False):
-                                exchange_stats['deposit_enabled'] += 1
-
-                            if network.get('withdraw', False):
-                                exchange_stats['withdraw_enabled'] += 1
-
-                status_summary['exchanges'][exchange_name] = exchange_stats
-
-            except Exception as e:
-                logger.warning(f"Error getting status for {exchange_name}: {e}")
-                status_summary['exchanges'][exchange_name] = {
-                    'tokens': 0,
-                    'total_networks': 0,
-                    'deposit_enabled': 0,
-                    'withdraw_enabled': 0,
-                    'error': str(e)
-                }
-
-        # Calculate totals
-        status_summary['totals'] = {
-            'unique_tokens': len(all_tokens),
-            'unique_networks': len(all_networks),
-            'total_exchanges': len(exchange_services),
-            'active_exchanges': len([ex for ex in status_summary['exchanges'].values() if ex.get('tokens', 0) > 0])
-        }
-
         return jsonify({
             'status': 'success',
-            'data': status_summary
+            'data': get_network_index().get_status_summary()
         })
 
     except Exception as e:
@@ -429,4 +299,4 @@ def api_networks_status():
         return jsonify({
             'status': 'error',
             'message': 'Failed to get networks status'
-        }), 500
\ No newline at end of file
+        }), 500
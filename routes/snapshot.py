@@ -0,0 +1,166 @@
+"""
+Market snapshot API routes
+Under ASGI (asgi.py) /snapshot/poll and /snapshot/stream are served by native async handlers
+"""
+
+from flask import Blueprint, current_app, jsonify, request
+import logging
+import math
+
+from services import get_market_snapshot, get_snapshot_distribution, get_snapshot_ingestor
+from services.snapshot import snapshot_manager
+from services.snapshot_export import EXPORT_MIMETYPES, export_snapshot
+
+# Create blueprint
+snapshot_bp = Blueprint('snapshot', __name__)
+logger = logging.getLogger(__name__)
+
+
+def get_long_poll_params(args, max_timeout: float) -> tuple:
+    """
+    Parse since/timeout long-poll parameters
+
+    Returns:
+        Tuple of (since version, timeout in seconds clamped to [0, max_timeout])
+
+    Raises:
+        ValueError: If a parameter is not a finite number
+    """
+    since = int(args.get('since', 0))
+    timeout = float(args.get('timeout', max_timeout))
+    # NaN survives min/max and would never let the wait time out
+    if not math.isfinite(timeout):
+        raise ValueError('timeout must be a finite number')
+    return since, min(max(timeout, 0.0), max_timeout)
+
+
+@snapshot_bp.route('/snapshot')
+def api_snapshot():
+    """
+    Get current market snapshot version and per-exchange symbol counts
+    """
+    try:
+        return jsonify({
+            'status': 'success',
+            'data': get_market_snapshot().summary()
+        })
+
+    except Exception as e:
+        logger.error(f"Snapshot API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Failed to load market snapshot'
+        }), 500
+
+
+@snapshot_bp.route('/snapshot/poll')
+def api_snapshot_poll():
+    """
+    Long-poll for a snapshot newer than 'since'
+    Returns the current snapshot with changed=false when 'timeout' seconds pass first
+    """
+    try:
+        try:
+            since, timeout = get_long_poll_params(request.args, current_app.config.get('LONG_POLL_TIMEOUT', 30))
+        except ValueError:
+            return jsonify({
+                'status': 'error',
+                'message': 'since and timeout must be finite numbers'
+            }), 400
+
+        snapshot = snapshot_manager.wait_for_update(
+            since,
+            timeout,
+            interval=current_app.config.get('SNAPSHOT_POLL_INTERVAL', 1.0)
+        )
+
+        return jsonify({
+            'status': 'success',
+            'data': dict(snapshot.summary(), changed=snapshot.version > since)
+        })
+
+    except Exception as e:
+        logger.error(f"Snapshot poll API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Failed to poll market snapshot'
+        }), 500
+
+
+@snapshot_bp.route('/snapshot/export')
+def api_snapshot_export():
+    """
+    Export the market snapshot as columnar binary data
+    Query: format=arrow|msgpack, dataset=quotes|opportunities
+    Encoded once per snapshot version; ETag lets clients skip unchanged snapshots
+    """
+    try:
+        fmt = request.args.get('format', 'arrow').lower()
+        dataset = request.args.get('dataset', 'quotes').lower()
+        snapshot = get_market_snapshot()
+
+        etag = f"v{snapshot.version}-{int(snapshot.created_at * 1000)}-{dataset}-{fmt}"
+        if etag in request.if_none_match:
+            response = current_app.response_class(status=304)
+            response.set_etag(etag)
+            return response
+
+        try:
+            payload = export_snapshot(snapshot, fmt, dataset)
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
+
+        response = current_app.response_class(payload, mimetype=EXPORT_MIMETYPES[fmt])
+        response.set_etag(etag)
+        response.headers['X-Snapshot-Version'] = str(snapshot.version)
+        return response
+
+    except Exception as e:
+        logger.error(f"Snapshot export API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Failed to export market snapshot'
+        }), 500
+
+
+@snapshot_bp.route('/snapshot/ingestor')
+def api_snapshot_ingestor():
+    """
+    Get this server process's role in shared snapshot mode (ingestor or reader)
+    """
+    try:
+        ingestor = get_snapshot_ingestor()
+        return jsonify({
+            'status': 'success',
+            'data': dict(ingestor.get_status(), enabled=True) if ingestor is not None else {'enabled': False}
+        })
+
+    except Exception as e:
+        logger.error(f"Snapshot ingestor API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Failed to get snapshot ingestor status'
+        }), 500
+
+
+@snapshot_bp.route('/snapshot/distribution')
+def api_snapshot_distribution():
+    """
+    Get this process's snapshot subscriber and publisher status in distributed mode
+    """
+    try:
+        status = get_snapshot_distribution()
+        return jsonify({
+            'status': 'success',
+            'data': dict(status, enabled=bool(status))
+        })
+
+    except Exception as e:
+        logger.error(f"Snapshot distribution API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Failed to get snapshot distribution status'
+        }), 500
@@ -5,7 +5,8 @@ Tokens API routes
 from flask import Blueprint, jsonify, request
 import logging
 
-from services import get_all_exchange_services
+from services import get_all_exchange_services, get_market_snapshot
+from utils.helpers import get_projection_params, project_fields
 
 # Create blueprint
 tokens_bp = Blueprint('tokens', __name__)
@@ -19,19 +20,22 @@ def api_all_tokens():
     Returns formatted data for each exchange
     """
     try:
+        projection = get_projection_params(request.args)
         exchange_services = get_all_exchange_services()
+        snapshot = get_market_snapshot()
         exchanges_data = {}
 
         for exchange_name, service in exchange_services.items():
             try:
                 # Get trading and networks data
-                trading_data = service.get_cached_trading_data()
-                formatted_tokens = service.format_token_data(trading_data)
+                trading_data = snapshot.trading_data.get(exchange_name)
+                # Formatting no data would replace the exchange's cached table
+                formatted_tokens = service.format_token_data(trading_data) if trading_data else []
 
                 exchanges_data[exchange_name.lower()] = {
                     'name': exchange_name,
                     'status': 'active' if formatted_tokens else 'inactive',
-                    'tokens': formatted_tokens,
+                    'tokens': project_fields(formatted_tokens, projection['fields']),
                     'count': len(formatted_tokens)
                 }
 
@@ -67,6 +71,7 @@ def api_tokens_by_exchange(exchange_id):
     Get tokens data for specific exchange
     """
     try:
+        projection = get_projection_params(request.args)
         exchange_services = get_all_exchange_services()
 
         # Find exchange by ID (case insensitive)
@@ -86,7 +91,7 @@ def api_tokens_by_exchange(exchange_id):
             }), 404
 
         # Get trading data
-        trading_data = exchange_service.get_cached_trading_data()
+        trading_data = get_market_snapshot().trading_data.get(exchange_name)
 
         if not trading_data:
             return jsonify({
@@ -101,7 +106,7 @@ def api_tokens_by_exchange(exchange_id):
             'status': 'success',
             'data': {
                 'exchange': exchange_name,
-                'tokens': formatted_tokens,
+                'tokens': project_fields(formatted_tokens, projection['fields']),
                 'count': len(formatted_tokens),
                 'last_updated': getattr(exchange_service, '_trading_cache_time', None)
             }
@@ -119,6 +124,7 @@ def api_tokens_by_exchange(exchange_id):
 def api_search_tokens():
     """
     Search tokens across all exchanges
+    Served from the snapshot's inverted symbol index
     """
     try:
         query = request.args.get('q', '').strip().upper()
@@ -126,6 +132,8 @@ def api_search_tokens():
         min_volume = request.args.get('min_volume', 0, type=float)
         sort_by = request.args.get('sort', 'volume')  # volume, symbol, spread
         limit = request.args.get('limit', 100, type=int)
+        match = request.args.get('match', 'substring')  # substring, prefix
+        projection = get_projection_params(request.args)
 
         if not query:
             return jsonify({
@@ -133,69 +141,28 @@ def api_search_tokens():
                 'message': 'Search query parameter "q" is required'
             }), 400
 
-        exchange_services = get_all_exchange_services()
-        found_tokens = []
-
-        for exchange_name, service in exchange_services.items():
-            # Apply exchange filter
-            if exchange_filter and exchange_filter.lower() != exchange_name.lower():
-                continue
-
-            try:
-                trading_data = service.get_cached_trading_data()
-
-                for symbol, data in trading_data.items():
-                    # Search in symbol name
-                    if query in symbol:
-                        volume = data.get('volume', 0)
-
-                        # Apply volume filter
-                        if volume < min_volume:
-                            continue
-
-                        # Calculate spread
-                        spread = 0
-                        if data.get('ask', 0) > 0:
-                            spread = ((data.get('bid', 0) - data['ask']) / data['ask']) * 100
-
-                        found_tokens.append({
-                            'symbol': symbol,
-                            'exchange': exchange_name,
-                            'bid': data.get('bid', 0),
-                            'ask': data.get('ask', 0),
-                            'last': data.get('last', 0),
-                            'volume': volume,
-                            'spread': spread,
-                            'price_change': data.get('priceChangePercent', 0)
-                        })
-
-            except Exception as e:
-                logger.warning(f"Error searching in {exchange_name}: {e}")
-                continue
-
-        # Sort results
-        if sort_by == 'volume':
-            found_tokens.sort(key=lambda x: x['volume'], reverse=True)
-        elif sort_by == 'symbol':
-            found_tokens.sort(key=lambda x: x['symbol'])
-        elif sort_by == 'spread':
-            found_tokens.sort(key=lambda x: x['spread'], reverse=True)
-
-        # Apply limit
-        limited_tokens = found_tokens[:limit]
+        limited_tokens, total_found = get_market_snapshot().search_index.search(
+            query,
+            exchange=exchange_filter,
+            min_volume=min_volume,
+            sort_by=sort_by,
+            limit=limit,
+            match=match
+        )
 
         return jsonify({
             'status': 'success',
             'data': {
-                'tokens': limited_tokens,
-                'total_found': len(found_tokens),
+                'tokens': project_fields(limited_tokens, projection['fields']),
+                'total_found': total_found,
                 'returned': len(limited_tokens),
                 'query': query,
                 'filters': {
                     'exchange': exchange_filter,
                     'min_volume': min_volume,
                     'sort': sort_by,
-                    'limit': limit
+                    'limit': limit,
+                    'match': match
                 }
             }
         })
@@ -212,64 +179,26 @@ def api_search_tokens():
 def api_top_tokens():
     """
     Get top tokens by various metrics
+    Served as a slice of the snapshot's precomputed rankings
     """
     try:
         metric = request.args.get('metric', 'volume')  # volume, price_change, spread
         limit = request.args.get('limit', 20, type=int)
         exchange_filter = request.args.get('exchange', None)
+        projection = get_projection_params(request.args)
 
-        exchange_services = get_all_exchange_services()
-        all_tokens = []
-
-        for exchange_name, service in exchange_services.items():
-            # Apply exchange filter
-            if exchange_filter and exchange_filter.lower() != exchange_name.lower():
-                continue
-
-            try:
-                trading_data = service.get_cached_trading_data()
-
-                for symbol, data in trading_data.items():
-                    volume = data.get('volume', 0)
-                    price_change = data.get('priceChangePercent', 0)
-
-                    # Calculate spread
-                    spread = 0
-                    if data.get('ask', 0) > 0:
-                        spread = ((data.get('bid', 0) - data['ask']) / data['ask']) * 100
-
-                    all_tokens.append({
-                        'symbol': symbol,
-                        'exchange': exchange_name,
-                        'volume': volume,
-                        'price_change': price_change,
-                        'spread': spread,
-                        'bid': data.get('bid', 0),
-                        'ask': data.get('ask', 0),
-                        'last': data.get('last', 0)
-                    })
-
-            except Exception as e:
-                logger.warning(f"Error processing {exchange_name}: {e}")
-                continue
-
-        # Sort by metric
-        if metric == 'volume':
-            all_tokens.sort(key=lambda x: x['volume'], reverse=True)
-        elif metric == 'price_change':
-            all_tokens.sort(key=lambda x: abs(x['price_change']), reverse=True)
-        elif metric == 'spread':
-            all_tokens.sort(key=lambda x: abs(x['spread']), reverse=True)
-
-        # Apply limit
-        top_tokens = all_tokens[:limit]
+        top_tokens, total_analyzed = get_market_snapshot().rankings.top(
+            metric,
+            limit=limit,
+            exchange=exchange_filter
+        )
 
         return jsonify({
             'status': 'success',
             'data': {
-                'tokens': top_tokens,
+                'tokens': project_fields(top_tokens, projection['fields']),
                 'metric': metric,
-                'total_analyzed': len(all_tokens),
+                'total_analyzed': total_analyzed,
                 'returned': len(top_tokens),
                 'filters': {
                     'exchange': exchange_filter,
@@ -286,87 +215,127 @@ def api_top_tokens():
         }), 500
 
 
+# Maximum number of symbols accepted by the batch compare endpoint
+MAX_COMPARE_SYMBOLS = 100
+
+
+def _compare_symbol(snapshot, symbol: str, fields=None) -> dict:
+    """
+    Build price comparison for one symbol from the snapshot's quote index
+    """
+    quotes = snapshot.quote_index.lookup(symbol)
+    comparisons = []
+
+    for exchange_name in snapshot.trading_data:
+        token_data = quotes.get(exchange_name)
+
+        if token_data:
+            bid = token_data.get('bid', 0)
+            ask = token_data.get('ask', 0)
+            spread = ((bid - ask) / ask * 100) if ask > 0 else 0
+
+            comparisons.append({
+                'exchange': exchange_name,
+                'symbol': token_data.get('symbol', symbol),
+                'bid': bid,
+                'ask': ask,
+                'last': token_data.get('last', 0),
+                'volume': token_data.get('volume', 0),
+                'spread': spread,
+                'available': True
+            })
+        else:
+            comparisons.append({
+                'exchange': exchange_name,
+                'symbol': symbol,
+                'available': False
+            })
+
+    # Calculate statistics
+    available_prices = [c for c in comparisons if c.get('available')]
+
+    stats = {}
+    if available_prices:
+        asks = [c['ask'] for c in available_prices if c['ask'] > 0]
+        bids = [c['bid'] for c in available_prices if c['bid'] > 0]
+
+        if asks and bids:
+            stats = {
+                'highest_bid': max(bids),
+                'lowest_ask': min(asks),
+                'price_spread': ((max(bids) - min(asks)) / min(asks) * 100) if min(asks) > 0 else 0,
+                'available_exchanges': len(available_prices),
+                'total_exchanges': len(comparisons)
+            }
+
+    return {
+        'symbol': symbol,
+        'comparisons': project_fields(comparisons, fields),
+        'statistics': stats
+    }
+
+
 @tokens_bp.route('/tokens/compare/<symbol>')
 def api_compare_token(symbol):
     """
     Compare token prices across all exchanges
     """
     try:
-        symbol = symbol.upper()
-        exchange_services = get_all_exchange_services()
-        comparisons = []
+        projection = get_projection_params(request.args)
 
-        for exchange_name, service in exchange_services.items():
-            try:
-                trading_data = service.get_cached_trading_data()
-
-                # Look for exact match or normalized symbol
-                token_data = None
-                for s, data in trading_data.items():
-                    if s == symbol or service.normalize_symbol(s) == service.normalize_symbol(symbol):
-                        token_data = data
-                        break
-
-                if token_data:
-                    bid = token_data.get('bid', 0)
-                    ask = token_data.get('ask', 0)
-                    spread = ((bid - ask) / ask * 100) if ask > 0 else 0
-
-                    comparisons.append({
-                        'exchange': exchange_name,
-                        'symbol': token_data.get('symbol', symbol),
-                        'bid': bid,
-                        'ask': ask,
-                        'last': token_data.get('last', 0),
-                        'volume': token_data.get('volume', 0),
-                        'spread': spread,
-                        'available': True
-                    })
-                else:
-                    comparisons.append({
-                        'exchange': exchange_name,
-                        'symbol': symbol,
-                        'available': False
-                    })
+        return jsonify({
+            'status': 'success',
+            'data': _compare_symbol(get_market_snapshot(), symbol.upper(), projection['fields'])
+        })
 
-            except Exception as e:
-                logger.warning(f"Error comparing token on {exchange_name}: {e}")
-                comparisons.append({
-                    'exchange': exchange_name,
-                    'symbol': symbol,
-                    'available': False,
-                    'error': str(e)
-                })
-
-        # Calculate statistics
-        available_prices = [c for c in comparisons if c.get('available')]
-
-        stats = {}
-        if available_prices:
-            asks = [c['ask'] for c in available_prices if c['ask'] > 0]
-            bids = [c['bid'] for c in available_prices if c['bid'] > 0]
-
-            if asks and bids:
-                stats = {
-                    'highest_bid': max(bids),
-                    'lowest_ask': min(asks),
-                    'price_spread': ((max(bids) - min(asks)) / min(asks) * 100) if min(asks) > 0 else 0,
-                    'available_exchanges': len(available_prices),
-                    'total_exchanges': len(comparisons)
-                }
+    except Exception as e:
+        logger.error(f"Token comparison API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Failed to compare token'
+        }), 500
+
+
+@tokens_bp.route('/tokens/compare')
+def api_compare_tokens_batch():
+    """
+    Compare several tokens in one request (?symbols=BTCUSDT,ETHUSDT)
+    All symbols are answered from the same market snapshot
+    """
+    try:
+        symbols = [s.strip().upper() for s in request.args.get('symbols', '').split(',') if s.strip()]
+        projection = get_projection_params(request.args)
+
+        if not symbols:
+            return jsonify({
+                'status': 'error',
+                'message': 'Query parameter "symbols" is required'
+            }), 400
+
+        if len(symbols) > MAX_COMPARE_SYMBOLS:
+            return jsonify({
+                'status': 'error',
+                'message': f'At most {MAX_COMPARE_SYMBOLS} symbols can be compared at once'
+            }), 400
+
+        snapshot = get_market_snapshot()
+        results = {
+            symbol: _compare_symbol(snapshot, symbol, projection['fields'])
+            for symbol in dict.fromkeys(symbols)
+        }
 
         return jsonify({
             'status': 'success',
             'data': {
-                'symbol': symbol,
-                'comparisons': comparisons,
-                'statistics': stats
+                'symbols': list(results),
+                'results': results,
+                'snapshot_version': snapshot.version
             }
         })
 
     except Exception as e:
-        logger.error(f"Token comparison API error: {e}")
+        logger.error(f"Batch token comparison API error: {e}")
         return jsonify({
             'status': 'error',
-            'message': 'Failed to compare token'
-        }), 500
\ No newline at end of file
+            'message': 'Failed to compare tokens'
+        }), 500
@@ -0,0 +1,132 @@
+"""
+Benchmark per-call requests.get against pooled keep-alive sessions
+
+Starts a local HTTPS stand-in of an exchange ticker endpoint (self-signed
+certificate made with the openssl CLI) and times --rounds sequential
+fetches with a fresh connection per call (module-level requests.get) and
+with the pooled session every exchange adapter uses. --rtt adds simulated
+network round trips: two per new connection (TCP + TLS 1.3 handshake) and
+one per request.
+
+Usage:
+    python scripts/benchmark_http_sessions.py [--rounds 50] [--tickers 2000] [--rtt 20]
+"""
+import argparse
+import json
+import os
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.exchanges.http import create_session  # noqa: E402
+
+
+def make_certificate(directory: str) -> tuple:
+    """Create a self-signed localhost certificate, returns (cert, key) paths"""
+    cert = os.path.join(directory, 'cert.pem')
+    key = os.path.join(directory, 'key.pem')
+    subprocess.run(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+         '-subj', '/CN=localhost', '-addext', 'subjectAltName=DNS:localhost,IP:127.0.0.1',
+         '-keyout', key, '-out', cert],
+        check=True, capture_output=True
+    )
+    return cert, key
+
+
+def start_server(cert: str, key: str, tickers: int, rtt: float):
+    """Start the HTTPS stand-in on a free port, returns (server, connection counter)"""
+    body = json.dumps([
+        {'symbol': f"TKN{i}USDT", 'bidPrice': '1.0', 'askPrice': '1.01', 'lastPrice': '1.0', 'volume': '1000'}
+        for i in range(tickers)
+    ]).encode()
+    connections = {'count': 0}
+    lock = threading.Lock()
+
+    class TickerHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def setup(self):
+            super().setup()
+            with lock:
+                connections['count'] += 1
+            time.sleep(2 * rtt)
+
+        def do_GET(self):
+            time.sleep(rtt)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), TickerHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, connections
+
+
+def run(name: str, get, url: str, cert: str, rounds: int, connections: dict) -> dict:
+    """Time sequential fetches, returns latency stats and connections opened"""
+    get(url, verify=cert, timeout=10).json()  # warm up
+    opened = connections['count']
+    latencies = []
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+        response = get(url, verify=cert, timeout=10)
+        response.json()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    return {
+        'name': name,
+        'mean_ms': statistics.mean(latencies),
+        'p50_ms': latencies[len(latencies) // 2],
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1],
+        'connections': connections['count'] - opened
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=50)
+    parser.add_argument('--tickers', type=int, default=2000)
+    parser.add_argument('--rtt', type=float, default=20, help='simulated round trip in ms')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(directory)
+        server, connections = start_server(cert, key, args.tickers, args.rtt / 1000)
+        url = f"https://localhost:{server.server_address[1]}/api/v3/ticker/24hr"
+
+        session = create_session()
+        results = [
+            run('requests.get (new connection per call)', requests.get, url, cert, args.rounds, connections),
+            run('pooled session (keep-alive)', session.get, url, cert, args.rounds, connections)
+        ]
+        server.shutdown()
+
+    print(f"{args.rounds} sequential fetches of {args.tickers} tickers, simulated RTT {args.rtt:g} ms")
+    print(f"{'client':<40} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'conns':>6}")
+    for result in results:
+        print(f"{result['name']:<40} {result['mean_ms']:>9.1f} {result['p50_ms']:>9.1f} "
+              f"{result['p95_ms']:>9.1f} {result['connections']:>6}")
+
+
+if __name__ == '__main__':
+    main()
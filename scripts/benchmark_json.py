@@ -0,0 +1,108 @@
+"""
+Benchmark JSON providers on a realistic /api/v1/tokens payload
+
+Usage:
+    python scripts/benchmark_json.py [--exchanges 7] [--tokens 1500] [--rounds 20]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.json_provider import OrjsonJSONProvider, ORJSON_AVAILABLE  # noqa: E402
+
+
+EXCHANGES = ['Binance', 'Bybit', 'KuCoin', 'Gate.io', 'Huobi', 'MEXC', 'Bitget']
+NETWORKS = ['ERC20', 'TRC20', 'BEP20', 'SOL', 'ARBITRUM', 'OPTIMISM', 'MATIC', 'AVAXC']
+
+
+def build_tokens_payload(exchange_count: int, token_count: int, seed: int = 42) -> dict:
+    """Build a payload shaped like the /api/v1/tokens response"""
+    rng = random.Random(seed)
+    exchanges_data = {}
+
+    for exchange_name in (EXCHANGES * (exchange_count // len(EXCHANGES) + 1))[:exchange_count]:
+        tokens = []
+        for i in range(token_count):
+            ask = rng.uniform(0.0001, 60000)
+            bid = ask * rng.uniform(0.995, 1.0)
+            networks = []
+            for net in rng.sample(NETWORKS, rng.randint(1, 4)):
+                fee = f"{rng.uniform(0, 5):.4f}"
+                networks.append({'name': net, 'label': f"{net} ({fee} USDT)"})
+
+            tokens.append({
+                'symbol': f"TKN{i:05d}USDT",
+                'bid': bid,
+                'ask': ask,
+                'last': (bid + ask) / 2,
+                'volume': rng.uniform(0, 1e9),
+                'spread': (bid - ask) / ask * 100,
+                'networks': networks
+            })
+
+        exchanges_data[exchange_name.lower()] = {
+            'name': exchange_name,
+            'status': 'active',
+            'tokens': tokens,
+            'count': len(tokens)
+        }
+
+    return {
+        'status': 'success',
+        'data': {
+            'exchanges': exchanges_data,
+            'total_exchanges': len(exchanges_data)
+        }
+    }
+
+
+def time_provider(app: Flask, payload: dict, rounds: int) -> tuple:
+    """Return (best, mean, size) of the app's JSON provider responses"""
+    timings = []
+    with app.app_context():
+        for _ in range(rounds):
+            start = time.perf_counter()
+            response = app.json.response(payload)
+            response.get_data()
+            timings.append(time.perf_counter() - start)
+        size = len(response.get_data())
+    return min(timings), sum(timings) / len(timings), size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--exchanges', type=int, default=len(EXCHANGES))
+    parser.add_argument('--tokens', type=int, default=1500, help='tokens per exchange')
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    payload = build_tokens_payload(args.exchanges, args.tokens)
+    print(f"Payload: {args.exchanges} exchanges x {args.tokens} tokens")
+
+    providers = [('stdlib', DefaultJSONProvider)]
+    if ORJSON_AVAILABLE:
+        providers.append(('orjson', OrjsonJSONProvider))
+    else:
+        print("orjson not installed, benchmarking stdlib only")
+
+    results = {}
+    for name, provider_class in providers:
+        app = Flask(__name__)
+        app.json = provider_class(app)
+        best, mean, size = time_provider(app, payload, args.rounds)
+        results[name] = best
+        print(f"{name:>7}: best {best * 1000:8.2f} ms  mean {mean * 1000:8.2f} ms  {size / 1024:,.0f} KiB")
+
+    if 'orjson' in results:
+        print(f"speedup: {results['stdlib'] / results['orjson']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+"""
+Load test long-poll connection capacity of WSGI and ASGI serving modes
+
+Starts the app with in-memory exchanges under each server, opens --clients
+concurrent GET /api/v1/snapshot/poll requests that the server has to hold
+for --hold seconds, and reports how many were held and answered on time,
+latency and the server's memory and thread count at peak.
+
+Usage:
+    python scripts/load_test_streaming.py [--modes gunicorn,threaded,asgi] [--clients 2000] [--hold 5]
+"""
+import argparse
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+MODES = {
+    'gunicorn': 'gunicorn sync workers (docker/Dockerfile)',
+    'threaded': 'Flask threaded server (app.py / run.py)',
+    'asgi': 'uvicorn asgi:app',
+}
+
+
+def create_load_test_app():
+    """Create the app with in-memory exchanges so the test never hits exchange APIs"""
+    from app import create_app
+    from services.exchanges.base import BaseExchangeService, get_exchange_manager
+
+    class MemoryExchangeService(BaseExchangeService):
+        def _fetch_trading_data(self):
+            return {f"TKN{i}USDT": {'bid': 1.0, 'ask': 1.01, 'last': 1.0, 'volume': 1000.0} for i in range(500)}
+
+        def _fetch_networks_data(self):
+            return {}
+
+    app = create_app('development')
+    with app.app_context():
+        get_exchange_manager()._exchanges = {name: MemoryExchangeService(name) for name in ('Binance', 'KuCoin')}
+    return app
+
+
+def serve(mode: str, port: int, workers: int):
+    """Run the app under one server (child process entry point)"""
+    app = create_load_test_app()
+
+    if mode == 'asgi':
+        import uvicorn
+        from utils.asgi import AsgiApplication
+        uvicorn.run(AsgiApplication(app), host='127.0.0.1', port=port, log_level='warning', backlog=4096)
+
+    elif mode == 'threaded':
+        import logging
+        logging.getLogger('werkzeug').setLevel(logging.WARNING)
+        app.run(host='127.0.0.1', port=port, debug=False, threaded=True)
+
+    elif mode == 'gunicorn':
+        from gunicorn.app.base import BaseApplication
+
+        class LoadTestApplication(BaseApplication):
+            def load_config(self):
+                self.cfg.set('bind', f'127.0.0.1:{port}')
+                self.cfg.set('workers', workers)
+                self.cfg.set('timeout', 120)
+                self.cfg.set('backlog', 4096)
+                self.cfg.set('loglevel', 'warning')
+
+            def load(self):
+                return app
+
+        LoadTestApplication().run()
+
+
+def process_tree_stats(pid: int) -> tuple:
+    """Return (RSS in MiB, thread count) of a process and its children"""
+    rss_kib, threads = 0, 0
+    pids = [pid]
+    try:
+        with open(f'/proc/{pid}/task/{pid}/children') as f:
+            pids += [int(child) for child in f.read().split()]
+    except OSError:
+        pass
+
+    for proc in pids:
+        try:
+            with open(f'/proc/{proc}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        rss_kib += int(line.split()[1])
+                    elif line.startswith('Threads:'):
+                        threads += int(line.split()[1])
+        except OSError:
+            pass
+    return rss_kib / 1024, threads
+
+
+async def http_get(port: int, path: str, timeout: float) -> tuple:
+    """Minimal HTTP/1.1 GET, returns (status code, body)"""
+    reader, writer = await asyncio.wait_for(asyncio.open_connection('127.0.0.1', port), timeout)
+    try:
+        writer.write(f'GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n'.encode())
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout)
+    finally:
+        writer.close()
+
+    head, _, body = response.partition(b'\r\n\r\n')
+    return int(head.split(b' ', 2)[1]), body
+
+
+async def wait_until_ready(port: int, deadline: float):
+    """Poll /health until the server answers"""
+    while time.monotonic() < deadline:
+        try:
+            status, _ = await http_get(port, '/health', 1)
+            if status == 200:
+                return
+        except (OSError, asyncio.TimeoutError, IndexError, ValueError):
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError('server did not start')
+
+
+async def run_clients(port: int, clients: int, hold: float, pid: int) -> dict:
+    """Open concurrent long-polls and collect latencies while sampling server stats"""
+    path = f'/api/v1/snapshot/poll?since=1000000&timeout={hold}'
+    client_timeout = hold * 3
+    latencies, errors = [], 0
+    peak = {'rss': 0.0, 'threads': 0}
+
+    async def client():
+        nonlocal errors
+        start = time.monotonic()
+        try:
+            status, _ = await http_get(port, path, client_timeout)
+            if status == 200:
+                latencies.append(time.monotonic() - start)
+            else:
+                errors += 1
+        except (OSError, asyncio.TimeoutError, IndexError, ValueError):
+            errors += 1
+
+    async def sample():
+        while True:
+            rss, threads = process_tree_stats(pid)
+            peak['rss'] = max(peak['rss'], rss)
+            peak['threads'] = max(peak['threads'], threads)
+            await asyncio.sleep(0.25)
+
+    sampler = asyncio.create_task(sample())
+    await asyncio.gather(*(client() for _ in range(clients)))
+    sampler.cancel()
+
+    latencies.sort()
+    on_time = len([latency for latency in latencies if latency <= hold * 1.5])
+    return {
+        'answered': len(latencies),
+        'on_time': on_time,
+        'errors': errors,
+        'p50': latencies[len(latencies) // 2] if latencies else None,
+        'p99': latencies[int(len(latencies) * 0.99) - 1] if latencies else None,
+        'peak_rss_mib': peak['rss'],
+        'peak_threads': peak['threads'],
+    }
+
+
+def run_mode(mode: str, args) -> dict:
+    """Start a server for the mode, load it and stop it"""
+    server = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), '--serve', mode, '--port', str(args.port),
+         '--workers', str(args.workers)],
+        env=dict(os.environ, SNAPSHOT_POLL_INTERVAL=str(args.interval))
+    )
+    try:
+        asyncio.run(wait_until_ready(args.port, time.monotonic() + 30))
+        idle_rss, _ = process_tree_stats(server.pid)
+        result = asyncio.run(run_clients(args.port, args.clients, args.hold, server.pid))
+        result['idle_rss_mib'] = idle_rss
+        return result
+    finally:
+        server.terminate()
+        try:
+            server.wait(10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--modes', default=','.join(MODES))
+    parser.add_argument('--clients', type=int, default=2000, help='concurrent long-poll clients')
+    parser.add_argument('--hold', type=float, default=5, help='seconds the server holds each long-poll')
+    parser.add_argument('--workers', type=int, default=4, help='gunicorn workers')
+    parser.add_argument('--interval', type=float, default=1.0, help='SNAPSHOT_POLL_INTERVAL of the server')
+    parser.add_argument('--port', type=int, default=5099)
+    parser.add_argument('--serve', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port, args.workers)
+        return
+
+    # Every client needs a file descriptor on both sides
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(max(soft, args.clients * 2 + 256), hard), hard))
+
+    print(f"{args.clients} clients, long-poll held {args.hold:g}s, client gives up after {args.hold * 3:g}s")
+    for mode in args.modes.split(','):
+        result = run_mode(mode, args)
+        p50 = f"{result['p50']:.2f}s" if result['p50'] is not None else '-'
+        p99 = f"{result['p99']:.2f}s" if result['p99'] is not None else '-'
+        print(f"{mode:>9} ({MODES[mode]})")
+        print(f"           on time {result['on_time']:>6}/{args.clients}  answered {result['answered']:>6}  "
+              f"errors {result['errors']:>6}  p50 {p50}  p99 {p99}")
+        print(f"           RSS idle {result['idle_rss_mib']:.0f} MiB, peak {result['peak_rss_mib']:.0f} MiB  "
+              f"peak threads {result['peak_threads']}")
+
+
+if __name__ == '__main__':
+    main()
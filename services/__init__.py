@@ -14,13 +14,50 @@ from .exchanges.base import (
 # Імпортуємо сервіс арбітражу
 from .arbitrage import ArbitrageService
 
+# Знімки ринкових даних та похідні індекси
+from .snapshot import MarketSnapshot, get_market_snapshot, pin_market_snapshot
+from .network_index import NetworkIndex, get_network_index
+
+# Фонове оновлення кешів бірж
+from .refresh_jobs import RefreshJobManager, get_refresh_job_manager
+
+# Планові перевірки стану бірж
+from .health import HealthMonitor, get_health_monitor, init_health_monitor
+
+# Спільний знімок ринку для всіх процесів сервера
+from .shared_snapshot import get_snapshot_ingestor, init_shared_snapshot
+
+# Розповсюдження знімків ринку між вузлами API
+from .snapshot_distribution import get_snapshot_distribution, init_snapshot_distribution
+
+# Шардування символів між процесами арбітражного рушія
+from .sharding import HashRing, ShardedArbitrageEngine, get_sharded_engine, init_sharded_engine
+
 # Визначаємо, що буде доступно при імпорті з 'services'
 __all__ = [
     'BaseExchangeService',
     'ExchangeManager',
     'get_exchange_manager',
     'register_all_exchanges',
-    'ArbitrageService'
+    'ArbitrageService',
+    'MarketSnapshot',
+    'get_market_snapshot',
+    'pin_market_snapshot',
+    'NetworkIndex',
+    'get_network_index',
+    'RefreshJobManager',
+    'get_refresh_job_manager',
+    'HealthMonitor',
+    'get_health_monitor',
+    'init_health_monitor',
+    'get_snapshot_ingestor',
+    'init_shared_snapshot',
+    'get_snapshot_distribution',
+    'init_snapshot_distribution',
+    'HashRing',
+    'ShardedArbitrageEngine',
+    'get_sharded_engine',
+    'init_sharded_engine'
 ]
 
 # Допоміжна функція (за бажанням)
@@ -2,11 +2,85 @@
 Arbitrage calculation and analysis service
 """
 import logging
+from bisect import bisect_right
 from typing import Dict, List, Any, Optional
 from collections import defaultdict
 from flask import current_app
 
 from .exchanges.base import get_exchange_manager, BaseExchangeService
+from .network_index import get_network_index
+from .snapshot import get_market_snapshot
+
+
+def calculate_opportunity(symbol: str, exchange_data: Dict[str, Dict], min_spread: float) -> Optional[Dict[str, Any]]:
+    """
+    Best buy/sell pair of a symbol across exchanges, networks not attached
+    Returns None if fewer than two exchanges quote it, one exchange is best on both sides
+    or the spread is below min_spread
+    """
+    prices = {}
+
+    # Collect prices from exchanges that have this symbol
+    for exchange, data in exchange_data.items():
+        if symbol in data and data[symbol].get('ask', 0) > 0:
+            prices[exchange] = {
+                'bid': data[symbol].get('bid', 0),
+                'ask': data[symbol].get('ask', 0),
+                'volume': data[symbol].get('volume', 0)
+            }
+
+    if len(prices) < 2:
+        return None
+
+    # Find best buy (lowest ask) and sell (highest bid) exchanges
+    best_ask = min(prices.items(), key=lambda x: x[1]['ask'])
+    best_bid = max(prices.items(), key=lambda x: x[1]['bid'])
+
+    # Skip if same exchange
+    if best_ask[0] == best_bid[0]:
+        return None
+
+    # Calculate spread percentage
+    buy_price = best_ask[1]['ask']
+    sell_price = best_bid[1]['bid']
+    spread_percent = ((sell_price - buy_price) / buy_price) * 100
+
+    if spread_percent < min_spread:
+        return None
+
+    return {
+        'symbol': symbol,
+        'buy_exchange': best_ask[0],
+        'buy_price': buy_price,
+        'sell_exchange': best_bid[0],
+        'sell_price': sell_price,
+        'spread': spread_percent,
+        'profit': sell_price - buy_price,
+        'volume': best_ask[1]['volume']
+    }
+
+
+def rank_opportunities(exchange_data: Dict[str, Dict]) -> List[Dict[str, Any]]:
+    """Opportunities of every stablecoin pair quoted on at least 2 exchanges, by spread descending"""
+    # Count symbols across exchanges
+    symbol_counts = defaultdict(int)
+    for data in exchange_data.values():
+        for symbol in data.keys():
+            if BaseExchangeService.is_stablecoin_pair(symbol):
+                symbol_counts[symbol] += 1
+
+    # Only symbols present on at least 2 exchanges
+    common_symbols = [s for s, count in symbol_counts.items() if count >= 2]
+
+    opportunities = []
+    for symbol in common_symbols:
+        opportunity = calculate_opportunity(symbol, exchange_data, float('-inf'))
+        if opportunity:
+            opportunities.append(opportunity)
+
+    # Stable sort, so any min_spread prefix keeps the order of a filtered sort
+    opportunities.sort(key=lambda x: x['spread'], reverse=True)
+    return opportunities
 
 
 class ArbitrageService:
@@ -14,6 +88,9 @@ class ArbitrageService:
     Service for calculating and analyzing arbitrage opportunities
     """
 
+    # Sharded ranking engine (services.sharding), None to rank in this process
+    engine = None
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.exchange_manager = get_exchange_manager()
@@ -25,6 +102,7 @@ class ArbitrageService:
     ) -> List[Dict[str, Any]]:
         """
         Find arbitrage opportunities between exchanges
+        Served as a prefix of the full ranking memoized on the market snapshot
 
         Args:
             min_spread: Minimum profit spread percentage (default from config)
@@ -36,37 +114,53 @@ class ArbitrageService:
         if min_spread is None:
             min_spread = current_app.config.get('MIN_ARBITRAGE_SPREAD', 0.1)
 
-        # Get data from all exchanges
-        exchange_data = self._get_filtered_exchange_data(exchange_filter)
+        opportunities, neg_spreads = self._get_ranked_opportunities(exchange_filter)
+        return opportunities[:bisect_right(neg_spreads, -min_spread)]
+
+    def _get_ranked_opportunities(self, exchange_filter: Optional[str]):
+        """
+        All opportunities of the current snapshot sorted by spread (descending)
+        Computed once per snapshot and set of exchanges matching the filter,
+        keeping only the ranking of the latest networks index version
+
+        Returns:
+            Tuple of (opportunities, negated spreads for bisecting by min_spread)
+        """
+        snapshot = get_market_snapshot()
+        network_index = get_network_index()
+        exchanges = tuple(sorted(self._get_filtered_exchange_data(snapshot.trading_data, exchange_filter)))
+        if len(exchanges) < 2:
+            # Nothing to rank; not cached so arbitrary filters cannot grow the snapshot
+            return self._rank_opportunities(snapshot.trading_data, exchange_filter, network_index)
+
+        return snapshot.get_derived(
+            ('opportunities', exchanges),
+            lambda snap: self._rank_opportunities(snap.trading_data, exchange_filter, network_index),
+            version=network_index.version
+        )
+
+    def _rank_opportunities(self, trading_data: Dict[str, Dict], exchange_filter: Optional[str], network_index):
+        """Calculate opportunities for every common symbol regardless of spread"""
+        exchange_data = self._get_filtered_exchange_data(trading_data, exchange_filter)
 
         if len(exchange_data) < 2:
             self.logger.warning("Need at least 2 exchanges for arbitrage calculation")
-            return []
-
-        # Count symbols across exchanges
-        symbol_counts = defaultdict(int)
-        for data in exchange_data.values():
-            for symbol in data.keys():
-                if BaseExchangeService.is_stablecoin_pair(symbol):
-                    symbol_counts[symbol] += 1
-
-        # Only symbols present on at least 2 exchanges
-        common_symbols = [s for s, count in symbol_counts.items() if count >= 2]
-
-        opportunities = []
-        for symbol in common_symbols:
-            opportunity = self._calculate_arbitrage_for_symbol(
-                symbol, exchange_data, min_spread
-            )
-            if opportunity:
-                opportunities.append(opportunity)
+            return [], []
 
-        return sorted(opportunities, key=lambda x: x['spread'], reverse=True)
+        if self.engine is not None:
+            opportunities = self.engine.rank(exchange_data)
+        else:
+            opportunities = rank_opportunities(exchange_data)
 
-    def _get_filtered_exchange_data(self, exchange_filter: Optional[str]) -> Dict[str, Dict]:
-        """Get trading data from exchanges with optional filtering"""
-        all_data = self.exchange_manager.get_all_trading_data()
+        for opportunity in opportunities:
+            opportunity['networks'] = network_index.get_exchange_networks(
+                BaseExchangeService.get_base_token(opportunity['symbol'])
+            )
+        return opportunities, [-op['spread'] for op in opportunities]
 
+    @staticmethod
+    def _get_filtered_exchange_data(all_data: Dict[str, Dict], exchange_filter: Optional[str]) -> Dict[str, Dict]:
+        """Get trading data of exchanges with optional filtering"""
         if exchange_filter:
             # Filter by specific exchange
             filtered_data = {}
@@ -77,88 +171,6 @@ class ArbitrageService:
 
         return all_data
 
-    def _calculate_arbitrage_for_symbol(
-            self,
-            symbol: str,
-            exchange_data: Dict[str, Dict],
-            min_spread: float
-    ) -> Optional[Dict[str, Any]]:
-        """
-        Calculate arbitrage opportunity for a specific symbol
-        """
-        prices = {}
-
-        # Collect prices from exchanges that have this symbol
-        for exchange, data in exchange_data.items():
-            if symbol in data and data[symbol].get('ask', 0) > 0:
-                prices[exchange] = {
-                    'bid': data[symbol].get('bid', 0),
-                    'ask': data[symbol].get('ask', 0),
-                    'volume': data[symbol].get('volume', 0)
-                }
-
-        if len(prices) < 2:
-            return None
-
-        # Find best buy (lowest ask) and sell (highest bid) exchanges
-        best_ask = min(prices.items(), key=lambda x: x[1]['ask'])
-        best_bid = max(prices.items(), key=lambda x: x[1]['bid'])
-
-        # Skip if same exchange
-        if best_ask[0] == best_bid[0]:
-            return None
-
-        # Calculate spread percentage
-        buy_price = best_ask[1]['ask']
-        sell_price = best_bid[1]['bid']
-        spread_percent = ((sell_price - buy_price) / buy_price) * 100
-
-        if spread_percent < min_spread:
-            return None
-
-        # Get network information
-        networks = self._get_networks_for_symbol(symbol)
-
-        return {
-            'symbol': symbol,
-            'buy_exchange': best_ask[0],
-            'buy_price': buy_price,
-            'sell_exchange': best_bid[0],
-            'sell_price': sell_price,
-            'spread': spread_percent,
-            'profit': sell_price - buy_price,
-            'volume': best_ask[1]['volume'],
-            'networks': networks
-        }
-
-    def _get_networks_for_symbol(self, symbol: str) -> List[Dict[str, str]]:
-        """
-        Get available networks for a token across all exchanges
-        """
-        base_token = BaseExchangeService.get_base_token(symbol)
-        networks_by_exchange = {}
-
-        for exchange_name, exchange_service in self.exchange_manager.get_all_exchanges().items():
-            try:
-                networks_data = exchange_service.get_cached_networks_data()
-                if base_token in networks_data:
-                    networks = networks_data[base_token]
-                    if networks:
-                        net_names = ', '.join(sorted({net['name'] for net in networks}))
-                        networks_by_exchange[exchange_name] = net_names
-            except Exception as e:
-                self.logger.error(f"Failed to get networks from {exchange_name}: {e}")
-
-        # Format result
-        result = []
-        for exchange, networks in networks_by_exchange.items():
-            result.append({
-                'exchange': exchange,
-                'networks': networks
-            })
-
-        return result
-
     def get_dashboard_stats(self) -> Dict[str, Any]:
         """
         Get dashboard statistics for display
@@ -321,26 +333,51 @@ class ArbitrageService:
 
         return table
 
-    def format_opportunities_for_api(self, opportunities: List[Dict]) -> List[Dict]:
+    def format_opportunities_for_api(
+            self,
+            opportunities: List[Dict],
+            raw: bool = False,
+            fields: Optional[List[str]] = None
+    ) -> List[Dict]:
         """
         Format arbitrage opportunities for API response
-        """
-        formatted = []
 
-        for opp in opportunities:
-            formatted.append({
-                'id': f"{opp['symbol']}_{opp['buy_exchange']}_{opp['sell_exchange']}",
-                'token': opp['symbol'].replace('USDT', ''),
-                'symbol': opp['symbol'],
-                'tokenSymbol': opp['symbol'].replace('USDT', ''),
-                'buyExchange': opp['buy_exchange'],
-                'buyPrice': f"${opp['buy_price']:.6f}",
-                'sellExchange': opp['sell_exchange'],
-                'sellPrice': f"${opp['sell_price']:.6f}",
-                'spread': f"{opp['spread']:.2f}%",
-                'volume': f"${opp.get('volume', 0):,.0f}",
-                'estProfit': f"${opp['profit']:.2f}",
-                'networks': [{'name': net['networks']} for net in opp.get('networks', [])]
-            })
-
-        return formatted
\ No newline at end of file
+        Args:
+            opportunities: Opportunities from find_arbitrage_opportunities
+            raw: Return native numbers instead of display strings
+            fields: Only build these fields (all fields if None)
+        """
+        builders = RAW_OPPORTUNITY_FIELDS if raw else DISPLAY_OPPORTUNITY_FIELDS
+        if fields:
+            builders = {name: builders[name] for name in fields if name in builders}
+
+        return [
+            {name: build(opp) for name, build in builders.items()}
+            for opp in opportunities
+        ]
+
+
+# Field builders for API opportunity rows (field name -> builder)
+DISPLAY_OPPORTUNITY_FIELDS = {
+    'id': lambda opp: f"{opp['symbol']}_{opp['buy_exchange']}_{opp['sell_exchange']}",
+    'token': lambda opp: opp['symbol'].replace('USDT', ''),
+    'symbol': lambda opp: opp['symbol'],
+    'tokenSymbol': lambda opp: opp['symbol'].replace('USDT', ''),
+    'buyExchange': lambda opp: opp['buy_exchange'],
+    'buyPrice': lambda opp: f"${opp['buy_price']:.6f}",
+    'sellExchange': lambda opp: opp['sell_exchange'],
+    'sellPrice': lambda opp: f"${opp['sell_price']:.6f}",
+    'spread': lambda opp: f"{opp['spread']:.2f}%",
+    'volume': lambda opp: f"${opp.get('volume', 0):,.0f}",
+    'estProfit': lambda opp: f"${opp['profit']:.2f}",
+    'networks': lambda opp: [{'name': net['networks']} for net in opp.get('networks', [])]
+}
+
+RAW_OPPORTUNITY_FIELDS = {
+    **DISPLAY_OPPORTUNITY_FIELDS,
+    'buyPrice': lambda opp: opp['buy_price'],
+    'sellPrice': lambda opp: opp['sell_price'],
+    'spread': lambda opp: opp['spread'],
+    'volume': lambda opp: opp.get('volume', 0),
+    'estProfit': lambda opp: opp['profit']
+}
@@ -3,11 +3,39 @@ Base exchange service class and utilities
 """
 import time
 import re
+import hashlib
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+from typing import Callable, Dict, List, Any, Optional
 from flask import current_app
 
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .endpoints import EndpointSelector
+from .hedging import RequestHedger
+from .http import create_session
+from .parsing import columns_to_quotes, get_parse_pool, parse_ticker_data, parse_ticker_payload
+from .rate_budget import RateBudget, RateBudgetExceeded
+
+
+# Shared pool for targeted (max_age driven) cache refreshes, created on first use
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+_refresh_executor_lock = threading.Lock()
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    """Get the targeted refresh thread pool (size from REFRESH_WORKERS config)"""
+    global _refresh_executor
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(
+                max_workers=current_app.config.get('REFRESH_WORKERS', 8),
+                thread_name_prefix='targeted-refresh'
+            )
+        return _refresh_executor
+
 
 class BaseExchangeService(ABC):
     """
@@ -15,6 +43,11 @@ class BaseExchangeService(ABC):
     Provides common functionality for data fetching, caching, and normalization
     """
 
+    # Equivalent REST API hosts (overridable via EXCHANGE_API_HOSTS) and a cheap
+    # public path used to measure them
+    API_HOSTS: List[str] = []
+    PROBE_PATH: Optional[str] = None
+
     def __init__(self, name: str):
         self.name = name
         self.logger = logging.getLogger(f"{__name__}.{name}")
@@ -26,6 +59,59 @@ class BaseExchangeService(ABC):
         self._networks_cache_time = 0
         self._cache_duration = current_app.config.get('CACHE_DURATION', 3600)
 
+        # Bumped on every cache update so derived indexes know when to rebuild
+        self._trading_version = 0
+        self._networks_version = 0
+
+        # Formatted token table and network labels, keyed by the source dicts
+        self._formatted_tokens_cache = None
+        self._network_labels_cache = None
+
+        # Circuit breakers of trading and networks API calls
+        self._breakers = {
+            kind: CircuitBreaker(
+                failure_threshold=current_app.config.get('CIRCUIT_FAILURE_THRESHOLD', 3),
+                base_backoff=current_app.config.get('CIRCUIT_BACKOFF_BASE', 5.0),
+                max_backoff=current_app.config.get('CIRCUIT_BACKOFF_MAX', 300.0),
+                negative_ttl=current_app.config.get('CIRCUIT_NEGATIVE_TTL', 2.0)
+            )
+            for kind in ('trading', 'networks')
+        }
+
+        # Client-side budget of the exchange's API rate limit
+        self._rate_budget = RateBudget.for_exchange(name, safety=current_app.config.get('RATE_BUDGET_SAFETY', 0.9))
+
+        # Keep-alive connection pool shared by all REST calls of this exchange
+        self.session = create_session(
+            pool_size=current_app.config.get('HTTP_POOL_SIZE', 8),
+            retries=current_app.config.get('HTTP_RETRIES', 2),
+            backoff=current_app.config.get('HTTP_RETRY_BACKOFF', 0.3)
+        )
+        self._http_timeout = (
+            current_app.config.get('HTTP_CONNECT_TIMEOUT', 3.05),
+            current_app.config.get('HTTP_READ_TIMEOUT', 10)
+        )
+
+        # Fastest healthy API host first, others as failover
+        self._endpoints = EndpointSelector(
+            current_app.config.get('EXCHANGE_API_HOSTS', {}).get(name) or self.API_HOSTS
+        )
+
+        # Tail latency hedging of ticker requests
+        self._hedger = RequestHedger(
+            enabled=current_app.config.get('HEDGE_ENABLED', False),
+            percentile=current_app.config.get('HEDGE_PERCENTILE', 95),
+            min_delay=current_app.config.get('HEDGE_MIN_DELAY', 0.05)
+        )
+
+        # Body digest, HTTP validators and parsed result of the last response per payload key
+        self._payload_cache: Dict[str, Dict[str, Any]] = {}
+        self._payload_stats = {'parsed': 0, 'unchanged': 0, 'not_modified': 0}
+
+        # In-flight targeted trading data refresh, shared by concurrent readers
+        self._trading_refresh: Optional[Future] = None
+        self._refresh_lock = threading.Lock()
+
     @abstractmethod
     def _fetch_trading_data(self) -> Dict[str, Any]:
         """
@@ -42,24 +128,72 @@ class BaseExchangeService(ABC):
         """
         pass
 
-    def get_cached_trading_data(self) -> Dict[str, Any]:
+    def get_cached_trading_data(self, max_age: Optional[float] = None,
+                                wait: Optional[float] = None) -> Dict[str, Any]:
         """
         Get trading data with caching
         Returns normalized trading data for USDT pairs
+
+        Args:
+            max_age: Maximum acceptable data age in seconds. Older data triggers
+                a targeted refresh that is awaited up to wait seconds; when it
+                does not finish in time the current data is returned as is.
+                None uses CACHE_DURATION with a synchronous fetch.
+            wait: Seconds to wait for a targeted refresh (default 0)
         """
+        if max_age is not None:
+            if not self.is_trading_data_fresh(max_age):
+                refresh = self.request_trading_refresh()
+                done, _ = wait_futures([refresh], timeout=max(wait or 0, 0))
+                error = refresh.exception() if done else None
+                if isinstance(error, (CircuitOpenError, RateBudgetExceeded)):
+                    self.logger.debug(f"Targeted refresh of {self.name} skipped: {error}")
+                elif error is not None:
+                    self.logger.error(f"Targeted refresh of {self.name} failed: {error}")
+            return self._trading_data_cache
+
         current_time = time.time()
 
         if current_time - self._trading_cache_time > self._cache_duration:
             try:
-                self._trading_data_cache = self._fetch_trading_data()
-                self._trading_cache_time = current_time
-                self.logger.info(f"Updated trading data cache for {self.name}")
+                self._set_trading_data(self._guarded_fetch('trading', self._fetch_trading_data), current_time)
+            except (CircuitOpenError, RateBudgetExceeded):
+                pass
             except Exception as e:
+                # Last good data keeps being served, marked stale
                 self.logger.error(f"Failed to fetch trading data from {self.name}: {e}")
-                return {}
 
         return self._trading_data_cache
 
+    def get_trading_data_age(self) -> Optional[float]:
+        """Seconds since trading data was fetched, None if never fetched"""
+        if not self._trading_cache_time:
+            return None
+        return max(time.time() - self._trading_cache_time, 0.0)
+
+    def is_trading_data_fresh(self, max_age: float) -> bool:
+        """Check whether trading data was fetched at most max_age seconds ago"""
+        age = self.get_trading_data_age()
+        return age is not None and age <= max_age
+
+    def request_trading_refresh(self) -> Future:
+        """
+        Start a background trading data refresh, or join the one in flight
+        Runs refresh_trading_data() inside the current app context
+        """
+        with self._refresh_lock:
+            if self._trading_refresh is not None and not self._trading_refresh.done():
+                return self._trading_refresh
+
+            app = current_app._get_current_object()
+
+            def run():
+                with app.app_context():
+                    return self.refresh_trading_data()
+
+            self._trading_refresh = _get_refresh_executor().submit(run)
+            return self._trading_refresh
+
     def get_cached_networks_data(self) -> Dict[str, List[Dict]]:
         """
         Get networks data with caching
@@ -69,15 +203,315 @@ class BaseExchangeService(ABC):
 
         if current_time - self._networks_cache_time > self._cache_duration:
             try:
-                self._networks_data_cache = self._fetch_networks_data()
-                self._networks_cache_time = current_time
-                self.logger.info(f"Updated networks data cache for {self.name}")
+                self._set_networks_data(self._guarded_fetch('networks', self._fetch_networks_data), current_time)
+            except (CircuitOpenError, RateBudgetExceeded):
+                pass
             except Exception as e:
                 self.logger.error(f"Failed to fetch networks data from {self.name}: {e}")
-                return {}
 
         return self._networks_data_cache
 
+    def _guarded_fetch(self, kind: str, fetch) -> Dict:
+        """
+        Call an exchange fetch through its rate budget and circuit breaker
+        Empty results count as failures (adapters return {} on API errors)
+
+        Raises:
+            RateBudgetExceeded: If the call was deferred to stay within the rate limit
+            CircuitOpenError: If the call was skipped by the open circuit
+            RuntimeError: If the exchange returned no data
+        """
+        retry_in = self._rate_budget.time_until_available(kind)
+        if retry_in > 0:
+            self._rate_budget.record_deferral()
+            raise RateBudgetExceeded(f"Rate budget of {self.name} spent, {kind} fetch deferred {retry_in:.1f}s", retry_in)
+
+        breaker = self._breakers[kind]
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"{kind} API of {self.name} is unavailable, retry at {breaker.retry_at:.0f}")
+
+        self._rate_budget.spend(kind)
+
+        try:
+            data = fetch()
+            if not data:
+                raise RuntimeError(f"No {kind} data returned by {self.name}")
+        except Exception as e:
+            breaker.record_failure(str(e))
+            if breaker.state == breaker.OPEN:
+                self.logger.warning(f"Circuit of {self.name} {kind} API open for {breaker.backoff:.0f}s")
+            raise
+
+        breaker.record_success()
+        return data
+
+    def _http_get(self, url: str, hedge: bool = False, **kwargs):
+        """
+        GET on the exchange's pooled session with the shared timeouts, feeding the rate budget
+
+        Args:
+            url: Request URL
+            hedge: Ticker request; may be hedged with a duplicate when slow,
+                paying the hedge's trading weight from the rate budget
+        """
+        kwargs.setdefault('timeout', self._http_timeout)
+
+        def send():
+            return self.session.get(url, **kwargs)
+
+        if hedge:
+            response = self._hedger.call(send, lambda: self._rate_budget.try_acquire('trading'))
+        else:
+            response = send()
+        self._note_rate_limit(response)
+        return response
+
+    def _api_get(self, path: str, hedge: bool = False, **kwargs):
+        """
+        GET an API path on the fastest healthy host
+        Connection errors and 5xx responses fail over to the next host; the
+        last host's response is returned when every host answers 5xx
+
+        Raises:
+            Exception: Error of the last host when no host answered
+        """
+        response = None
+        error = None
+
+        for host in self._endpoints.ordered():
+            try:
+                response = self._http_get(host + path, hedge=hedge, **kwargs)
+            except Exception as e:
+                self.logger.warning(f"{self.name} API host {host} failed: {e}")
+                self._endpoints.record_failure(host, str(e))
+                error = e
+                continue
+
+            if response.status_code >= 500:
+                self._endpoints.record_failure(host, f"HTTP {response.status_code}")
+                continue
+
+            self._endpoints.record_success(host)
+            return response
+
+        if response is not None:
+            return response
+        raise error or RuntimeError(f"No API hosts configured for {self.name}")
+
+    def probe_endpoints(self) -> List[Dict[str, Any]]:
+        """
+        Measure the latency of every API host with PROBE_PATH
+        Run on the health monitor's schedule for exchanges with several hosts
+        """
+        if len(self._endpoints.hosts) > 1 and self.PROBE_PATH:
+            for host in self._endpoints.hosts:
+                if not self._rate_budget.try_acquire('ping'):
+                    break
+
+                start = time.perf_counter()
+                try:
+                    response = self.session.get(host + self.PROBE_PATH, timeout=self._http_timeout)
+                    self._note_rate_limit(response)
+                    if response.status_code != 200:
+                        raise RuntimeError(f"HTTP {response.status_code}")
+                    self._endpoints.record_latency(host, time.perf_counter() - start)
+                except Exception as e:
+                    self._endpoints.record_failure(host, str(e))
+
+        return self._endpoints.get_status()
+
+    def get_endpoint_status(self) -> List[Dict[str, Any]]:
+        """API hosts with measured latency and health, in routing order"""
+        return self._endpoints.get_status()
+
+    def _parse_tickers(self, fmt: str, response) -> Dict[str, Any]:
+        """
+        Parse a ticker response into trading data
+        With PARSE_POOL_ENABLED, bodies of at least PARSE_POOL_MIN_BYTES are
+        decoded and parsed in the process pool, returning compact columns
+
+        Args:
+            fmt: Ticker format in parsing.TICKER_FORMATS
+            response: HTTP response of the exchange's ticker endpoint
+        """
+        def parse():
+            config = current_app.config
+            if config.get('PARSE_POOL_ENABLED', False):
+                payload = response.content
+                if len(payload) >= config.get('PARSE_POOL_MIN_BYTES', 256 * 1024):
+                    pool = get_parse_pool(config.get('PARSE_POOL_WORKERS') or None)
+                    parsed = pool.submit(parse_ticker_payload, fmt, payload).result(
+                        timeout=config.get('PARSE_POOL_TIMEOUT', 30)
+                    )
+                    return columns_to_quotes(parsed)
+
+            return columns_to_quotes(parse_ticker_data(fmt, response.json()))
+
+        return self._reuse_unchanged(f"tickers:{fmt}", response, parse)
+
+    def _reuse_unchanged(self, key: str, response, parse: Callable[[], Dict]) -> Dict:
+        """
+        Parse a response unless its body hashes the same as the last one parsed under key
+        An unchanged body returns the previously parsed object itself, so cache
+        setters, derived indexes and snapshots all see no change
+
+        Args:
+            key: Payload key (API path or dataset name)
+            response: HTTP response the result is parsed from
+            parse: Builds the result; empty results are not remembered
+        """
+        content = getattr(response, 'content', None)
+        if not isinstance(content, (bytes, bytearray)):
+            return parse()
+
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        cached = self._payload_cache.get(key)
+        if cached is not None and cached['digest'] == digest:
+            self._payload_stats['unchanged'] += 1
+            return cached['result']
+
+        result = parse()
+        self._payload_stats['parsed'] += 1
+        if result:
+            headers = getattr(response, 'headers', None)
+            headers = headers if isinstance(headers, Mapping) else {}
+            self._payload_cache[key] = {
+                'digest': digest,
+                'result': result,
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified')
+            }
+        return result
+
+    def _api_get_parsed(self, path: str, parse: Callable[[Any], Dict]) -> Dict:
+        """
+        GET an API path and parse its JSON body, skipping unchanged content
+        The last parsed response's ETag / Last-Modified are sent back as
+        If-None-Match / If-Modified-Since; a 304 or a byte-identical body
+        returns the previous result without decoding or parsing
+
+        Args:
+            path: API path
+            parse: Builds the result from the decoded body
+        """
+        cached = self._payload_cache.get(path)
+        headers = {}
+        if cached is not None:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        response = self._api_get(path, **({'headers': headers} if headers else {}))
+        if response.status_code == 304 and cached is not None:
+            self._payload_stats['not_modified'] += 1
+            return cached['result']
+        if response.status_code != 200:
+            self.logger.error(f"{self.name} {path} returned status {response.status_code}")
+            return {}
+
+        return self._reuse_unchanged(path, response, lambda: parse(response.json()))
+
+    def get_latency_stats(self) -> Dict[str, Any]:
+        """Ticker request latency percentiles and hedging counters"""
+        return self._hedger.get_stats()
+
+    def _note_rate_limit(self, response):
+        """Feed rate-limit headers and throttling status of an API response into the rate budget"""
+        self._rate_budget.update_from_headers(
+            getattr(response, 'headers', None),
+            getattr(response, 'status_code', None)
+        )
+
+    def get_refresh_delay(self, kind: str = 'trading') -> float:
+        """Seconds until a fetch of kind fits the rate budget, 0 if it may run now"""
+        return self._rate_budget.time_until_available(kind)
+
+    def get_rate_budget_status(self) -> Dict[str, Any]:
+        """Rate budget level, spent weight and deferred fetches"""
+        return self._rate_budget.get_status()
+
+    def is_serving_stale(self, kind: str = 'trading') -> bool:
+        """Check whether the last fetch failed and older cached data is being served"""
+        return not self._breakers[kind].is_closed
+
+    def get_circuit_status(self) -> Dict[str, Dict]:
+        """Circuit breaker state of trading and networks API calls"""
+        return {kind: breaker.get_status() for kind, breaker in self._breakers.items()}
+
+    def _set_trading_data(self, data: Dict[str, Any], fetched_at: float):
+        """Replace trading data cache (unchanged content only renews its fetch time)"""
+        unchanged = data is self._trading_data_cache
+        self._trading_data_cache = data
+        self._trading_cache_time = fetched_at
+        if unchanged:
+            self.logger.debug(f"Trading data of {self.name} unchanged")
+            return
+        self._trading_version += 1
+        self.logger.info(f"Updated trading data cache for {self.name}")
+
+    def _set_networks_data(self, data: Dict[str, List[Dict]], fetched_at: float):
+        """Replace networks data cache (unchanged content only renews its fetch time)"""
+        unchanged = data is self._networks_data_cache
+        self._networks_data_cache = data
+        self._networks_cache_time = fetched_at
+        if unchanged:
+            self.logger.debug(f"Networks data of {self.name} unchanged")
+            return
+        self._networks_version += 1
+        self.logger.info(f"Updated networks data cache for {self.name}")
+
+    def refresh_trading_data(self) -> Dict[str, Any]:
+        """
+        Re-fetch trading data regardless of cache age
+        The current cache is kept until the new data is ready, and kept
+        unchanged if the fetch fails or returns nothing
+
+        Raises:
+            RateBudgetExceeded: If the rate budget defers the fetch
+            CircuitOpenError: If the exchange's circuit is open
+            RuntimeError: If the exchange returned no data
+        """
+        fetched_at = time.time()
+        data = self._guarded_fetch('trading', self._fetch_trading_data)
+        self._set_trading_data(data, fetched_at)
+        return data
+
+    def refresh_networks_data(self) -> Dict[str, List[Dict]]:
+        """
+        Re-fetch networks data regardless of cache age
+        The current cache is kept until the new data is ready, and kept
+        unchanged if the fetch fails or returns nothing
+
+        Raises:
+            RateBudgetExceeded: If the rate budget defers the fetch
+            CircuitOpenError: If the exchange's circuit is open
+            RuntimeError: If the exchange returned no data
+        """
+        fetched_at = time.time()
+        data = self._guarded_fetch('networks', self._fetch_networks_data)
+        self._set_networks_data(data, fetched_at)
+        return data
+
+    def test_connection(self) -> bool:
+        """
+        Test API connectivity
+        Overridden by exchanges with a lightweight ping endpoint
+        """
+        return bool(self._fetch_trading_data())
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Cached data sizes and update times, without fetching"""
+        return {
+            'symbol_count': len(self._trading_data_cache),
+            'token_count': len(self._networks_data_cache),
+            'trading_updated': self._trading_cache_time or None,
+            'networks_updated': self._networks_cache_time or None,
+            'circuit': self._breakers['trading'].state,
+            'stale': self.is_serving_stale(),
+            'payloads': dict(self._payload_stats)
+        }
+
     @staticmethod
     def normalize_symbol(symbol: str) -> str:
         """
@@ -105,30 +539,49 @@ class BaseExchangeService(ABC):
         """
         return symbol.endswith('USDT')
 
+    @staticmethod
+    def format_network_label(network: Dict) -> str:
+        """
+        Build display label of a withdrawal network
+        E.g., 'ERC20 (5 USDT)'
+        """
+        fee = network.get('fee', '0')
+        label = f"{network['name']}"
+        if fee and fee != '0':
+            label += f" ({fee} USDT)" if network['name'] != "DGB" else f" ({fee})"
+        return label
+
+    def _get_network_labels(self, networks_data: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+        """
+        Get display networks per base token
+        Built once per networks cache and shared by all pairs of a token
+        """
+        cached = self._network_labels_cache
+        if cached is not None and cached[0] is networks_data:
+            return cached[1]
+
+        labels = {
+            token: [{'name': net['name'], 'label': self.format_network_label(net)} for net in networks]
+            for token, networks in networks_data.items()
+        }
+        self._network_labels_cache = (networks_data, labels)
+        return labels
+
     def format_token_data(self, raw_data: Dict) -> List[Dict]:
         """
         Format raw token data for display
+        The sorted table is cached until trading or networks data changes
         """
-        tokens = []
         networks_data = self.get_cached_networks_data()
 
-        for symbol, data in raw_data.items():
-            base_token = self.get_base_token(symbol)
-            token_networks = []
-
-            # Get networks for this token
-            if base_token in networks_data:
-                for net in networks_data[base_token]:
-                    fee = net.get('fee', '0')
-                    label = f"{net['name']}"
-                    if fee and fee != '0':
-                        label += f" ({fee} USDT)" if net['name'] != "DGB" else f" ({fee})"
-
-                    token_networks.append({
-                        'name': net['name'],
-                        'label': label
-                    })
+        cached = self._formatted_tokens_cache
+        if cached is not None and cached[0] is raw_data and cached[1] is networks_data:
+            return cached[2]
 
+        network_labels = self._get_network_labels(networks_data)
+        tokens = []
+
+        for symbol, data in raw_data.items():
             # Calculate internal spread
             spread = 0
             if data.get('ask', 0) > 0:
@@ -141,10 +594,12 @@ class BaseExchangeService(ABC):
                 'last': data.get('last', 0),
                 'volume': data.get('volume', 0),
                 'spread': spread,
-                'networks': token_networks
+                'networks': network_labels.get(self.get_base_token(symbol), [])
             })
 
-        return sorted(tokens, key=lambda x: x['symbol'])
+        tokens.sort(key=lambda x: x['symbol'])
+        self._formatted_tokens_cache = (raw_data, networks_data, tokens)
+        return tokens
 
     def clear_cache(self):
         """Clear all cached data"""
@@ -152,6 +607,11 @@ class BaseExchangeService(ABC):
         self._networks_data_cache = {}
         self._trading_cache_time = 0
         self._networks_cache_time = 0
+        self._trading_version += 1
+        self._networks_version += 1
+        self._formatted_tokens_cache = None
+        self._network_labels_cache = None
+        self._payload_cache = {}
         self.logger.info(f"Cleared cache for {self.name}")
 
 
@@ -182,17 +642,43 @@ class ExchangeManager:
         """Get list of registered exchange names"""
         return list(self._exchanges.keys())
 
-    def get_all_trading_data(self) -> Dict[str, Dict]:
-        """Get trading data from all exchanges"""
+    def get_all_trading_data(self, max_age: Optional[float] = None,
+                             wait: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Get trading data from all exchanges
+
+        Args:
+            max_age: Maximum acceptable data age in seconds; stale exchanges are
+                refreshed in parallel and awaited up to a shared wait deadline
+            wait: Seconds to wait for targeted refreshes (default 0)
+        """
+        deadline = None
+        if max_age is not None:
+            for exchange in self._exchanges.values():
+                if not exchange.is_trading_data_fresh(max_age):
+                    exchange.request_trading_refresh()
+            deadline = time.monotonic() + (wait or 0)
+
         data = {}
         for name, exchange in self._exchanges.items():
             try:
-                data[name] = exchange.get_cached_trading_data()
+                if deadline is None:
+                    data[name] = exchange.get_cached_trading_data()
+                else:
+                    data[name] = exchange.get_cached_trading_data(max_age, deadline - time.monotonic())
             except Exception as e:
                 self.logger.error(f"Failed to get trading data from {name}: {e}")
                 data[name] = {}
         return data
 
+    def get_stale_exchanges(self) -> List[str]:
+        """Exchanges currently serving last good trading data after failed fetches"""
+        return [name for name, exchange in self._exchanges.items() if exchange.is_serving_stale()]
+
+    def get_trading_data_times(self) -> Dict[str, Optional[float]]:
+        """Fetch time of each exchange's trading data, None if never fetched"""
+        return {name: exchange._trading_cache_time or None for name, exchange in self._exchanges.items()}
+
     def get_all_networks_data(self) -> Dict[str, Dict]:
         """Get networks data from all exchanges"""
         data = {}
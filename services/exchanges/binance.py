@@ -2,17 +2,25 @@
 Binance exchange service implementation
 """
 import logging
+import threading
 from typing import Dict, List, Any
 from flask import current_app
+import requests
 
 try:
     from binance.client import Client as BinanceClient
+    from binance.exceptions import BinanceRequestException
     BINANCE_AVAILABLE = True
+    # Transport errors worth retrying on another API host (API errors are not)
+    FAILOVER_ERRORS = (requests.exceptions.RequestException, BinanceRequestException)
 except ImportError:
     BINANCE_AVAILABLE = False
     BinanceClient = None
+    FAILOVER_ERRORS = (requests.exceptions.RequestException,)
 
 from .base import BaseExchangeService
+from .parsing import columns_to_quotes, parse_ticker_data
+from ..health import get_health_monitor
 
 
 class BinanceService(BaseExchangeService):
@@ -21,9 +29,17 @@ class BinanceService(BaseExchangeService):
     Handles trading data and network information from Binance API
     """
 
+    API_HOSTS = [
+        'https://api.binance.com', 'https://api-gcp.binance.com', 'https://api1.binance.com',
+        'https://api2.binance.com', 'https://api3.binance.com', 'https://api4.binance.com'
+    ]
+    PROBE_PATH = '/api/v3/ping'
+
     def __init__(self):
         super().__init__('Binance')
         self.client = None
+        # The client's API host is switched per call, so calls on it are serialized
+        self._client_lock = threading.Lock()
         self._initialize_client()
 
     def _initialize_client(self):
@@ -56,41 +72,28 @@ class BinanceService(BaseExchangeService):
         Fetch trading data from Binance API
         Returns normalized trading pairs data for USDT pairs
         """
+        if current_app.config.get('PARSE_POOL_ENABLED', False):
+            # Public endpoint fetched raw so the large body can be parsed in the pool
+            try:
+                response = self._api_get('/api/v3/ticker/24hr', hedge=True)
+                if response.status_code != 200:
+                    return {}
+
+                binance_data = self._parse_tickers('binance', response)
+                self.logger.info(f"Fetched {len(binance_data)} trading pairs from Binance")
+                return binance_data
+            except Exception as e:
+                self.logger.error(f"Error fetching Binance trading data: {e}")
+                return {}
+
         if not self.client:
             self.logger.error("Binance client not available")
             return {}
 
         try:
-            tickers = self.client.get_ticker()
-            binance_data = {}
-
-            for item in tickers:
-                symbol = item['symbol']
-
-                # Filter only USDT pairs
-                if not symbol.endswith('USDT'):
-                    continue
-
-                # Skip if prices are zero
-                bid_price = float(item.get('bidPrice', 0))
-                ask_price = float(item.get('askPrice', 0))
-
-                if bid_price <= 0 or ask_price <= 0:
-                    continue
-
-                normalized_symbol = self.normalize_symbol(symbol)
-
-                binance_data[normalized_symbol] = {
-                    'symbol': item['symbol'],
-                    'bid': bid_price,
-                    'ask': ask_price,
-                    'last': float(item.get('lastPrice', 0)),
-                    'volume': float(item.get('volume', 0)),
-                    'quoteVolume': float(item.get('quoteVolume', 0)),
-                    'priceChange': float(item.get('priceChange', 0)),
-                    'priceChangePercent': float(item.get('priceChangePercent', 0)),
-                    'count': int(item.get('count', 0))
-                }
+            tickers, response = self._client_request('get_ticker')
+            self._note_rate_limit(response)
+            binance_data = columns_to_quotes(parse_ticker_data('binance', tickers))
 
             self.logger.info(f"Fetched {len(binance_data)} trading pairs from Binance")
             return binance_data
@@ -99,6 +102,42 @@ class BinanceService(BaseExchangeService):
             self.logger.error(f"Error fetching Binance trading data: {e}")
             return {}
 
+    def _client_call(self, method: str, *args, **kwargs):
+        """
+        Call a client method on the fastest healthy API host
+        Transport errors fail over to the next host. The host is set on the
+        shared client, so setting it and calling are done under one lock
+        """
+        return self._client_request(method, *args, **kwargs)[0]
+
+    def _client_request(self, method: str, *args, **kwargs):
+        """
+        Call a client method like _client_call
+
+        Returns:
+            Tuple of (result, HTTP response of this call, None if the client keeps none)
+        """
+        error = None
+        for host in self._endpoints.ordered():
+            try:
+                with self._client_lock:
+                    self.client.API_URL = f"{host}/api"
+                    self.client.MARGIN_API_URL = f"{host}/sapi"
+                    # The client keeps only its last response: clear it and read it back under the lock
+                    self.client.response = None
+                    result = getattr(self.client, method)(*args, **kwargs)
+                    response = getattr(self.client, 'response', None)
+            except FAILOVER_ERRORS as e:
+                self.logger.warning(f"Binance API host {host} failed: {e}")
+                self._endpoints.record_failure(host, str(e))
+                error = e
+                continue
+
+            self._endpoints.record_success(host)
+            return result, response
+
+        raise error
+
     def _fetch_networks_data(self) -> Dict[str, List[Dict]]:
         """
         Fetch network information from Binance API
@@ -109,40 +148,46 @@ class BinanceService(BaseExchangeService):
             return {}
 
         try:
-            coins_info = self.client.get_all_coins_info()
-            networks_data = {}
-
-            for coin_info in coins_info:
-                coin = coin_info['coin']
-                networks = []
-
-                for network_info in coin_info.get('networkList', []):
-                    # Parse network information
-                    network = {
-                        'name': network_info['network'],
-                        'deposit': bool(network_info.get('depositEnable', False)),
-                        'withdraw': bool(network_info.get('withdrawEnable', False)),
-                        'fee': str(network_info.get('withdrawFee', '0')),
-                        'min_withdraw': str(network_info.get('withdrawMin', '0')),
-                        'max_withdraw': str(network_info.get('withdrawMax', '0')),
-                        'confirm_times': network_info.get('minConfirm', 0),
-                        'unlock_confirm': network_info.get('unLockConfirm', 0)
-                    }
-
-                    # Additional validation
-                    if network['name'] and (network['deposit'] or network['withdraw']):
-                        networks.append(network)
-
-                if networks:
-                    networks_data[coin] = networks
-
-            self.logger.info(f"Fetched network data for {len(networks_data)} coins from Binance")
-            return networks_data
+            coins_info, response = self._client_request('get_all_coins_info')
+            self._note_rate_limit(response)
+            # The client has already decoded the body; an identical one skips building networks
+            return self._reuse_unchanged('get_all_coins_info', response, lambda: self._parse_networks(coins_info))
 
         except Exception as e:
             self.logger.error(f"Error fetching Binance networks data: {e}")
             return {}
 
+    def _parse_networks(self, coins_info: List[Dict]) -> Dict[str, List[Dict]]:
+        """Build networks data from get_all_coins_info"""
+        networks_data = {}
+
+        for coin_info in coins_info:
+            coin = coin_info['coin']
+            networks = []
+
+            for network_info in coin_info.get('networkList', []):
+                # Parse network information
+                network = {
+                    'name': network_info['network'],
+                    'deposit': bool(network_info.get('depositEnable', False)),
+                    'withdraw': bool(network_info.get('withdrawEnable', False)),
+                    'fee': str(network_info.get('withdrawFee', '0')),
+                    'min_withdraw': str(network_info.get('withdrawMin', '0')),
+                    'max_withdraw': str(network_info.get('withdrawMax', '0')),
+                    'confirm_times': network_info.get('minConfirm', 0),
+                    'unlock_confirm': network_info.get('unLockConfirm', 0)
+                }
+
+                # Additional validation
+                if network['name'] and (network['deposit'] or network['withdraw']):
+                    networks.append(network)
+
+            if networks:
+                networks_data[coin] = networks
+
+        self.logger.info(f"Fetched network data for {len(networks_data)} coins from Binance")
+        return networks_data
+
     def get_account_info(self) -> Dict[str, Any]:
         """
         Get account information (balances, trading status)
@@ -152,7 +197,7 @@ class BinanceService(BaseExchangeService):
             return {}
 
         try:
-            account = self.client.get_account()
+            account = self._client_call('get_account')
 
             # Filter out zero balances
             balances = []
@@ -190,7 +235,7 @@ class BinanceService(BaseExchangeService):
             return {}
 
         try:
-            info = self.client.get_exchange_info()
+            info = self._client_call('get_exchange_info')
 
             # Process symbols information
             symbols_info = {}
@@ -255,10 +300,10 @@ class BinanceService(BaseExchangeService):
 
         try:
             # Test connectivity with ping
-            self.client.ping()
+            self._client_call('ping')
 
             # Test API key with account endpoint
-            account = self.client.get_account()
+            account = self._client_call('get_account')
 
             if account and 'balances' in account:
                 self.logger.info("Binance connection test successful")
@@ -273,17 +318,21 @@ class BinanceService(BaseExchangeService):
     def get_health_status(self) -> Dict[str, Any]:
         """
         Get service health status
+        Connectivity comes from the latest scheduled health probe
         """
-        is_connected = self.test_connection()
+        probe = get_health_monitor().get_status(self.name) or {}
 
         status = {
             'name': self.name,
             'available': BINANCE_AVAILABLE,
             'client_initialized': self.client is not None,
-            'connected': is_connected,
+            'connected': probe.get('connected', False),
+            'latency_ms': probe.get('latency_ms'),
+            'last_checked': probe.get('last_checked'),
+            'last_success': probe.get('last_success'),
             'trading_cache_age': self._get_cache_age('trading'),
             'networks_cache_age': self._get_cache_age('networks'),
-            'last_error': None
+            'last_error': None if probe.get('connected', True) else probe.get('last_error')
         }
 
         return status
@@ -0,0 +1,99 @@
+"""
+Circuit breaker for exchange API calls
+Failing exchanges are not retried on every request; callers keep serving
+the last good data until a trial call succeeds again
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is skipped because the circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit with exponential backoff
+
+    Closed: calls go through. A failure is negatively cached for
+    negative_ttl seconds (no retries meanwhile); failure_threshold
+    consecutive failures open the circuit.
+    Open: calls are skipped for the current backoff, which starts at
+    base_backoff and doubles on every failed trial up to max_backoff.
+    Half-open: after the backoff one trial call is let through; success
+    closes the circuit, failure re-opens it with a longer backoff.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 3, base_backoff: float = 5.0,
+                 max_backoff: float = 300.0, negative_ttl: float = 2.0):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.negative_ttl = negative_ttl
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.backoff = 0.0
+        self.retry_at = 0.0
+        self.last_error: Optional[str] = None
+        self.last_failure: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Check whether a call may be made now (claims the half-open trial)"""
+        with self._lock:
+            now = time.time()
+            if now < self.retry_at:
+                return False
+            if self.state == self.OPEN:
+                self.state = self.HALF_OPEN
+                # Blocks other callers until the trial reports back
+                self.retry_at = now + self.max_backoff
+            return True
+
+    def record_success(self):
+        """Close the circuit after a successful call"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.backoff = 0.0
+            self.retry_at = 0.0
+
+    def record_failure(self, error: str):
+        """Count a failed call, opening the circuit or extending its backoff"""
+        with self._lock:
+            now = time.time()
+            self.failures += 1
+            self.last_error = error
+            self.last_failure = now
+
+            if self.state == self.HALF_OPEN:
+                self.backoff = min(self.backoff * 2 or self.base_backoff, self.max_backoff)
+                self.state = self.OPEN
+            elif self.failures >= self.failure_threshold:
+                self.backoff = self.base_backoff
+                self.state = self.OPEN
+
+            self.retry_at = now + (self.backoff if self.state == self.OPEN else self.negative_ttl)
+
+    @property
+    def is_closed(self) -> bool:
+        """True while calls succeed normally"""
+        return self.state == self.CLOSED and not self.failures
+
+    def get_status(self) -> Dict[str, Any]:
+        """State, failure count, backoff and next retry time"""
+        with self._lock:
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'backoff': self.backoff,
+                'retry_at': self.retry_at or None,
+                'last_error': self.last_error,
+                'last_failure': self.last_failure
+            }
@@ -0,0 +1,89 @@
+"""
+Latency-based selection between equivalent exchange API hosts
+Hosts are probed on the health monitor's schedule; requests go to the
+fastest healthy host and fail over to the next one
+"""
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+class EndpointSelector:
+    """
+    Ranks equivalent API hosts by measured latency
+
+    Probe latency is smoothed with an exponential moving average. A failed
+    request or probe marks the host unhealthy until a later probe or
+    request succeeds. Hosts are ordered healthy-by-latency, then not yet
+    measured (in configured order), then unhealthy, so with no measurements
+    the first configured host is used.
+    """
+
+    def __init__(self, hosts: List[str], alpha: float = 0.3):
+        self.hosts = [host.rstrip('/') for host in hosts]
+        self.alpha = alpha
+        self._state: Dict[str, Dict[str, Any]] = {
+            host: {'latency': None, 'healthy': True, 'failures': 0, 'last_error': None, 'last_probe': None}
+            for host in self.hosts
+        }
+        self._lock = threading.Lock()
+
+    def ordered(self) -> List[str]:
+        """Hosts in the order requests should try them"""
+        with self._lock:
+            def rank(item):
+                index, host = item
+                state = self._state[host]
+                if not state['healthy']:
+                    return (2, state['failures'], index)
+                if state['latency'] is None:
+                    return (1, 0, index)
+                return (0, state['latency'], index)
+
+            return [host for _, host in sorted(enumerate(self.hosts), key=rank)]
+
+    def choose(self) -> Optional[str]:
+        """Fastest healthy host"""
+        ordered = self.ordered()
+        return ordered[0] if ordered else None
+
+    def record_latency(self, host: str, seconds: float):
+        """Record a successful probe of a host"""
+        with self._lock:
+            state = self._state[host]
+            previous = state['latency']
+            state['latency'] = seconds if previous is None else previous + self.alpha * (seconds - previous)
+            state['last_probe'] = time.time()
+            state['healthy'] = True
+            state['failures'] = 0
+
+    def record_success(self, host: str):
+        """Record a successful request to a host"""
+        with self._lock:
+            self._state[host]['healthy'] = True
+            self._state[host]['failures'] = 0
+
+    def record_failure(self, host: str, error: str):
+        """Mark a host unhealthy after a failed request or probe"""
+        with self._lock:
+            state = self._state[host]
+            state['healthy'] = False
+            state['failures'] += 1
+            state['last_error'] = error
+
+    def get_status(self) -> List[Dict[str, Any]]:
+        """Per-host latency (ms) and health in routing order"""
+        ordered = self.ordered()
+        with self._lock:
+            return [
+                {
+                    'host': host,
+                    'latency_ms': round(self._state[host]['latency'] * 1000, 1)
+                    if self._state[host]['latency'] is not None else None,
+                    'healthy': self._state[host]['healthy'],
+                    'failures': self._state[host]['failures'],
+                    'last_error': self._state[host]['last_error'],
+                    'last_probe': self._state[host]['last_probe']
+                }
+                for host in ordered
+            ]
@@ -0,0 +1,146 @@
+"""
+Hedged exchange requests
+A request still unanswered after the exchange's usual latency gets a
+duplicate; whichever answers first is used
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+
+
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+_hedge_executor_lock = threading.Lock()
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    """Get the thread pool running hedged request pairs"""
+    global _hedge_executor
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='hedged-request')
+        return _hedge_executor
+
+
+class LatencyTracker:
+    """Latency percentiles over the last window successful requests"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        """Add a request latency"""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """p-th percentile latency in seconds, None until min_samples are recorded"""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(int(len(ordered) * p / 100), len(ordered) - 1)]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class RequestHedger:
+    """
+    Sends a second identical request when the first is slower than usual
+
+    The hedge delay is the percentile-th latency of recent requests (never
+    below min_delay). Latency of every request, including the losing one of
+    a pair, is recorded so the delay tracks the real distribution. A hedge
+    is only sent when allow_hedge() agrees (the rate budget has room).
+    """
+
+    def __init__(self, enabled: bool = False, percentile: float = 95, min_delay: float = 0.05,
+                 tracker: Optional[LatencyTracker] = None):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.tracker = tracker or LatencyTracker()
+        self._stats = {'requests': 0, 'hedged': 0, 'hedge_wins': 0, 'skipped_budget': 0}
+        self._lock = threading.Lock()
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def _submit(self, send: Callable[[], Any]) -> Future:
+        """Run send on the pool, recording its latency when it succeeds"""
+        start = time.perf_counter()
+        future = _get_hedge_executor().submit(send)
+        future.add_done_callback(
+            lambda f: f.exception() is None and self.tracker.record(time.perf_counter() - start)
+        )
+        return future
+
+    def get_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, None while hedging is off or latency unknown"""
+        if not self.enabled:
+            return None
+        latency = self.tracker.percentile(self.percentile)
+        return max(latency, self.min_delay) if latency is not None else None
+
+    def call(self, send: Callable[[], Any], allow_hedge: Callable[[], bool]) -> Any:
+        """
+        Run send, hedging it with a duplicate when slow
+
+        Args:
+            send: Performs the request and returns the response
+            allow_hedge: Called before sending a hedge; False skips it
+        """
+        self._count('requests')
+        delay = self.get_delay()
+        if delay is None:
+            start = time.perf_counter()
+            result = send()
+            self.tracker.record(time.perf_counter() - start)
+            return result
+
+        primary = self._submit(send)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        if not allow_hedge():
+            self._count('skipped_budget')
+            return primary.result()
+
+        self._count('hedged')
+        hedge = self._submit(send)
+        pending = {primary, hedge}
+        error = None
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self._count('hedge_wins')
+                    return future.result()
+                error = error or future.exception()
+
+        raise error
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Request and hedge counters with current latency percentiles in ms"""
+        with self._lock:
+            stats = dict(self._stats)
+
+        def as_ms(seconds):
+            return round(seconds * 1000, 1) if seconds is not None else None
+
+        stats.update({
+            'enabled': self.enabled,
+            'samples': len(self.tracker),
+            'p50_ms': as_ms(self.tracker.percentile(50)),
+            'p95_ms': as_ms(self.tracker.percentile(95)),
+            'hedge_delay_ms': as_ms(self.get_delay())
+        })
+        return stats
@@ -0,0 +1,40 @@
+"""
+Pooled HTTP sessions for exchange REST APIs
+Each exchange keeps one keep-alive connection pool, so refreshes reuse open
+TCP+TLS connections instead of handshaking on every call
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Transient upstream errors retried on idempotent calls; 429/418 are left to the rate budget
+RETRY_STATUSES = (500, 502, 503, 504)
+
+
+def create_session(pool_size: int = 8, retries: int = 2, backoff: float = 0.3) -> requests.Session:
+    """
+    Create a session with a keep-alive connection pool and retry policy
+
+    Args:
+        pool_size: Connections kept open per host (concurrent refreshes, probes)
+        retries: Retries of failed connects, reads and RETRY_STATUSES responses
+        backoff: Exponential backoff factor between retries in seconds
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({'GET'}),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry, pool_block=False)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'Accept': 'application/json'})
+    return session
@@ -4,7 +4,6 @@ KuCoin exchange service implementation
 import logging
 from typing import Dict, List, Any
 from flask import current_app
-import requests
 
 try:
     from kucoin.client import Client as KucoinClient
@@ -21,6 +20,9 @@ class KucoinService(BaseExchangeService):
     KuCoin exchange service implementation
     """
 
+    API_HOSTS = ['https://api.kucoin.com']
+    PROBE_PATH = '/api/v1/timestamp'
+
     def __init__(self):
         super().__init__('KuCoin')
         self.client = None
@@ -105,60 +107,57 @@ class KucoinService(BaseExchangeService):
     def _fetch_networks_data(self) -> Dict[str, List[Dict]]:
         """Fetch network information from KuCoin API"""
         try:
-            # Use public endpoint for currencies
-            response = requests.get("https://api.kucoin.com/api/v3/currencies", timeout=10)
-
-            if response.status_code != 200:
-                self.logger.error(f"KuCoin networks API returned status {response.status_code}")
-                return {}
+            # Use public endpoint for currencies, unchanged responses are not re-parsed
+            return self._api_get_parsed("/api/v3/currencies", self._parse_networks)
 
-            data = response.json()
-            networks_data = {}
+        except Exception as e:
+            self.logger.error(f"Error fetching KuCoin networks data: {e}")
+            return {}
 
-            if data.get('code') != '200000' or 'data' not in data:
-                self.logger.error("Invalid response from KuCoin currencies API")
-                return {}
+    def _parse_networks(self, data: Dict) -> Dict[str, List[Dict]]:
+        """Build networks data from the currencies API response"""
+        networks_data = {}
 
-            coins_data = data.get('data', [])
-            if not coins_data:
-                return {}
+        if data.get('code') != '200000' or 'data' not in data:
+            self.logger.error("Invalid response from KuCoin currencies API")
+            return {}
 
-            for coin in coins_data:
-                if 'currency' not in coin or 'chains' not in coin:
-                    continue
+        coins_data = data.get('data', [])
+        if not coins_data:
+            return {}
 
-                currency = coin['currency']
-                chains = coin.get('chains', [])
+        for coin in coins_data:
+            if 'currency' not in coin or 'chains' not in coin:
+                continue
 
-                if not chains:
-                    continue
+            currency = coin['currency']
+            chains = coin.get('chains', [])
 
-                networks = []
-                for chain in chains:
-                    if 'chainName' not in chain:
-                        continue
+            if not chains:
+                continue
 
-                    network = {
-                        'name': chain['chainName'],
-                        'deposit': chain.get('isDepositEnabled', False),
-                        'withdraw': chain.get('isWithdrawEnabled', False),
-                        'fee': str(chain.get('withdrawalMinFee', '0')),
-                        'min_withdraw': str(chain.get('withdrawalMinSize', '0')),
-                        'confirm_times': int(chain.get('confirms', 0))
-                    }
+            networks = []
+            for chain in chains:
+                if 'chainName' not in chain:
+                    continue
 
-                    if network['name'] and (network['deposit'] or network['withdraw']):
-                        networks.append(network)
+                network = {
+                    'name': chain['chainName'],
+                    'deposit': chain.get('isDepositEnabled', False),
+                    'withdraw': chain.get('isWithdrawEnabled', False),
+                    'fee': str(chain.get('withdrawalMinFee', '0')),
+                    'min_withdraw': str(chain.get('withdrawalMinSize', '0')),
+                    'confirm_times': int(chain.get('confirms', 0))
+                }
 
-                if networks:
-                    networks_data[currency] = networks
+                if network['name'] and (network['deposit'] or network['withdraw']):
+                    networks.append(network)
 
-            self.logger.info(f"Fetched network data for {len(networks_data)} coins from KuCoin")
-            return networks_data
+            if networks:
+                networks_data[currency] = networks
 
-        except Exception as e:
-            self.logger.error(f"Error fetching KuCoin networks data: {e}")
-            return {}
+        self.logger.info(f"Fetched network data for {len(networks_data)} coins from KuCoin")
+        return networks_data
 
     def test_connection(self) -> bool:
         """Test API connection"""
@@ -0,0 +1,190 @@
+"""
+Ticker response parsing for exchange adapters
+Raw ticker JSON is turned into compact columns (symbol lists and float
+arrays), optionally in a process pool so decoding large responses does not
+hold the GIL of serving threads
+"""
+import json
+import logging
+import multiprocessing
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.helpers import normalize_symbol
+
+
+logger = logging.getLogger(__name__)
+
+# Quote fields stored as integers
+INT_FIELDS = {'count'}
+
+
+def _price(value) -> float:
+    """First element of [price, size] pairs, the value itself otherwise"""
+    return float(value[0]) if isinstance(value, list) else float(value)
+
+
+def _parse_binance(item: Dict) -> Optional[Tuple]:
+    symbol = item['symbol']
+    if not symbol.endswith('USDT'):
+        return None
+    bid_price = float(item.get('bidPrice', 0))
+    ask_price = float(item.get('askPrice', 0))
+    if bid_price <= 0 or ask_price <= 0:
+        return None
+    return symbol, symbol, (
+        bid_price, ask_price, float(item.get('lastPrice', 0)), float(item.get('volume', 0)),
+        float(item.get('quoteVolume', 0)), float(item.get('priceChange', 0)),
+        float(item.get('priceChangePercent', 0)), int(item.get('count', 0))
+    )
+
+
+def _parse_gateio(item: Dict) -> Optional[Tuple]:
+    symbol = item['currency_pair'].replace('_', '')
+    if not symbol.endswith('USDT'):
+        return None
+    try:
+        bid_price = float(item.get('bid', '0'))
+        ask_price = float(item.get('ask', '0'))
+        if bid_price <= 0 or ask_price <= 0:
+            return None
+        return item['currency_pair'], symbol, (
+            bid_price, ask_price, float(item.get('last', 0)), float(item.get('quote_volume', 0))
+        )
+    except ValueError:
+        return None
+
+
+def _parse_huobi(item: Dict) -> Optional[Tuple]:
+    symbol = item['symbol'].upper()
+    if not symbol.endswith('USDT'):
+        return None
+    try:
+        bid = _price(item['bid'])
+        ask = _price(item['ask'])
+        if bid <= 0 or ask <= 0:
+            return None
+        return item['symbol'], symbol, (bid, ask, float(item.get('close', 0)), float(item.get('vol', 0)))
+    except (ValueError, TypeError, IndexError):
+        return None
+
+
+def _parse_mexc(item: Dict) -> Optional[Tuple]:
+    symbol = item.get('symbol', '')
+    if not symbol.endswith('USDT'):
+        return None
+    try:
+        bid_price = float(item.get('bidPrice', 0))
+        ask_price = float(item.get('askPrice', 0))
+        if bid_price <= 0 or ask_price <= 0:
+            return None
+        return symbol, symbol, (bid_price, ask_price, float(item.get('lastPrice', 0)), float(item.get('volume', 0)))
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_bitget(item: Dict) -> Optional[Tuple]:
+    symbol = item['symbol'].replace('_', '')
+    if not symbol.endswith('USDT'):
+        return None
+    try:
+        bid_price = float(item['bidPrice'])
+        ask_price = float(item['askPrice'])
+        if bid_price <= 0 or ask_price <= 0:
+            return None
+        return item['symbol'], symbol, (bid_price, ask_price, float(item.get('close', 0)), float(item.get('volume', 0)))
+    except (ValueError, TypeError):
+        return None
+
+
+def _top_level(data):
+    return data
+
+
+def _data_envelope(data):
+    return data.get('data', [])
+
+
+# Ticker format: (items of the decoded response, item parser, quote fields)
+TICKER_FORMATS: Dict[str, Tuple[Callable, Callable, Tuple[str, ...]]] = {
+    'binance': (_top_level, _parse_binance, (
+        'bid', 'ask', 'last', 'volume', 'quoteVolume', 'priceChange', 'priceChangePercent', 'count'
+    )),
+    'gateio': (_top_level, _parse_gateio, ('bid', 'ask', 'last', 'volume')),
+    'huobi': (_data_envelope, _parse_huobi, ('bid', 'ask', 'last', 'volume')),
+    'mexc': (_top_level, _parse_mexc, ('bid', 'ask', 'last', 'volume')),
+    'bitget': (_data_envelope, _parse_bitget, ('bid', 'ask', 'last', 'volume')),
+}
+
+
+def parse_ticker_data(fmt: str, data: Any) -> Dict[str, Any]:
+    """
+    Parse a decoded ticker response into columns
+
+    Returns:
+        Dict with 'symbols' (normalized), 'raw_symbols' and 'columns'
+        (field -> array of values, in symbol order)
+    """
+    extract, parse_item, fields = TICKER_FORMATS[fmt]
+    symbols: List[str] = []
+    raw_symbols: List[str] = []
+    columns = {field: array('q' if field in INT_FIELDS else 'd') for field in fields}
+    appenders = [columns[field].append for field in fields]
+
+    for item in extract(data):
+        parsed = parse_item(item)
+        if parsed is None:
+            continue
+        raw_symbol, symbol, values = parsed
+        symbols.append(normalize_symbol(symbol))
+        raw_symbols.append(raw_symbol)
+        for append, value in zip(appenders, values):
+            append(value)
+
+    return {'symbols': symbols, 'raw_symbols': raw_symbols, 'columns': columns}
+
+
+def parse_ticker_payload(fmt: str, payload: bytes) -> Dict[str, Any]:
+    """Decode and parse a raw ticker response body (process pool entry point)"""
+    return parse_ticker_data(fmt, json.loads(payload))
+
+
+def columns_to_quotes(parsed: Dict[str, Any]) -> Dict[str, Dict]:
+    """Build the adapter trading data dict (normalized symbol -> quote) from columns"""
+    names = list(parsed['columns'])
+    rows = zip(parsed['raw_symbols'], *parsed['columns'].values())
+    return {
+        symbol: {'symbol': raw_symbol, **dict(zip(names, values))}
+        for symbol, (raw_symbol, *values) in zip(parsed['symbols'], rows)
+    }
+
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_parse_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Get the parsing process pool, created on first use
+    Workers are spawned (not forked) so they never inherit server threads or locks
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=workers or None,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            logger.info(f"Started ticker parsing pool with {_parse_pool._max_workers} workers")
+        return _parse_pool
+
+
+def shutdown_parse_pool():
+    """Stop the parsing process pool"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(wait=False, cancel_futures=True)
+            _parse_pool = None
@@ -0,0 +1,212 @@
+"""
+Client-side rate-limit budgets for exchange APIs
+Each exchange gets a token bucket sized to its published limit; calls spend
+their endpoint weight and usage reported in response headers corrects the bucket
+"""
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+
+class RateBudgetExceeded(RuntimeError):
+    """Raised when a call is deferred because the exchange's rate budget is spent"""
+
+    def __init__(self, message: str, retry_in: float):
+        super().__init__(message)
+        self.retry_in = retry_in
+
+
+# Published IP limits and weights of the endpoints behind each fetch kind
+# capacity: weight per window seconds; headers report used weight or remaining requests
+EXCHANGE_RATE_LIMITS = {
+    'Binance': {
+        'capacity': 6000, 'window': 60,
+        'used_weight_header': 'X-MBX-USED-WEIGHT-1M',
+        # /api/v3/ticker/24hr without symbol, /sapi/v1/capital/config/getall
+        'weights': {'trading': 80, 'networks': 10, 'ping': 1, 'account': 20, 'exchange_info': 20}
+    },
+    'Bybit': {
+        'capacity': 600, 'window': 5,
+        'remaining_header': 'X-Bapi-Limit-Status',
+        'limit_header': 'X-Bapi-Limit',
+        'weights': {'trading': 1, 'networks': 1, 'ping': 1}
+    },
+    'KuCoin': {
+        'capacity': 2000, 'window': 30,
+        'remaining_header': 'gw-ratelimit-remaining',
+        'limit_header': 'gw-ratelimit-limit',
+        # /api/v1/market/allTickers, /api/v3/currencies
+        'weights': {'trading': 15, 'networks': 3, 'ping': 1}
+    },
+    'Gate.io': {
+        'capacity': 200, 'window': 10,
+        'remaining_header': 'X-Gate-RateLimit-Requests-Remain',
+        'limit_header': 'X-Gate-RateLimit-Limit',
+        'weights': {'trading': 1, 'networks': 1, 'ping': 1}
+    },
+    'Huobi': {
+        'capacity': 100, 'window': 10,
+        'remaining_header': 'X-HB-RateLimit-Requests-Remain',
+        'weights': {'trading': 1, 'networks': 1, 'ping': 1}
+    },
+    'MEXC': {
+        'capacity': 500, 'window': 10,
+        # /api/v3/ticker/24hr without symbol
+        'weights': {'trading': 40, 'networks': 10, 'ping': 1}
+    },
+    'Bitget': {
+        'capacity': 20, 'window': 1,
+        'remaining_header': 'x-mbx-used-remain-limit',
+        'weights': {'trading': 1, 'networks': 1, 'ping': 1}
+    }
+}
+
+DEFAULT_RATE_LIMIT = {'capacity': 100, 'window': 10, 'weights': {}}
+
+
+def _get_header(headers: Mapping, name: Optional[str]) -> Optional[float]:
+    """Numeric header value, case-insensitive, None if missing or not a number"""
+    if not name:
+        return None
+    value = headers.get(name)
+    if value is None:
+        lowered = name.lower()
+        value = next((v for k, v in headers.items() if k.lower() == lowered), None)
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class RateBudget:
+    """
+    Token bucket of one exchange's API weight
+
+    The bucket holds up to capacity weight and refills at capacity/window per
+    second. A safety fraction of the capacity is never spent so clock skew
+    and calls made outside this process don't push us over the limit.
+    Exchange headers are authoritative: used-weight or remaining counts
+    reset the bucket level, and 429/418 responses empty it until Retry-After.
+    """
+
+    def __init__(self, capacity: float, window: float, weights: Optional[Dict[str, float]] = None,
+                 safety: float = 0.9, used_weight_header: Optional[str] = None,
+                 remaining_header: Optional[str] = None, limit_header: Optional[str] = None):
+        self.capacity = float(capacity)
+        self.window = float(window)
+        self.weights = weights or {}
+        self.safety = safety
+        self.used_weight_header = used_weight_header
+        self.remaining_header = remaining_header
+        self.limit_header = limit_header
+
+        self.tokens = self.capacity
+        self.blocked_until = 0.0
+        self.spent = 0.0
+        self.deferred = 0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_exchange(cls, name: str, safety: float = 0.9) -> 'RateBudget':
+        """Budget with the published limits of an exchange"""
+        limits = EXCHANGE_RATE_LIMITS.get(name, DEFAULT_RATE_LIMIT)
+        return cls(
+            limits['capacity'], limits['window'], dict(limits['weights']), safety=safety,
+            used_weight_header=limits.get('used_weight_header'),
+            remaining_header=limits.get('remaining_header'),
+            limit_header=limits.get('limit_header')
+        )
+
+    @property
+    def refill_rate(self) -> float:
+        """Weight regained per second"""
+        return self.capacity / self.window
+
+    def _refill(self, now: float):
+        """Add weight regained since the last update (lock held)"""
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    def _wait_time(self, weight: float, now: float) -> float:
+        """Seconds until weight can be spent (lock held)"""
+        reserve = self.capacity * (1 - self.safety)
+        missing = weight + reserve - self.tokens
+        wait = missing / self.refill_rate if missing > 0 else 0.0
+        return max(wait, self.blocked_until - time.time(), 0.0)
+
+    def get_weight(self, endpoint: str) -> float:
+        """Weight of an endpoint (1 if not listed)"""
+        return self.weights.get(endpoint, 1)
+
+    def time_until_available(self, endpoint: str) -> float:
+        """Seconds until a call to endpoint fits the budget, 0 if it may run now"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return self._wait_time(self.get_weight(endpoint), now)
+
+    def try_acquire(self, endpoint: str) -> bool:
+        """Spend the endpoint's weight if it fits the budget now"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            weight = self.get_weight(endpoint)
+            if self._wait_time(weight, now) > 0:
+                self.deferred += 1
+                return False
+            self.tokens -= weight
+            self.spent += weight
+            return True
+
+    def spend(self, endpoint: str):
+        """Spend the endpoint's weight unconditionally (after time_until_available() returned 0)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            weight = self.get_weight(endpoint)
+            self.tokens -= weight
+            self.spent += weight
+
+    def record_deferral(self):
+        """Count a call deferred for lack of budget"""
+        with self._lock:
+            self.deferred += 1
+
+    def update_from_headers(self, headers: Optional[Mapping], status_code: Optional[int] = None):
+        """Correct the bucket from exchange rate-limit headers and throttling responses"""
+        headers = headers or {}
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            limit = _get_header(headers, self.limit_header)
+            if limit:
+                self.capacity = limit
+
+            used = _get_header(headers, self.used_weight_header)
+            if used is not None:
+                self.tokens = min(max(self.capacity - used, 0.0), self.capacity)
+
+            remaining = _get_header(headers, self.remaining_header)
+            if remaining is not None:
+                self.tokens = min(max(remaining, 0.0), self.capacity)
+
+            if status_code in (418, 429):
+                retry_after = _get_header(headers, 'Retry-After') or self.window
+                self.tokens = 0.0
+                self.blocked_until = max(self.blocked_until, time.time() + retry_after)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Bucket level, limits, spent weight and deferred calls"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                'capacity': self.capacity,
+                'window': self.window,
+                'available': round(self.tokens, 2),
+                'usable': round(max(self.tokens - self.capacity * (1 - self.safety), 0.0), 2),
+                'blocked_until': self.blocked_until or None,
+                'spent': self.spent,
+                'deferred': self.deferred,
+                'weights': dict(self.weights)
+            }
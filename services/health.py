@@ -0,0 +1,139 @@
+"""
+Exchange health probes
+Exchanges are checked on a schedule in the background; health and status
+endpoints read the stored results instead of calling exchanges per request
+"""
+import copy
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from .exchanges.base import get_exchange_manager
+
+
+logger = logging.getLogger(__name__)
+
+
+class HealthMonitor:
+    """
+    Scheduled connectivity probes with stored results
+
+    Every interval seconds each registered exchange's test_connection() is
+    run (in parallel, inside the app context) and its outcome recorded:
+    connected flag, latency, last check, last success, last error and the
+    number of consecutive failures. Exchanges with several API hosts also
+    get their hosts' latency measured.
+    """
+
+    def __init__(self):
+        self.interval: float = 60
+        self._results: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def probe(self, service) -> Dict:
+        """Run one probe of an exchange service and record the result"""
+        start = time.perf_counter()
+        error = None
+        try:
+            connected = bool(service.test_connection())
+            if not connected:
+                error = 'Connection test failed'
+        except Exception as e:
+            connected = False
+            error = str(e)
+        latency_ms = round((time.perf_counter() - start) * 1000, 1)
+
+        # Re-rank equivalent API hosts of the exchange on the same schedule
+        probe_endpoints = getattr(service, 'probe_endpoints', None)
+        if probe_endpoints is not None:
+            try:
+                probe_endpoints()
+            except Exception as e:
+                logger.warning(f"Endpoint probes failed for {service.name}: {e}")
+
+        with self._lock:
+            previous = self._results.get(service.name, {})
+            now = time.time()
+            result = {
+                'name': service.name,
+                'connected': connected,
+                'latency_ms': latency_ms,
+                'last_checked': now,
+                'last_success': now if connected else previous.get('last_success'),
+                'last_error': error if error else previous.get('last_error'),
+                'consecutive_failures': 0 if connected else previous.get('consecutive_failures', 0) + 1
+            }
+            self._results[service.name] = result
+
+        if not connected:
+            logger.warning(f"Health probe failed for {service.name}: {error}")
+        return dict(result)
+
+    def probe_all(self, app) -> Dict[str, Dict]:
+        """Probe all registered exchanges in parallel"""
+        exchanges = get_exchange_manager().get_all_exchanges()
+        if not exchanges:
+            return {}
+
+        def run(service):
+            with app.app_context():
+                return self.probe(service)
+
+        with ThreadPoolExecutor(max_workers=len(exchanges), thread_name_prefix='health-probe') as executor:
+            results = list(executor.map(run, exchanges.values()))
+        return {result['name']: result for result in results}
+
+    def start(self, app, interval: Optional[float] = None):
+        """Start the background probe thread (idempotent)"""
+        if interval is not None:
+            self.interval = interval
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(app,), name='health-monitor', daemon=True)
+        self._thread.start()
+        logger.info(f"Health monitor started, probing every {self.interval}s")
+
+    def stop(self):
+        """Stop the background probe thread"""
+        self._stop.set()
+
+    def _run(self, app):
+        """Probe loop"""
+        while not self._stop.is_set():
+            try:
+                self.probe_all(app)
+            except Exception as e:
+                logger.error(f"Health probe round failed: {e}")
+            self._stop.wait(self.interval)
+
+    def get_status(self, name: str) -> Optional[Dict]:
+        """Latest probe result of an exchange, None if not probed yet"""
+        with self._lock:
+            result = self._results.get(name)
+            return dict(result) if result is not None else None
+
+    def get_all(self) -> Dict[str, Dict]:
+        """Latest probe results of all exchanges"""
+        with self._lock:
+            return copy.deepcopy(self._results)
+
+
+# Global health monitor instance
+health_monitor = HealthMonitor()
+
+
+def get_health_monitor() -> HealthMonitor:
+    """Get the global health monitor instance"""
+    return health_monitor
+
+
+def init_health_monitor(app):
+    """Start scheduled health probes unless disabled by HEALTH_PROBE_ENABLED or testing"""
+    if app.config.get('HEALTH_PROBE_ENABLED', True) and not app.testing:
+        health_monitor.start(app, app.config.get('HEALTH_PROBE_INTERVAL', 60))
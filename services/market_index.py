@@ -0,0 +1,278 @@
+"""
+Indexes derived from a market snapshot
+Built once per snapshot so per-request work is reduced to lookups and top-K selection
+"""
+import heapq
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from .exchanges.base import BaseExchangeService
+
+
+def calculate_internal_spread(data: Dict) -> float:
+    """Bid/ask spread of a single market in percent"""
+    ask = data.get('ask', 0)
+    if ask > 0:
+        return ((data.get('bid', 0) - ask) / ask) * 100
+    return 0
+
+
+class SymbolSearchIndex:
+    """
+    Inverted index over symbols of all exchanges
+
+    Every (exchange, symbol) market is a row with precomputed volume and
+    spread columns. Symbols get integer IDs; n-gram and sorted-prefix
+    lookups resolve a query to symbol IDs, and per-exchange posting lists
+    map symbol IDs to rows.
+    """
+
+    # Grams up to this length are indexed; longer queries intersect trigrams
+    MAX_GRAM = 3
+
+    def __init__(self):
+        self.rows: List[Dict] = []
+        self.volumes: List[float] = []
+        self.spreads: List[float] = []
+        self.price_changes: List[float] = []
+
+        self.symbols: List[str] = []
+        self.symbol_ids: Dict[str, int] = {}
+        self.symbol_rows: List[List[int]] = []
+        self.postings: Dict[str, Dict[int, int]] = {}
+
+        self.grams: Dict[str, set] = defaultdict(set)
+        self._sorted_symbols: List[str] = []
+        self._sorted_ids: List[int] = []
+
+    @classmethod
+    def build(cls, snapshot) -> 'SymbolSearchIndex':
+        """Build index from a MarketSnapshot"""
+        index = cls()
+
+        for exchange_name, trading_data in snapshot.trading_data.items():
+            postings = index.postings.setdefault(exchange_name.lower(), {})
+
+            for symbol, data in trading_data.items():
+                symbol_id = index._get_symbol_id(symbol)
+                spread = calculate_internal_spread(data)
+                volume = data.get('volume', 0)
+                price_change = data.get('priceChangePercent', 0)
+
+                row_id = len(index.rows)
+                index.rows.append({
+                    'symbol': symbol,
+                    'exchange': exchange_name,
+                    'bid': data.get('bid', 0),
+                    'ask': data.get('ask', 0),
+                    'last': data.get('last', 0),
+                    'volume': volume,
+                    'spread': spread,
+                    'price_change': price_change
+                })
+                index.volumes.append(volume)
+                index.spreads.append(spread)
+                index.price_changes.append(price_change)
+
+                postings[symbol_id] = row_id
+                index.symbol_rows[symbol_id].append(row_id)
+
+        ordered = sorted(range(len(index.symbols)), key=index.symbols.__getitem__)
+        index._sorted_symbols = [index.symbols[i] for i in ordered]
+        index._sorted_ids = ordered
+
+        return index
+
+    def _get_symbol_id(self, symbol: str) -> int:
+        """Get ID of a symbol, registering it and its n-grams on first sight"""
+        symbol_id = self.symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self.symbols)
+            self.symbols.append(symbol)
+            self.symbol_ids[symbol] = symbol_id
+            self.symbol_rows.append([])
+
+            for size in range(1, self.MAX_GRAM + 1):
+                for start in range(len(symbol) - size + 1):
+                    self.grams[symbol[start:start + size]].add(symbol_id)
+
+        return symbol_id
+
+    def match_prefix(self, prefix: str) -> List[int]:
+        """Symbol IDs of symbols starting with prefix"""
+        start = bisect_left(self._sorted_symbols, prefix)
+        end = bisect_left(self._sorted_symbols, prefix + '\uffff', start)
+        return self._sorted_ids[start:end]
+
+    def match_substring(self, query: str):
+        """Symbol IDs of symbols containing query"""
+        if len(query) <= self.MAX_GRAM:
+            return self.grams.get(query, ())
+
+        trigrams = sorted(
+            (self.grams.get(query[i:i + self.MAX_GRAM], set()) for i in range(len(query) - self.MAX_GRAM + 1)),
+            key=len
+        )
+        candidates = set.intersection(*trigrams) if trigrams[0] else set()
+        return [sid for sid in candidates if query in self.symbols[sid]]
+
+    def search(
+            self,
+            query: str,
+            exchange: Optional[str] = None,
+            min_volume: float = 0,
+            sort_by: str = 'volume',
+            limit: int = 100,
+            match: str = 'substring'
+    ) -> Tuple[List[Dict], int]:
+        """
+        Search markets by symbol
+
+        Args:
+            query: Upper-case search string
+            exchange: Only markets of this exchange (case insensitive)
+            min_volume: Minimum 24h volume
+            sort_by: 'volume', 'spread' or 'symbol' (any other value keeps index order)
+            limit: Maximum rows returned
+            match: 'substring' or 'prefix'
+
+        Returns:
+            Tuple of (top rows, total number of matching rows)
+        """
+        symbol_ids = self.match_prefix(query) if match == 'prefix' else self.match_substring(query)
+
+        if exchange:
+            postings = self.postings.get(exchange.lower(), {})
+            row_ids = [postings[sid] for sid in symbol_ids if sid in postings]
+        else:
+            row_ids = [row_id for sid in symbol_ids for row_id in self.symbol_rows[sid]]
+
+        if min_volume:
+            volumes = self.volumes
+            row_ids = [row_id for row_id in row_ids if volumes[row_id] >= min_volume]
+
+        total = len(row_ids)
+        limit = max(limit, 0)
+
+        # Row ID is the tie-breaker so ordering matches a stable sort over exchanges
+        if sort_by == 'volume':
+            volumes = self.volumes
+            top = heapq.nsmallest(limit, row_ids, key=lambda r: (-volumes[r], r))
+        elif sort_by == 'spread':
+            spreads = self.spreads
+            top = heapq.nsmallest(limit, row_ids, key=lambda r: (-spreads[r], r))
+        elif sort_by == 'symbol':
+            rows = self.rows
+            top = heapq.nsmallest(limit, row_ids, key=lambda r: (rows[r]['symbol'], r))
+        else:
+            top = heapq.nsmallest(limit, row_ids)
+
+        return [self.rows[row_id] for row_id in top], total
+
+
+class TokenRankings:
+    """
+    Ranked views of snapshot markets by volume, |price change| and |spread|
+
+    Each (metric, exchange) view is computed once per snapshot with a
+    partial sort down to DEPTH rows; requests deeper than that trigger a
+    full sort that is cached as well. Serving a request is a slice.
+    """
+
+    DEPTH = 500
+
+    def __init__(self, index: SymbolSearchIndex):
+        self.index = index
+        self.metric_columns = {
+            'volume': index.volumes,
+            'price_change': [abs(value) for value in index.price_changes],
+            'spread': [abs(value) for value in index.spreads]
+        }
+        self._views: Dict[Tuple, List[int]] = {}
+
+    @classmethod
+    def build(cls, snapshot) -> 'TokenRankings':
+        """Build rankings on top of the snapshot's search index"""
+        return cls(snapshot.search_index)
+
+    def _candidate_rows(self, exchange: Optional[str]) -> List[int]:
+        """Row IDs of one exchange (in index order) or all rows"""
+        if exchange:
+            return list(self.index.postings.get(exchange.lower(), {}).values())
+        return list(range(len(self.index.rows)))
+
+    def _get_view(self, metric: str, exchange: Optional[str], depth: Optional[int]) -> List[int]:
+        """
+        Ranked row IDs, limited to depth rows (None for a full ranking)
+        Views are cached only for listed exchanges and known metrics, so
+        arbitrary request values cannot grow the cache
+        """
+        if exchange and exchange.lower() not in self.index.postings:
+            return []
+        if metric not in self.metric_columns:
+            metric = None
+        key = (metric, exchange.lower() if exchange else None, depth)
+        view = self._views.get(key)
+
+        if view is None:
+            rows = self._candidate_rows(exchange)
+            column = self.metric_columns.get(metric)
+
+            # Row ID breaks ties so order matches a stable descending sort
+            if column is None:
+                view = rows
+            elif depth is None:
+                view = sorted(rows, key=lambda r: (-column[r], r))
+            else:
+                view = heapq.nsmallest(depth, rows, key=lambda r: (-column[r], r))
+
+            self._views[key] = view
+
+        return view
+
+    def top(self, metric: str = 'volume', limit: int = 20, exchange: Optional[str] = None) -> Tuple[List[Dict], int]:
+        """
+        Top markets by metric
+
+        Args:
+            metric: 'volume', 'price_change' or 'spread' (any other value keeps index order)
+            limit: Maximum rows returned
+            exchange: Only markets of this exchange (case insensitive)
+
+        Returns:
+            Tuple of (top rows, number of ranked markets)
+        """
+        limit = max(limit, 0)
+        total = len(self.index.postings.get(exchange.lower(), {})) if exchange else len(self.index.rows)
+
+        view = self._get_view(metric, exchange, self.DEPTH if limit <= self.DEPTH else None)
+        rows = self.index.rows
+        return [rows[row_id] for row_id in view[:limit]], total
+
+
+class QuoteIndex:
+    """
+    Cross-exchange quote index keyed by canonical (normalized) symbol
+    One lookup returns the quotes of every exchange listing the symbol
+    """
+
+    def __init__(self, quotes: Dict[str, Dict[str, Dict]]):
+        self.quotes = quotes
+
+    @classmethod
+    def build(cls, snapshot) -> 'QuoteIndex':
+        """Build index from a MarketSnapshot"""
+        quotes = defaultdict(dict)
+        normalize = BaseExchangeService.normalize_symbol
+
+        for exchange_name, trading_data in snapshot.trading_data.items():
+            for symbol, data in trading_data.items():
+                # First listing wins when several exchange symbols normalize alike
+                quotes[normalize(symbol)].setdefault(exchange_name, data)
+
+        return cls(dict(quotes))
+
+    def lookup(self, symbol: str) -> Dict[str, Dict]:
+        """Quotes for a symbol keyed by exchange name"""
+        return self.quotes.get(BaseExchangeService.normalize_symbol(symbol), {})
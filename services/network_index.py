@@ -0,0 +1,397 @@
+"""
+Materialized index over withdrawal networks of all exchanges
+Maintained incrementally: when an exchange's networks cache refreshes only
+that exchange's contribution is recomputed
+"""
+import logging
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional
+
+from .exchanges.base import get_exchange_manager
+
+
+logger = logging.getLogger(__name__)
+
+
+def parse_fee(value) -> Optional[float]:
+    """Parse exchange fee value, None when it is not numeric"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+class NetworkIndex:
+    """
+    Withdrawal fee index and network aggregates
+
+    For every token keeps the withdraw-enabled options of all exchanges with
+    fees parsed once and sorted by fee (non-numeric fees sort as 0, exchange
+    registration order breaks ties). Cheapest-option lists are derived
+    lazily and cached until the next networks refresh.
+
+    Per-network coverage (exchanges, tokens, pairs) and per-exchange
+    deposit/withdraw counts are kept as reference-counted aggregates, so an
+    exchange refresh subtracts its old contribution and adds the new one.
+
+    version is bumped whenever the index changes, so callers can key their
+    own derived values on it. Readers build and cache views under the same
+    lock sync() updates the index with, so a view never mixes two syncs.
+    """
+
+    # Maximum number of cached network-filtered cheapest lists
+    MAX_FILTER_CACHE = 64
+
+    def __init__(self):
+        self.version = 0
+        self._lock = threading.Lock()
+        self._exchange_order: List[str] = []
+        self._sources: Dict[str, Dict] = {}
+        self._withdraw_options: Dict[str, Dict[str, List[Dict]]] = {}
+
+        self._token_options: Dict[str, List[Dict]] = {}
+        self._cheapest_cache: Dict[Optional[str], List[Dict]] = {}
+        self._network_names: Dict[str, Dict[str, str]] = {}
+        self._token_networks_cache: Dict[str, List[Dict]] = {}
+
+        # Aggregates
+        self._contributions: Dict[str, Dict[str, Any]] = {}
+        self._network_exchanges: Dict[str, Counter] = defaultdict(Counter)
+        self._network_tokens: Dict[str, Counter] = defaultdict(Counter)
+        self._network_pairs: Counter = Counter()
+        self._token_refs: Counter = Counter()
+        self._exchange_status: Dict[str, Dict] = {}
+        self._supported_cache: Optional[List[Dict]] = None
+        self._status_cache: Optional[Dict] = None
+
+    def sync(self, exchanges: Optional[Dict] = None) -> 'NetworkIndex':
+        """
+        Apply networks data of exchanges whose cache changed since last sync
+
+        Args:
+            exchanges: Exchange services by name (registered exchanges if None)
+        """
+        if exchanges is None:
+            exchanges = get_exchange_manager().get_all_exchanges()
+
+        current = {}
+        errors = {}
+        for name, service in exchanges.items():
+            try:
+                current[name] = service.get_cached_networks_data()
+            except Exception as e:
+                logger.warning(f"Error getting networks for {name}: {e}")
+                current[name] = {}
+                errors[name] = str(e)
+
+        with self._lock:
+            if not self._is_synced(current):
+                if list(current) != self._exchange_order:
+                    self._exchange_order = list(current)
+                    for token in list(self._token_options):
+                        self._merge_token(token)
+                    self._invalidate()
+
+                for name in [name for name in self._sources if name not in current]:
+                    self._apply_exchange(name, None)
+
+                for name, networks_data in current.items():
+                    if self._sources.get(name) is not networks_data:
+                        self._apply_exchange(
+                            name,
+                            networks_data,
+                            last_updated=getattr(exchanges[name], '_networks_cache_time', None),
+                            error=errors.get(name)
+                        )
+
+            self._refresh_last_updated(exchanges)
+
+        return self
+
+    def _refresh_last_updated(self, exchanges: Dict):
+        """Advance status fetch times of exchanges whose unchanged networks were re-fetched"""
+        for name, service in exchanges.items():
+            status = self._exchange_status.get(name)
+            last_updated = getattr(service, '_networks_cache_time', None)
+            if status is not None and status['last_updated'] != last_updated:
+                status['last_updated'] = last_updated
+                self._status_cache = None
+
+    def _is_synced(self, current: Dict[str, Dict]) -> bool:
+        """Check whether the index was built from exactly these networks caches"""
+        if list(current) != self._exchange_order or current.keys() != self._sources.keys():
+            return False
+        return all(self._sources[name] is data for name, data in current.items())
+
+    def _invalidate(self):
+        """Drop cached views derived from the index"""
+        self.version += 1
+        self._cheapest_cache = {}
+        self._token_networks_cache = {}
+        self._supported_cache = None
+        self._status_cache = None
+
+    def _apply_exchange(
+            self,
+            exchange_name: str,
+            networks_data: Optional[Dict[str, List[Dict]]],
+            last_updated: Optional[float] = None,
+            error: Optional[str] = None
+    ):
+        """Recompute one exchange's contribution and re-merge the tokens it touches"""
+        old_options = self._withdraw_options.pop(exchange_name, {})
+        self._sources.pop(exchange_name, None)
+        self._network_names.pop(exchange_name, None)
+        self._remove_contribution(exchange_name)
+
+        new_options = {}
+        if networks_data is not None:
+            self._sources[exchange_name] = networks_data
+            new_options = self._build_withdraw_options(exchange_name, networks_data)
+            self._withdraw_options[exchange_name] = new_options
+            self._network_names[exchange_name] = {
+                token: ', '.join(sorted({network.get('name', '') for network in networks}))
+                for token, networks in networks_data.items() if networks
+            }
+            self._add_contribution(exchange_name, networks_data, last_updated, error)
+
+        for token in old_options.keys() | new_options.keys():
+            self._merge_token(token)
+
+        self._invalidate()
+        logger.debug(f"Network index updated for {exchange_name}")
+
+    def _add_contribution(self, exchange_name: str, networks_data: Dict[str, List[Dict]],
+                          last_updated: Optional[float], error: Optional[str]):
+        """Add one exchange's networks to the aggregates"""
+        coverage = defaultdict(set)
+        pairs = Counter()
+        status = {
+            'tokens': len(networks_data),
+            'total_networks': 0,
+            'deposit_enabled': 0,
+            'withdraw_enabled': 0,
+            'last_updated': last_updated
+        }
+        if error:
+            status['error'] = error
+
+        for token, networks in networks_data.items():
+            for network in networks:
+                network_name = network.get('name', '')
+                if not network_name:
+                    continue
+
+                coverage[network_name].add(token)
+                pairs[network_name] += 1
+                status['total_networks'] += 1
+
+                if network.get('deposit', False):
+                    status['deposit_enabled'] += 1
+                if network.get('withdraw', False):
+                    status['withdraw_enabled'] += 1
+
+        for network_name, tokens in coverage.items():
+            self._network_exchanges[network_name][exchange_name] += 1
+            self._network_tokens[network_name].update(tokens)
+        self._network_pairs.update(pairs)
+        self._token_refs.update(networks_data.keys())
+
+        self._exchange_status[exchange_name] = status
+        self._contributions[exchange_name] = {
+            'coverage': coverage,
+            'pairs': pairs,
+            'tokens': list(networks_data.keys())
+        }
+
+    def _remove_contribution(self, exchange_name: str):
+        """Subtract one exchange's networks from the aggregates"""
+        contribution = self._contributions.pop(exchange_name, None)
+        self._exchange_status.pop(exchange_name, None)
+        if contribution is None:
+            return
+
+        for network_name, tokens in contribution['coverage'].items():
+            self._network_exchanges[network_name][exchange_name] -= 1
+            self._network_tokens[network_name].subtract(tokens)
+            self._network_pairs[network_name] -= contribution['pairs'][network_name]
+
+            if self._network_pairs[network_name] <= 0:
+                del self._network_pairs[network_name]
+                del self._network_exchanges[network_name]
+                del self._network_tokens[network_name]
+            else:
+                self._network_exchanges[network_name] = +self._network_exchanges[network_name]
+                self._network_tokens[network_name] = +self._network_tokens[network_name]
+
+        self._token_refs.subtract(contribution['tokens'])
+        self._token_refs = +self._token_refs
+
+    @staticmethod
+    def _build_withdraw_options(exchange_name: str, networks_data: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+        """Parse withdraw-enabled networks of one exchange"""
+        options = {}
+
+        for token, networks in networks_data.items():
+            token_options = []
+            for network in networks:
+                if not network.get('withdraw', False):
+                    continue
+
+                fee_str = network.get('fee', '0')
+                token_options.append({
+                    'exchange': exchange_name,
+                    'network': network.get('name', ''),
+                    'fee': parse_fee(fee_str),
+                    'fee_str': fee_str,
+                    'min_withdraw': network.get('min_withdraw', '0'),
+                    'confirm_times': network.get('confirm_times', 0)
+                })
+
+            if token_options:
+                options[token] = token_options
+
+        return options
+
+    def _merge_token(self, token: str):
+        """Rebuild the fee-sorted option list of a token from all exchanges"""
+        merged = []
+        for exchange_name in self._exchange_order:
+            merged.extend(self._withdraw_options.get(exchange_name, {}).get(token, ()))
+
+        if merged:
+            merged.sort(key=lambda option: option['fee'] or 0)
+            self._token_options[token] = merged
+        else:
+            self._token_options.pop(token, None)
+
+    def get_token_options(self, token: str, network_filter: Optional[str] = None) -> List[Dict]:
+        """
+        Withdraw options of a token sorted by fee (lowest first)
+
+        Args:
+            token: Token code, e.g. 'BTC'
+            network_filter: Only networks whose name contains this string (case insensitive)
+        """
+        with self._lock:
+            options = self._token_options.get(token, [])
+        if network_filter:
+            network_filter = network_filter.lower()
+            options = [o for o in options if network_filter in o['network'].lower()]
+        return options
+
+    def get_exchange_networks(self, token: str) -> List[Dict[str, str]]:
+        """
+        Network names of a token on every exchange listing it
+        E.g., [{'exchange': 'Binance', 'networks': 'ARBITRUM, ERC20'}]
+        """
+        with self._lock:
+            networks = self._token_networks_cache.get(token)
+            if networks is None:
+                networks = [
+                    {'exchange': exchange_name, 'networks': self._network_names[exchange_name][token]}
+                    for exchange_name in self._exchange_order
+                    if token in self._network_names.get(exchange_name, {})
+                ]
+                self._token_networks_cache[token] = networks
+            return networks
+
+    def get_cheapest_options(self, network_filter: Optional[str] = None) -> List[Dict]:
+        """
+        Cheapest numeric-fee withdraw option of every token, sorted by fee
+
+        Args:
+            network_filter: Only consider networks whose name contains this string
+        """
+        key = network_filter.lower() if network_filter else None
+
+        with self._lock:
+            cheapest = self._cheapest_cache.get(key)
+            if cheapest is None:
+                cheapest = self._build_cheapest(key)
+                if len(self._cheapest_cache) >= self.MAX_FILTER_CACHE:
+                    self._cheapest_cache.clear()
+                self._cheapest_cache[key] = cheapest
+
+            return cheapest
+
+    def _build_cheapest(self, network_filter: Optional[str]) -> List[Dict]:
+        """Pick the first numeric-fee option per token from the sorted lists (caller holds the lock)"""
+        cheapest = []
+
+        for token in sorted(self._token_options):
+            for option in self._token_options[token]:
+                if option['fee'] is None:
+                    continue
+                if network_filter and network_filter not in option['network'].lower():
+                    continue
+
+                cheapest.append({
+                    'token': token,
+                    'exchange': option['exchange'],
+                    'network': option['network'],
+                    'fee': option['fee'],
+                    'fee_str': option['fee_str'],
+                    'min_withdraw': option['min_withdraw']
+                })
+                break
+
+        cheapest.sort(key=lambda option: option['fee'])
+        return cheapest
+
+    def get_supported_networks(self) -> List[Dict]:
+        """
+        Coverage of every network across exchanges
+        Sorted by exchange count (descending), then network name
+        """
+        with self._lock:
+            supported = self._supported_cache
+            if supported is None:
+                supported = []
+                for network_name, exchanges in self._network_exchanges.items():
+                    tokens = self._network_tokens[network_name]
+                    supported.append({
+                        'network': network_name,
+                        'supported_exchanges': sorted(exchanges),
+                        'exchange_count': len(exchanges),
+                        'supported_tokens': sorted(tokens),
+                        'token_count': len(tokens),
+                        'total_pairs': self._network_pairs[network_name]
+                    })
+
+                supported.sort(key=lambda n: (-n['exchange_count'], n['network']))
+                self._supported_cache = supported
+
+            return supported
+
+    def get_status_summary(self) -> Dict:
+        """Per-exchange deposit/withdraw counts and overall totals"""
+        with self._lock:
+            summary = self._status_cache
+            if summary is None:
+                exchanges = {
+                    name: dict(self._exchange_status[name])
+                    for name in self._exchange_order if name in self._exchange_status
+                }
+                summary = {
+                    'exchanges': exchanges,
+                    'totals': {
+                        'unique_tokens': len(self._token_refs),
+                        'unique_networks': len(self._network_pairs),
+                        'total_exchanges': len(self._exchange_order),
+                        'active_exchanges': len([ex for ex in exchanges.values() if ex.get('tokens', 0) > 0])
+                    }
+                }
+                self._status_cache = summary
+
+            return summary
+
+
+# Global network index instance
+network_index = NetworkIndex()
+
+
+def get_network_index() -> NetworkIndex:
+    """Get the network index, synced with current exchange networks caches"""
+    return network_index.sync()
@@ -0,0 +1,174 @@
+"""
+Background exchange cache refresh jobs
+Exchanges are refreshed in parallel on a thread pool while requests keep
+being served from the current caches
+"""
+import copy
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from .exchanges.base import BaseExchangeService
+from .exchanges.rate_budget import RateBudgetExceeded
+
+
+logger = logging.getLogger(__name__)
+
+# Cache kinds refreshed for every exchange
+REFRESH_KINDS = ('trading', 'networks')
+
+
+class RefreshJobManager:
+    """
+    Runs and tracks refresh jobs
+
+    A job refreshes trading and networks data of every exchange as separate
+    pool tasks. Each exchange swaps in its new data as soon as it arrives;
+    a failed fetch leaves the previous cache in place, and a fetch that
+    would exceed the exchange's rate budget is deferred (not an error).
+    Only one job runs at a time; submitting while one is running returns
+    the running job.
+    """
+
+    # Number of finished jobs kept for status queries
+    MAX_FINISHED_JOBS = 50
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: Dict[str, Dict] = {}
+        self._active_job_id: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self, app) -> ThreadPoolExecutor:
+        """Create the thread pool on first use (size from REFRESH_WORKERS config)"""
+        if self._executor is None:
+            self.max_workers = app.config.get('REFRESH_WORKERS', self.max_workers)
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='refresh')
+        return self._executor
+
+    def submit(self, app, exchanges: Dict[str, BaseExchangeService]) -> Dict:
+        """
+        Start a refresh job, or return the one already running
+
+        Args:
+            app: Flask application (tasks run inside its app context)
+            exchanges: Exchange services by name
+
+        Returns:
+            Copy of the job state
+        """
+        with self._lock:
+            if self._active_job_id is not None:
+                return self._public(self._jobs[self._active_job_id])
+
+            job = {
+                'id': uuid.uuid4().hex,
+                'status': 'running',
+                'created_at': time.time(),
+                'finished_at': None,
+                'duration': None,
+                'exchanges': {
+                    name: {kind: {'status': 'pending'} for kind in REFRESH_KINDS}
+                    for name in exchanges
+                },
+                'refreshed': [],
+                'deferred': [],
+                'errors': []
+            }
+            self._jobs[job['id']] = job
+            self._active_job_id = job['id']
+            self._prune()
+
+            job['_pending'] = len(exchanges) * len(REFRESH_KINDS)
+            if not job['_pending']:
+                self._finish(job)
+
+            for name, service in exchanges.items():
+                for kind in REFRESH_KINDS:
+                    self._get_executor(app).submit(self._run_task, app, job, name, service, kind)
+
+            logger.info(f"Started refresh job {job['id']} for {len(exchanges)} exchanges")
+            return self._public(job)
+
+    def _run_task(self, app, job: Dict, name: str, service: BaseExchangeService, kind: str):
+        """Refresh one cache of one exchange and record the outcome"""
+        with self._lock:
+            job['exchanges'][name][kind] = {'status': 'running', 'started_at': time.time()}
+
+        start = time.perf_counter()
+        result = {'status': 'success'}
+        try:
+            with app.app_context():
+                if kind == 'trading':
+                    data = service.refresh_trading_data()
+                else:
+                    data = service.refresh_networks_data()
+            result['count'] = len(data)
+        except RateBudgetExceeded as e:
+            logger.info(f"Deferred {kind} refresh of {name}: {e}")
+            result = {'status': 'deferred', 'retry_in': round(e.retry_in, 3)}
+        except Exception as e:
+            logger.error(f"Failed to refresh {kind} data of {name}: {e}")
+            result = {'status': 'error', 'error': str(e)}
+        result['duration'] = round(time.perf_counter() - start, 3)
+
+        with self._lock:
+            job['exchanges'][name][kind].update(result)
+            job['_pending'] -= 1
+            if not job['_pending']:
+                self._finish(job)
+
+    def _finish(self, job: Dict):
+        """Mark job finished and collect per-exchange outcomes (lock held)"""
+        for name, kinds in job['exchanges'].items():
+            failed = [kind for kind, task in kinds.items() if task['status'] == 'error']
+            deferred = [kind for kind, task in kinds.items() if task['status'] == 'deferred']
+            if failed:
+                job['errors'].append({
+                    'exchange': name,
+                    'error': '; '.join(f"{kind}: {kinds[kind]['error']}" for kind in failed)
+                })
+            elif deferred:
+                job['deferred'].append({
+                    'exchange': name,
+                    'kinds': deferred,
+                    'retry_in': max(kinds[kind]['retry_in'] for kind in deferred)
+                })
+            else:
+                job['refreshed'].append(name)
+
+        job['status'] = 'completed_with_errors' if job['errors'] else 'completed'
+        job['finished_at'] = time.time()
+        job['duration'] = round(job['finished_at'] - job['created_at'], 3)
+        self._active_job_id = None
+        logger.info(f"Refresh job {job['id']} {job['status']} in {job['duration']}s")
+
+    def _prune(self):
+        """Drop the oldest finished jobs beyond MAX_FINISHED_JOBS (lock held)"""
+        finished: List[str] = [job_id for job_id, job in self._jobs.items() if job['finished_at'] is not None]
+        for job_id in finished[:max(len(finished) - self.MAX_FINISHED_JOBS, 0)]:
+            del self._jobs[job_id]
+
+    @staticmethod
+    def _public(job: Dict) -> Dict:
+        """Copy of job state without internal fields (lock held)"""
+        return copy.deepcopy({key: value for key, value in job.items() if not key.startswith('_')})
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """Get copy of a job's state, None if unknown"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._public(job) if job is not None else None
+
+
+# Global refresh job manager instance
+refresh_job_manager = RefreshJobManager()
+
+
+def get_refresh_job_manager() -> RefreshJobManager:
+    """Get the global refresh job manager instance"""
+    return refresh_job_manager
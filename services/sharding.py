@@ -0,0 +1,202 @@
+"""
+Sharded arbitrage ranking
+Canonical symbols are spread over shard worker processes with consistent
+hashing; each shard ranks the opportunities of its symbols and the
+coordinator merges the shard rankings
+"""
+import hashlib
+import heapq
+import logging
+import multiprocessing
+import threading
+from bisect import bisect
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
+
+from .arbitrage import ArbitrageService, rank_opportunities
+
+
+logger = logging.getLogger(__name__)
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class HashRing:
+    """
+    Consistent hash ring of shard names
+
+    Every shard owns replicas points on the ring; a key belongs to the
+    shard of the first point at or after its hash. Adding or removing a
+    shard only moves the keys of the ring segments it gains or loses,
+    about 1/N of all keys.
+    """
+
+    def __init__(self, shards: Iterable[str] = (), replicas: int = 100):
+        self.replicas = replicas
+        self.shards: List[str] = []
+        self._points: List[int] = []
+        self._owners: List[str] = []
+        for shard in shards:
+            self.add(shard)
+
+    def _rebuild(self):
+        ring = sorted((_hash(f"{shard}#{i}"), shard) for shard in self.shards for i in range(self.replicas))
+        self._points = [point for point, _ in ring]
+        self._owners = [shard for _, shard in ring]
+
+    def add(self, shard: str):
+        """Add a shard to the ring"""
+        if shard not in self.shards:
+            self.shards.append(shard)
+            self._rebuild()
+
+    def remove(self, shard: str):
+        """Remove a shard from the ring"""
+        if shard in self.shards:
+            self.shards.remove(shard)
+            self._rebuild()
+
+    def get_shard(self, key: str) -> str:
+        """Shard owning a key"""
+        if not self._points:
+            raise ValueError("Hash ring has no shards")
+        index = bisect(self._points, _hash(key)) % len(self._points)
+        return self._owners[index]
+
+
+def rank_shard(exchange_prices: Dict[str, Dict[str, tuple]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Rank the opportunities of one shard's symbols (shard process entry point)
+
+    Args:
+        exchange_prices: Exchange -> symbol -> (bid, ask, volume)
+        top_k: Keep only the best top_k opportunities
+    """
+    exchange_data = {
+        exchange: {symbol: {'bid': bid, 'ask': ask, 'volume': volume} for symbol, (bid, ask, volume) in prices.items()}
+        for exchange, prices in exchange_prices.items()
+    }
+    opportunities = rank_opportunities(exchange_data)
+    return opportunities if top_k is None else opportunities[:top_k]
+
+
+class ShardedArbitrageEngine:
+    """
+    Ranks arbitrage opportunities across shard worker processes
+
+    Each shard is a single-process pool, so a shard's symbols are always
+    ranked by the same process and a shard could be moved to another node
+    behind the same interface. Symbol ownership is memoized until the ring
+    changes. A shard that fails or times out is ranked in this process.
+    """
+
+    def __init__(self, shards: int, replicas: int = 100, timeout: float = 30):
+        self.timeout = timeout
+        self.ring = HashRing(replicas=replicas)
+        self._executors: Dict[str, ProcessPoolExecutor] = {}
+        self._owners: Dict[str, str] = {}
+        self._stats = {'rankings': 0, 'fallbacks': 0}
+        self._lock = threading.Lock()
+        for index in range(shards):
+            self.add_shard(f"shard-{index}")
+
+    def add_shard(self, name: str):
+        """Start a shard worker and give it its share of the symbols"""
+        with self._lock:
+            self._executors[name] = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+            self.ring.add(name)
+            self._owners = {}
+
+    def remove_shard(self, name: str):
+        """Stop a shard worker; its symbols move to the remaining shards"""
+        with self._lock:
+            executor = self._executors.pop(name, None)
+            self.ring.remove(name)
+            self._owners = {}
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_owner(self, symbol: str) -> str:
+        """Shard ranking a symbol"""
+        owner = self._owners.get(symbol)
+        if owner is None:
+            owner = self._owners[symbol] = self.ring.get_shard(symbol)
+        return owner
+
+    def partition(self, exchange_data: Dict[str, Dict]) -> Dict[str, Dict[str, Dict]]:
+        """
+        Split trading data by owning shard, keeping every exchange's quotes of a symbol together
+        Quotes are reduced to (bid, ask, volume) tuples, which pickle far smaller than quote dicts
+        """
+        parts = {shard: {} for shard in self.ring.shards}
+        get_owner = self.get_owner
+        for exchange, data in exchange_data.items():
+            for symbol, quote in data.items():
+                parts[get_owner(symbol)].setdefault(exchange, {})[symbol] = (
+                    quote.get('bid', 0), quote.get('ask', 0), quote.get('volume', 0)
+                )
+        return parts
+
+    def rank(self, exchange_data: Dict[str, Dict], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Opportunities of all symbols by spread (descending), networks not attached
+
+        Args:
+            exchange_data: Exchange name -> trading data
+            top_k: Keep only the best top_k opportunities (per shard and merged)
+        """
+        with self._lock:
+            executors = dict(self._executors)
+            parts = self.partition(exchange_data)
+
+        futures = {
+            shard: executors[shard].submit(rank_shard, part, top_k)
+            for shard, part in parts.items() if part
+        }
+        rankings = []
+        for shard, future in futures.items():
+            try:
+                rankings.append(future.result(timeout=self.timeout))
+            except Exception as e:
+                logger.error(f"Arbitrage shard {shard} failed, ranking it locally: {e}")
+                self._stats['fallbacks'] += 1
+                rankings.append(rank_shard(parts[shard], top_k))
+
+        self._stats['rankings'] += 1
+        merged = heapq.merge(*rankings, key=lambda op: op['spread'], reverse=True)
+        return list(islice(merged, top_k))
+
+    def get_status(self) -> Dict[str, Any]:
+        """Shards, symbols assigned to each and ranking counters"""
+        with self._lock:
+            symbols = {shard: 0 for shard in self.ring.shards}
+            for owner in self._owners.values():
+                symbols[owner] += 1
+            return dict(self._stats, shards=symbols, replicas=self.ring.replicas)
+
+    def shutdown(self):
+        """Stop all shard workers"""
+        for name in list(self._executors):
+            self.remove_shard(name)
+
+
+def get_sharded_engine() -> Optional[ShardedArbitrageEngine]:
+    """Get the sharded ranking engine, None while ranking in-process"""
+    return ArbitrageService.engine
+
+
+def init_sharded_engine(app):
+    """Rank arbitrage opportunities on ENGINE_SHARDS shard processes when it is above 1"""
+    shards = app.config.get('ENGINE_SHARDS', 0)
+    if shards <= 1 or ArbitrageService.engine is not None:
+        return
+
+    ArbitrageService.engine = ShardedArbitrageEngine(
+        shards,
+        replicas=app.config.get('ENGINE_SHARD_REPLICAS', 100),
+        timeout=app.config.get('ENGINE_SHARD_TIMEOUT', 30)
+    )
+    logger.info(f"Ranking arbitrage opportunities on {shards} shard processes")
@@ -0,0 +1,430 @@
+"""
+Market snapshot shared between server processes
+One process, elected with a file lock, fetches exchange data and publishes
+each snapshot to a memory-mapped file; every process maps the file
+read-only and serves the published snapshots. Other processes never fetch
+trading data themselves, they forward refresh requests to the ingestor
+"""
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+    fcntl = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+from flask import current_app
+
+from .exchanges.base import get_exchange_manager
+from .refresh_jobs import get_refresh_job_manager
+from .snapshot import MarketSnapshot, snapshot_manager
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = 'market_snapshot.bin'
+LOCK_FILE = 'ingestor.lock'
+REFRESH_REQUEST_FILE = 'refresh.request'
+
+# magic, format version, snapshot version, created_at, payload length
+HEADER = struct.Struct('<8sIQdQ')
+MAGIC = b'ARBSNAP\x00'
+FORMAT_VERSION = 1
+
+
+def _dumps(obj: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(buffer) -> Any:
+    # orjson decodes straight from the mapping, json needs a bytes copy
+    if ORJSON_AVAILABLE:
+        return orjson.loads(buffer)
+    return json.loads(bytes(buffer))
+
+
+class SharedSnapshotStore:
+    """
+    Snapshot file in a directory shared by all server processes
+
+    publish() writes the complete file under a temporary name and renames it
+    over the previous one, so readers never see a partial snapshot and
+    mappings of older versions stay valid. Readers detect a new version by
+    the file's inode and modification time and decode it once per process.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.path = os.path.join(directory, SNAPSHOT_FILE)
+        self.refresh_request_path = os.path.join(directory, REFRESH_REQUEST_FILE)
+        os.makedirs(directory, exist_ok=True)
+
+        self._current: Optional[MarketSnapshot] = None
+        self._file_key: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    def _write(self, path: str, data: bytes):
+        """Write a file under a temporary name and rename it over path"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.snapshot-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def publish(self, version: int, trading_data: Dict[str, Dict],
+                data_times: Dict[str, Optional[float]], stale_exchanges: list) -> int:
+        """
+        Write a snapshot for all processes
+        Republishing a version carries newer fetch times of unchanged data
+
+        Returns:
+            Size of the written file in bytes
+        """
+        payload = _dumps({
+            'trading_data': trading_data,
+            'data_times': data_times,
+            'stale_exchanges': stale_exchanges
+        })
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, version, time.time(), len(payload))
+        self._write(self.path, header + payload)
+        return len(header) + len(payload)
+
+    def request_refresh(self, max_age: Optional[float] = None):
+        """
+        Ask the ingestor to refresh trading data
+
+        Args:
+            max_age: Refresh exchanges with older data; None refreshes all
+                caches of every exchange (a refresh job)
+        """
+        self._write(self.refresh_request_path, _dumps({'max_age': max_age, 'requested_at': time.time()}))
+
+    def read_refresh_request(self) -> Tuple[Optional[Tuple[int, int]], Optional[Dict]]:
+        """Key (inode, mtime) and content of the latest refresh request, (None, None) if there is none"""
+        try:
+            with open(self.refresh_request_path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                return (stat.st_ino, stat.st_mtime_ns), _loads(f.read())
+        except (OSError, ValueError):
+            return None, None
+
+    def read_version(self) -> int:
+        """Version of the published snapshot, 0 if none"""
+        try:
+            with open(self.path, 'rb') as f:
+                magic, fmt, version, _, _ = HEADER.unpack(f.read(HEADER.size))
+        except (OSError, struct.error):
+            return 0
+        return version if magic == MAGIC and fmt == FORMAT_VERSION else 0
+
+    def _load(self) -> Tuple[Optional[MarketSnapshot], Optional[Tuple[int, int]]]:
+        """Map the snapshot file read-only and decode it"""
+        with open(self.path, 'rb') as f:
+            key = os.fstat(f.fileno())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                magic, fmt, version, created_at, length = HEADER.unpack_from(mapped)
+                if magic != MAGIC or fmt != FORMAT_VERSION:
+                    raise ValueError(f"Unsupported snapshot file {self.path}")
+                with memoryview(mapped)[HEADER.size:HEADER.size + length] as payload:
+                    data = _loads(payload)
+
+        snapshot = MarketSnapshot(
+            version, data['trading_data'], data['data_times'],
+            stale_exchanges=data['stale_exchanges']
+        )
+        snapshot.created_at = created_at
+        return snapshot, (key.st_ino, key.st_mtime_ns)
+
+    def get_snapshot(self) -> Optional[MarketSnapshot]:
+        """Latest published snapshot, None before the first publish"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return self._current
+
+        if (stat.st_ino, stat.st_mtime_ns) == self._file_key:
+            return self._current
+
+        with self._lock:
+            if (stat.st_ino, stat.st_mtime_ns) != self._file_key:
+                try:
+                    snapshot, file_key = self._load()
+                except (OSError, ValueError, struct.error) as e:
+                    logger.error(f"Failed to read shared snapshot: {e}")
+                    return self._current
+                if self._current is not None and snapshot.version == self._current.version:
+                    # Republished with newer fetch times: keep the indexes built on the data
+                    self._current = self._current.refreshed(snapshot.data_times, snapshot.stale_exchanges)
+                elif self._current is None or snapshot.version > self._current.version:
+                    self._current = snapshot
+                self._file_key = file_key
+                logger.debug(f"Mapped shared market snapshot v{snapshot.version}")
+            return self._current
+
+
+class SharedSnapshotSource:
+    """
+    Snapshot source of SnapshotManager in shared mode
+    Serves the published snapshot; exchange data is never fetched here, data
+    older than a request's max_age is requested from the ingestor instead
+    """
+
+    def __init__(self, store: SharedSnapshotStore, poll_interval: float = 0.1, request_interval: float = 1.0):
+        self.store = store
+        self.poll_interval = poll_interval
+        # Minimum seconds between refresh requests of this process for the same max_age
+        self.request_interval = request_interval
+        self._last_request: Optional[Tuple[float, float]] = None
+
+    def get_snapshot(self, max_age: Optional[float] = None, wait: Optional[float] = None) -> MarketSnapshot:
+        """
+        Get the published snapshot
+
+        Args:
+            max_age: Maximum acceptable data age in seconds; a newer publish
+                is awaited up to wait seconds
+            wait: Seconds to wait for fresh data
+        """
+        deadline = time.monotonic() + (wait or 0)
+        snapshot = self.store.get_snapshot()
+        if max_age is not None and (snapshot is None or not snapshot.is_fresh(max_age)):
+            self._request_refresh(max_age)
+
+        while snapshot is None or (max_age is not None and not snapshot.is_fresh(max_age)):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(self.poll_interval, remaining))
+            snapshot = self.store.get_snapshot()
+
+        # Nothing published yet
+        return snapshot or MarketSnapshot(0, {}, stale_exchanges=[])
+
+    def _request_refresh(self, max_age: float):
+        """Forward a targeted refresh to the ingestor, at most once per request_interval per max_age"""
+        now = time.monotonic()
+        last = self._last_request
+        if last is not None and now - last[0] < self.request_interval and last[1] <= max_age:
+            return
+        self._last_request = (now, max_age)
+        try:
+            self.store.request_refresh(max_age)
+        except OSError as e:
+            logger.error(f"Failed to request a refresh from the ingestor: {e}")
+
+
+class SnapshotIngestor:
+    """
+    Elects one ingesting process per snapshot directory
+
+    Every process runs the loop; the one holding the exclusive lock on the
+    lock file refreshes exchange trading data older than refresh_interval
+    (and as requested by other processes) and publishes a snapshot whenever
+    an exchange cache changed or was re-fetched. The others retry the lock
+    each interval, so a new ingestor takes over when the holder exits (the
+    lock is released with the process).
+    """
+
+    def __init__(self, store: SharedSnapshotStore, interval: float = 1.0, refresh_interval: float = 30.0):
+        self.store = store
+        self.interval = interval
+        self.refresh_interval = refresh_interval
+        self.lock_path = os.path.join(store.directory, LOCK_FILE)
+
+        self._lock_file = None
+        self._version = 0
+        self._published: Optional[Dict[str, Dict]] = None
+        self._published_times: Optional[Dict[str, Optional[float]]] = None
+        self._refresh_request_key: Optional[Tuple[int, int]] = None
+        self._last_publish: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this process holds the ingestor lock"""
+        return self._lock_file is not None
+
+    def try_acquire(self) -> bool:
+        """Take the ingestor lock without blocking"""
+        if self._lock_file is not None:
+            return True
+
+        lock_file = open(self.lock_path, 'a+')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._lock_file = lock_file
+        # Continue the version sequence of the previous ingestor
+        self._version = max(self._version, self.store.read_version())
+        self._published = None
+        # Requests made before the election were meant for the previous ingestor
+        self._refresh_request_key, _ = self.store.read_refresh_request()
+        logger.info(f"Process {os.getpid()} is the market data ingestor")
+        return True
+
+    def release(self):
+        """Give up the ingestor lock"""
+        if self._lock_file is not None:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _handle_refresh_request(self, manager) -> float:
+        """
+        Run a refresh requested by another process since the last one handled
+
+        Returns:
+            Maximum data age to refresh trading data at in this round
+        """
+        key, request = self.store.read_refresh_request()
+        if key is None or key == self._refresh_request_key:
+            return self.refresh_interval
+        self._refresh_request_key = key
+
+        max_age = request.get('max_age')
+        if max_age is None:
+            job = get_refresh_job_manager().submit(current_app._get_current_object(), manager.get_all_exchanges())
+            logger.info(f"Started requested refresh job {job['id']}")
+            return self.refresh_interval
+        return min(max_age, self.refresh_interval)
+
+    def ingest(self) -> bool:
+        """
+        Refresh old trading data and publish a snapshot if any exchange's
+        trading data changed or was re-fetched since the last publish.
+        Refreshes run in the background and are published by a later round.
+        Must run inside the app context
+
+        Returns:
+            True if a snapshot was published
+        """
+        manager = get_exchange_manager()
+        trading_data = manager.get_all_trading_data(self._handle_refresh_request(manager), 0)
+        data_times = manager.get_trading_data_times()
+        if not any(data_times.values()):
+            # Nothing fetched yet
+            return False
+
+        published = self._published
+        unchanged = published is not None and published.keys() == trading_data.keys() and all(
+            published[name] is data for name, data in trading_data.items()
+        )
+        if unchanged and data_times == self._published_times:
+            return False
+
+        # Re-fetched but identical data keeps its version, only the fetch times advance
+        if not unchanged:
+            self._version += 1
+        size = self.store.publish(self._version, trading_data, data_times, manager.get_stale_exchanges())
+        self._published = trading_data
+        self._published_times = data_times
+        self._last_publish = time.time()
+        logger.debug(f"Published market snapshot v{self._version} ({size} bytes)")
+        return True
+
+    def start(self, app):
+        """Start the election and ingest loop (idempotent)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(app,), name='snapshot-ingestor', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the loop and release the lock"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+        self.release()
+
+    def _run(self, app):
+        """Election and ingest loop"""
+        while not self._stop.is_set():
+            try:
+                if self.try_acquire():
+                    with app.app_context():
+                        self.ingest()
+            except Exception as e:
+                logger.error(f"Snapshot ingest failed: {e}")
+            self._stop.wait(self.interval)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Role of this process and the last published version"""
+        return {
+            'pid': os.getpid(),
+            'role': 'ingestor' if self.is_leader else 'reader',
+            'directory': self.store.directory,
+            'published_version': self._version if self.is_leader else None,
+            'last_publish': self._last_publish if self.is_leader else None
+        }
+
+
+_ingestor: Optional[SnapshotIngestor] = None
+
+
+def get_snapshot_ingestor() -> Optional[SnapshotIngestor]:
+    """Get this process's snapshot ingestor, None unless shared snapshots are enabled"""
+    return _ingestor
+
+
+def init_shared_snapshot(app):
+    """
+    Serve market snapshots from the shared snapshot file when SHARED_SNAPSHOT_ENABLED
+    and take part in the ingestor election
+    """
+    global _ingestor
+    if not app.config.get('SHARED_SNAPSHOT_ENABLED', False):
+        return
+    if app.config.get('SNAPSHOT_BROKER'):
+        logger.warning("Snapshots are distributed over a broker, shared snapshot file disabled")
+        return
+    if not FCNTL_AVAILABLE:
+        logger.warning("Shared snapshots need fcntl file locks, serving per-process snapshots")
+        return
+
+    # One ingestor per process even when several apps are created (app.py and wsgi.py)
+    if _ingestor is None:
+        store = SharedSnapshotStore(app.config.get('SHARED_SNAPSHOT_DIR') or
+                                    os.path.join(tempfile.gettempdir(), 'arbitrage-bot'))
+        _ingestor = SnapshotIngestor(
+            store,
+            app.config.get('SHARED_SNAPSHOT_INTERVAL', 1.0),
+            app.config.get('SHARED_SNAPSHOT_REFRESH_INTERVAL', 30.0)
+        )
+        logger.info(f"Serving shared market snapshots from {store.path}")
+
+    snapshot_manager.source = SharedSnapshotSource(_ingestor.store)
+    _ingestor.start(app)
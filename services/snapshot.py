@@ -0,0 +1,234 @@
+"""
+Market snapshot service
+Pins one consistent view of all exchanges' trading data and memoizes
+indexes derived from it until the next data refresh
+"""
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from flask import g, has_app_context
+
+from .exchanges.base import get_exchange_manager
+from .market_index import SymbolSearchIndex, TokenRankings, QuoteIndex
+
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class MarketSnapshot:
+    """
+    Immutable view of trading data from all exchanges
+    Derived structures (search index, rankings, ...) are built at most once per snapshot
+    """
+
+    def __init__(self, version: int, trading_data: Dict[str, Dict],
+                 data_times: Optional[Dict[str, Optional[float]]] = None,
+                 stale_exchanges: Optional[List[str]] = None):
+        self.version = version
+        self.trading_data = trading_data
+        self.data_times = data_times or {}
+        # Recorded by the publishing process for shared snapshots, read live otherwise
+        self.stale_exchanges = stale_exchanges
+        self.created_at = time.time()
+
+        self._derived = {}
+        # Re-entrant: builders may depend on other derived values
+        self._lock = threading.RLock()
+
+    def refreshed(self, data_times: Dict[str, Optional[float]],
+                  stale_exchanges: Optional[List[str]] = None) -> 'MarketSnapshot':
+        """
+        Same snapshot with newer fetch times, for re-fetched but unchanged data
+        Version and derived values (built from the trading data only) are shared;
+        this snapshot itself is left as is for requests that pinned it
+        """
+        snapshot = MarketSnapshot.__new__(MarketSnapshot)
+        snapshot.__dict__.update(self.__dict__)
+        snapshot.data_times = data_times or {}
+        if stale_exchanges is not None:
+            snapshot.stale_exchanges = stale_exchanges
+        return snapshot
+
+    def get_derived(self, key: Any, builder: Callable[['MarketSnapshot'], Any], version: Any = None) -> Any:
+        """
+        Get value derived from this snapshot, building it on first access
+
+        Args:
+            key: Cache key of the derived value
+            builder: Callable taking the snapshot and returning the value
+            version: Version of other inputs of the value (e.g. the networks
+                index); a value built for another version is rebuilt and replaced
+        """
+        entry = self._derived.get(key, _MISSING)
+        if entry is _MISSING or entry[0] != version:
+            with self._lock:
+                entry = self._derived.get(key, _MISSING)
+                if entry is _MISSING or entry[0] != version:
+                    entry = (version, builder(self))
+                    self._derived[key] = entry
+        return entry[1]
+
+    @property
+    def search_index(self):
+        """Inverted symbol index for token search"""
+        return self.get_derived('search_index', SymbolSearchIndex.build)
+
+    @property
+    def rankings(self):
+        """Per-metric ranked views of all markets"""
+        return self.get_derived('rankings', TokenRankings.build)
+
+    @property
+    def quote_index(self):
+        """Canonical symbol to per-exchange quotes index"""
+        return self.get_derived('quote_index', QuoteIndex.build)
+
+    def get_data_ages(self) -> Dict[str, Optional[float]]:
+        """Seconds since each exchange's trading data was fetched, None if unknown"""
+        now = time.time()
+        return {
+            name: round(max(now - fetched_at, 0.0), 3) if fetched_at else None
+            for name, fetched_at in ((name, self.data_times.get(name)) for name in self.trading_data)
+        }
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Check whether every exchange's data is at most max_age seconds old"""
+        return all(age is not None and age <= max_age for age in self.get_data_ages().values())
+
+    def summary(self) -> Dict[str, Any]:
+        """Version, creation time, per-exchange symbol counts, data ages and stale exchanges"""
+        return {
+            'version': self.version,
+            'created_at': self.created_at,
+            'exchanges': {name: len(data) for name, data in self.trading_data.items()},
+            'data_age': self.get_data_ages(),
+            'stale_exchanges': self.stale_exchanges if self.stale_exchanges is not None
+            else get_exchange_manager().get_stale_exchanges()
+        }
+
+    def is_current(self, trading_data: Dict[str, Dict]) -> bool:
+        """Check whether the snapshot still holds exactly the given exchange data"""
+        if trading_data.keys() != self.trading_data.keys():
+            return False
+        return all(self.trading_data[name] is data for name, data in trading_data.items())
+
+
+class SnapshotManager:
+    """
+    Tracks the current market snapshot
+    A new snapshot is created only when an exchange cache has been refreshed.
+    With a source set (shared snapshots), snapshots come from the source instead
+    """
+
+    def __init__(self):
+        self._current: Optional[MarketSnapshot] = None
+        self._version = 0
+        self._lock = threading.Lock()
+        self.source = None
+
+    def get_snapshot(self, max_age: Optional[float] = None, wait: Optional[float] = None) -> MarketSnapshot:
+        """
+        Get current snapshot, refreshing expired exchange caches first
+
+        Args:
+            max_age: Maximum acceptable data age in seconds; older exchange data
+                is refreshed and awaited up to wait seconds
+            wait: Seconds to wait for targeted refreshes
+        """
+        if self.source is not None:
+            return self.source.get_snapshot(max_age, wait)
+
+        manager = get_exchange_manager()
+        trading_data = manager.get_all_trading_data(max_age, wait)
+
+        data_times = manager.get_trading_data_times()
+        snapshot = self._current
+        if snapshot is not None and snapshot.is_current(trading_data) and snapshot.data_times == data_times:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._current
+            if snapshot is None or not snapshot.is_current(trading_data):
+                self._version += 1
+                snapshot = MarketSnapshot(self._version, trading_data, data_times)
+                self._current = snapshot
+                logger.debug(f"Created market snapshot v{snapshot.version}")
+            elif snapshot.data_times != data_times:
+                # Unchanged data was re-fetched: same version and indexes, newer fetch times
+                snapshot = snapshot.refreshed(data_times)
+                self._current = snapshot
+
+        return snapshot
+
+    def wait_for_update(self, since: int, timeout: float, interval: float = 1.0) -> MarketSnapshot:
+        """
+        Block until a snapshot newer than since exists or timeout expires
+        Pins the calling thread; async servers use AsyncSnapshotWatcher instead
+
+        Args:
+            since: Last snapshot version known to the caller
+            timeout: Maximum seconds to wait
+            interval: Seconds between snapshot checks
+        """
+        deadline = time.monotonic() + timeout
+        snapshot = self.get_snapshot()
+
+        while snapshot.version <= since:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+            snapshot = self.get_snapshot()
+
+        return snapshot
+
+    def clear(self):
+        """Drop the current snapshot"""
+        with self._lock:
+            self._current = None
+
+
+# Global snapshot manager instance
+snapshot_manager = SnapshotManager()
+
+
+def get_market_snapshot(max_age: Optional[float] = None, wait: Optional[float] = None) -> MarketSnapshot:
+    """
+    Get the current market snapshot (the pinned one inside pin_market_snapshot)
+
+    Args:
+        max_age: Maximum acceptable per-exchange data age in seconds (ignored
+            while a snapshot is pinned)
+        wait: Seconds to wait for targeted refreshes of older data
+    """
+    if has_app_context():
+        pinned = g.get('pinned_market_snapshot')
+        if pinned is not None:
+            return pinned
+    snapshot = snapshot_manager.get_snapshot(max_age, wait)
+    if has_app_context():
+        # Read by the freshness hooks to report data ages of the served snapshot
+        g.served_market_snapshot = snapshot
+    return snapshot
+
+
+@contextmanager
+def pin_market_snapshot(snapshot: Optional[MarketSnapshot] = None):
+    """
+    Serve one snapshot to every get_market_snapshot() call in the current app context
+
+    Args:
+        snapshot: Snapshot to pin (current snapshot if None)
+    """
+    previous = g.get('pinned_market_snapshot')
+    snapshot = snapshot or get_market_snapshot()
+    g.pinned_market_snapshot = snapshot
+    try:
+        yield snapshot
+    finally:
+        g.pinned_market_snapshot = previous
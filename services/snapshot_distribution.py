@@ -0,0 +1,601 @@
+"""
+Market snapshot distribution between API nodes
+One publisher node (elected with a broker lease) sends versioned full
+snapshots and per-symbol deltas over a broker stream; every node applies
+them to its local snapshot and catches up from the last full snapshot
+after missed messages
+"""
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+from .exchanges.base import get_exchange_manager
+from .snapshot import MarketSnapshot, snapshot_manager
+
+
+logger = logging.getLogger(__name__)
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Serialize a distribution message"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(message, separators=(',', ':')).encode('utf-8')
+
+
+def decode_message(payload: bytes) -> Dict[str, Any]:
+    """Deserialize a distribution message"""
+    return orjson.loads(payload) if ORJSON_AVAILABLE else json.loads(payload)
+
+
+def compute_delta(previous: Dict[str, Dict], current: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    Per-exchange changes between two trading data dicts
+    Exchanges whose data object did not change are skipped without comparing quotes
+
+    Returns:
+        Exchange -> {'set': changed or new quotes, 'removed': removed symbols};
+        an exchange that disappeared maps to None
+    """
+    changes = {}
+    for name, data in current.items():
+        old = previous.get(name)
+        if old is data:
+            continue
+        old = old or {}
+        changed = {symbol: quote for symbol, quote in data.items() if old.get(symbol) != quote}
+        removed = [symbol for symbol in old if symbol not in data]
+        if changed or removed:
+            changes[name] = {'set': changed, 'removed': removed}
+    for name in previous:
+        if name not in current:
+            changes[name] = None
+    return changes
+
+
+def apply_delta(trading_data: Dict[str, Dict], changes: Dict[str, Optional[Dict]]) -> Dict[str, Dict]:
+    """New trading data with changes applied; unchanged exchanges keep their dict objects"""
+    result = dict(trading_data)
+    for name, change in changes.items():
+        if change is None:
+            result.pop(name, None)
+            continue
+        data = dict(result.get(name, {}))
+        for symbol in change['removed']:
+            data.pop(symbol, None)
+        data.update(change['set'])
+        result[name] = data
+    return result
+
+
+class InMemoryBroker:
+    """
+    In-process stand-in of the Redis broker for tests and single-node development
+    Keeps the last maxlen messages like a capped stream
+    """
+
+    def __init__(self, maxlen: int = 1000):
+        self._messages = deque(maxlen=maxlen)
+        self._next_id = 1
+        self._version = 0
+        self._checkpoint: Optional[Tuple[str, bytes]] = None
+        self._lease: Optional[Tuple[str, float]] = None
+        self._condition = threading.Condition()
+
+    def publish(self, payload: bytes, version: int, checkpoint: bool = False) -> str:
+        """Append a message of a version, optionally recording it as the catch-up checkpoint"""
+        with self._condition:
+            message_id = str(self._next_id)
+            self._next_id += 1
+            self._messages.append((message_id, payload))
+            self._version = max(self._version, version)
+            if checkpoint:
+                self._checkpoint = (message_id, payload)
+            self._condition.notify_all()
+            return message_id
+
+    def read(self, after_id: str, timeout: float) -> List[Tuple[str, bytes]]:
+        """Messages after after_id ('0' for all retained), waiting up to timeout for new ones"""
+        after = int(after_id)
+        with self._condition:
+            if not self._messages or int(self._messages[-1][0]) <= after:
+                self._condition.wait(timeout)
+            return [(message_id, payload) for message_id, payload in self._messages if int(message_id) > after]
+
+    def get_checkpoint(self) -> Optional[Tuple[str, bytes]]:
+        """Id and payload of the last full snapshot message"""
+        with self._condition:
+            return self._checkpoint
+
+    def get_version(self) -> int:
+        """Latest published version, 0 if nothing was published"""
+        with self._condition:
+            return self._version
+
+    def acquire_lease(self, owner: str, ttl: float) -> bool:
+        """Take or renew the publisher lease"""
+        now = time.monotonic()
+        with self._condition:
+            if self._lease is None or self._lease[0] == owner or self._lease[1] <= now:
+                self._lease = (owner, now + ttl)
+                return True
+            return False
+
+    def release_lease(self, owner: str):
+        """Give up the publisher lease if held by owner"""
+        with self._condition:
+            if self._lease is not None and self._lease[0] == owner:
+                self._lease = None
+
+
+class RedisBroker:
+    """
+    Redis stream broker
+    Messages go to a capped stream, the last full snapshot is kept in a hash
+    for catch-up, the latest published version in a key and the publisher
+    lease is a key with a TTL
+    """
+
+    # Renew the lease only while we still own it
+    RENEW_LEASE = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('pexpire', KEYS[1], ARGV[2])
+    end
+    return redis.call('set', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2]) and 1 or 0
+    """
+
+    RELEASE_LEASE = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('del', KEYS[1])
+    end
+    return 0
+    """
+
+    def __init__(self, url: str, channel: str = 'arbitrage:snapshots', maxlen: int = 1000):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("redis package is not installed")
+        self.client = redis.Redis.from_url(url)
+        self.stream = channel
+        self.checkpoint_key = f"{channel}:checkpoint"
+        self.version_key = f"{channel}:version"
+        self.lease_key = f"{channel}:publisher"
+        self.maxlen = maxlen
+        self._renew = self.client.register_script(self.RENEW_LEASE)
+        self._release = self.client.register_script(self.RELEASE_LEASE)
+
+    def publish(self, payload: bytes, version: int, checkpoint: bool = False) -> str:
+        """Append a message of a version, optionally recording it as the catch-up checkpoint"""
+        pipeline = self.client.pipeline(transaction=True)
+        pipeline.xadd(self.stream, {'m': payload}, maxlen=self.maxlen, approximate=True)
+        pipeline.set(self.version_key, version)
+        message_id = pipeline.execute()[0]
+        if checkpoint:
+            self.client.hset(self.checkpoint_key, mapping={'id': message_id, 'm': payload})
+        return message_id.decode() if isinstance(message_id, bytes) else message_id
+
+    def read(self, after_id: str, timeout: float) -> List[Tuple[str, bytes]]:
+        """Messages after after_id ('0' for all retained), waiting up to timeout for new ones"""
+        result = self.client.xread({self.stream: after_id}, block=max(int(timeout * 1000), 1))
+        if not result:
+            return []
+        return [
+            (message_id.decode() if isinstance(message_id, bytes) else message_id, fields[b'm'])
+            for message_id, fields in result[0][1]
+        ]
+
+    def get_checkpoint(self) -> Optional[Tuple[str, bytes]]:
+        """Id and payload of the last full snapshot message"""
+        checkpoint = self.client.hgetall(self.checkpoint_key)
+        if not checkpoint:
+            return None
+        return checkpoint[b'id'].decode(), checkpoint[b'm']
+
+    def get_version(self) -> int:
+        """Latest published version, 0 if nothing was published"""
+        return int(self.client.get(self.version_key) or 0)
+
+    def acquire_lease(self, owner: str, ttl: float) -> bool:
+        """Take or renew the publisher lease"""
+        return bool(self._renew(keys=[self.lease_key], args=[owner, int(ttl * 1000)]))
+
+    def release_lease(self, owner: str):
+        """Give up the publisher lease if held by owner"""
+        self._release(keys=[self.lease_key], args=[owner])
+
+
+class SnapshotSubscriber:
+    """
+    Applies distributed snapshot messages to a local snapshot
+
+    A delta applies only to the version it was computed from. A delta for
+    any other version means messages were missed: the subscriber reloads
+    the last full snapshot (checkpoint) and replays the stream from it.
+    A full snapshot of another publisher than the current one replaces the
+    local snapshot whatever its version. A times message carries newer fetch
+    times of unchanged data for the current version.
+    """
+
+    def __init__(self, broker, read_timeout: float = 1.0):
+        self.broker = broker
+        self.read_timeout = read_timeout
+        self.last_id = '0'
+        # Checkpoint replayed since the last applied delta
+        self._replaying_from: Optional[str] = None
+
+        self._current: Optional[MarketSnapshot] = None
+        self._publisher: Optional[str] = None
+        self._stats = {'full': 0, 'deltas': 0, 'times': 0, 'skipped': 0, 'dropped': 0, 'catch_ups': 0,
+                       'last_message': None}
+        self._lock = threading.Lock()
+        self._updated = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def version(self) -> int:
+        """Version of the local snapshot, 0 before the first full snapshot"""
+        snapshot = self._current
+        return snapshot.version if snapshot is not None else 0
+
+    def _set_snapshot(self, message: Dict[str, Any], trading_data: Dict[str, Dict]):
+        snapshot = MarketSnapshot(
+            message['version'], trading_data, message['data_times'],
+            stale_exchanges=message['stale_exchanges']
+        )
+        snapshot.created_at = message['created_at']
+        with self._updated:
+            self._current = snapshot
+            self._publisher = message.get('publisher')
+            self._stats['last_message'] = time.time()
+            self._updated.notify_all()
+
+    def apply(self, message: Dict[str, Any]) -> bool:
+        """
+        Apply one message to the local snapshot
+
+        Returns:
+            False if messages before this delta were missed
+        """
+        version = message['version']
+        if message['type'] == 'times':
+            return self._apply_times(message)
+
+        new_publisher = message['type'] == 'full' and message.get('publisher') != self._publisher
+        if version <= self.version and not new_publisher:
+            self._stats['skipped'] += 1
+            return True
+
+        if message['type'] == 'full':
+            self._set_snapshot(message, message['trading_data'])
+            self._stats['full'] += 1
+            return True
+
+        if message['base_version'] != self.version or self._current is None:
+            return False
+
+        self._set_snapshot(message, apply_delta(self._current.trading_data, message['changes']))
+        self._stats['deltas'] += 1
+        self._replaying_from = None
+        return True
+
+    def _apply_times(self, message: Dict[str, Any]) -> bool:
+        """Advance fetch times of the current version, False if that version was missed"""
+        with self._updated:
+            current = self._current
+            if current is not None and message['version'] > current.version:
+                return False
+            if current is None or message['version'] < current.version \
+                    or message.get('publisher') != self._publisher:
+                self._stats['skipped'] += 1
+                return True
+            self._current = current.refreshed(message['data_times'], message['stale_exchanges'])
+            self._stats['times'] += 1
+            self._stats['last_message'] = time.time()
+            self._updated.notify_all()
+        return True
+
+    def catch_up(self) -> bool:
+        """
+        Load the last full snapshot and continue reading the stream after it
+
+        Returns:
+            False if there is no full snapshot or replaying from it already failed
+        """
+        checkpoint = self.broker.get_checkpoint()
+        if checkpoint is None:
+            return False
+        message_id, payload = checkpoint
+        if message_id == self._replaying_from:
+            # Deltas after the checkpoint were trimmed from the stream, wait for the next full snapshot
+            return False
+        message = decode_message(payload)
+        if message['version'] > self.version or message.get('publisher') != self._publisher:
+            self._set_snapshot(message, message['trading_data'])
+        self.last_id = message_id
+        self._replaying_from = message_id
+        self._stats['catch_ups'] += 1
+        logger.info(f"Caught up to market snapshot v{self.version} from checkpoint {message_id}")
+        return True
+
+    def poll(self, timeout: Optional[float] = None) -> int:
+        """
+        Read and apply available messages
+
+        Returns:
+            Number of messages read
+        """
+        entries = self.broker.read(self.last_id, self.read_timeout if timeout is None else timeout)
+        for message_id, payload in entries:
+            if not self.apply(decode_message(payload)):
+                logger.warning(f"Missed snapshot messages before {message_id}, catching up")
+                if self.catch_up():
+                    # Replay the stream from the checkpoint
+                    return len(entries)
+                self._stats['dropped'] += 1
+            self.last_id = message_id
+        return len(entries)
+
+    def start(self):
+        """Catch up and follow the stream in a background thread (idempotent)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='snapshot-subscriber', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop following the stream"""
+        self._stop.set()
+
+    def _run(self):
+        """Subscription loop"""
+        caught_up = False
+        while not self._stop.is_set():
+            try:
+                if not caught_up:
+                    caught_up = self.catch_up()
+                    if not caught_up:
+                        self._stop.wait(self.read_timeout)
+                        continue
+                self.poll()
+            except Exception as e:
+                logger.error(f"Snapshot subscription failed: {e}")
+                self._stop.wait(self.read_timeout)
+
+    def get_snapshot(self, max_age: Optional[float] = None, wait: Optional[float] = None) -> MarketSnapshot:
+        """
+        Get the local copy of the distributed snapshot
+
+        Args:
+            max_age: Maximum acceptable data age in seconds; a newer version
+                is awaited up to wait seconds
+            wait: Seconds to wait for fresh data
+        """
+        deadline = time.monotonic() + (wait or 0)
+        with self._updated:
+            while self._current is None or (max_age is not None and not self._current.is_fresh(max_age)):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._updated.wait(remaining)
+            # Nothing received yet
+            return self._current or MarketSnapshot(0, {}, stale_exchanges=[])
+
+    def get_status(self) -> Dict[str, Any]:
+        """Local version, stream position and applied message counters"""
+        return dict(self._stats, version=self.version, last_id=self.last_id)
+
+
+class SnapshotPublisher:
+    """
+    Publishes this node's exchange data while it holds the publisher lease
+
+    Every interval the exchange manager's trading data is compared with the
+    last published data; changed exchanges are sent as a delta, and every
+    full_every versions (and after taking over the lease) a full snapshot is
+    sent and recorded as the catch-up checkpoint. Re-fetched but unchanged
+    data only sends its new fetch times under the current version.
+    """
+
+    def __init__(self, broker, interval: float = 1.0, full_every: int = 30, lease_ttl: Optional[float] = None):
+        self.broker = broker
+        self.interval = interval
+        self.full_every = full_every
+        self.lease_ttl = lease_ttl or max(interval * 5, 5.0)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self.is_leader = False
+        self._version = 0
+        self._published: Optional[Dict[str, Dict]] = None
+        self._published_times: Optional[Dict[str, Optional[float]]] = None
+        self._since_full = 0
+        self._stats = {'full': 0, 'deltas': 0, 'times': 0, 'full_bytes': 0, 'delta_bytes': 0, 'last_publish': None}
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _take_lease(self) -> bool:
+        """
+        Acquire or renew the lease; a new leader continues after the latest
+        published version (deltas included), never reusing a version number
+        """
+        leader = self.broker.acquire_lease(self.owner, self.lease_ttl)
+        if leader and not self.is_leader:
+            self._version = max(self._version, self.broker.get_version())
+            self._published = None
+            logger.info(f"{self.owner} is the market snapshot publisher")
+        self.is_leader = leader
+        return leader
+
+    def publish(self) -> Optional[int]:
+        """
+        Publish this node's trading data if it changed since the last publish
+        Must run inside the app context
+
+        Returns:
+            Published version, None if nothing changed
+        """
+        manager = get_exchange_manager()
+        trading_data = manager.get_all_trading_data()
+        data_times = manager.get_trading_data_times()
+        previous = self._published
+
+        if previous is not None:
+            changes = compute_delta(previous, trading_data)
+            if not changes:
+                # Refetched but identical data: later deltas compare against the new objects
+                self._published = trading_data
+                if data_times != self._published_times:
+                    self._publish_times(data_times, manager.get_stale_exchanges())
+                return None
+        full = previous is None or self._since_full + 1 >= self.full_every
+
+        self._version += 1
+        message = {
+            'type': 'full' if full else 'delta',
+            'version': self._version,
+            'publisher': self.owner,
+            'created_at': time.time(),
+            'data_times': data_times,
+            'stale_exchanges': manager.get_stale_exchanges()
+        }
+        if full:
+            message['trading_data'] = trading_data
+        else:
+            message['base_version'] = self._version - 1
+            message['changes'] = changes
+
+        payload = encode_message(message)
+        self.broker.publish(payload, self._version, checkpoint=full)
+        self._published = trading_data
+        self._published_times = data_times
+        self._since_full = 0 if full else self._since_full + 1
+
+        kind = 'full' if full else 'deltas'
+        self._stats[kind] += 1
+        self._stats[f"{'full' if full else 'delta'}_bytes"] += len(payload)
+        self._stats['last_publish'] = message['created_at']
+        logger.debug(f"Published {message['type']} market snapshot v{self._version} ({len(payload)} bytes)")
+        return self._version
+
+    def _publish_times(self, data_times: Dict[str, Optional[float]], stale_exchanges: List[str]):
+        """Publish new fetch times of the current version so subscribers' data ages advance"""
+        message = {
+            'type': 'times',
+            'version': self._version,
+            'publisher': self.owner,
+            'created_at': time.time(),
+            'data_times': data_times,
+            'stale_exchanges': stale_exchanges
+        }
+        self.broker.publish(encode_message(message), self._version)
+        self._published_times = data_times
+        self._stats['times'] += 1
+        self._stats['last_publish'] = message['created_at']
+
+    def start(self, app):
+        """Start the lease and publish loop (idempotent)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(app,), name='snapshot-publisher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop publishing and release the lease"""
+        self._stop.set()
+        if self.is_leader:
+            self.broker.release_lease(self.owner)
+            self.is_leader = False
+
+    def _run(self, app):
+        """Lease and publish loop"""
+        while not self._stop.is_set():
+            try:
+                if self._take_lease():
+                    with app.app_context():
+                        self.publish()
+            except Exception as e:
+                logger.error(f"Snapshot publish failed: {e}")
+            self._stop.wait(self.interval)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Lease state, last published version and message counters"""
+        return dict(self._stats, owner=self.owner, leader=self.is_leader,
+                    version=self._version if self.is_leader else None)
+
+
+_subscriber: Optional[SnapshotSubscriber] = None
+_publisher: Optional[SnapshotPublisher] = None
+
+
+def get_snapshot_distribution() -> Dict[str, Any]:
+    """Subscriber and publisher status of this process, empty when distribution is off"""
+    status = {}
+    if _subscriber is not None:
+        status['subscriber'] = _subscriber.get_status()
+    if _publisher is not None:
+        status['publisher'] = _publisher.get_status()
+    return status
+
+
+def create_broker(config):
+    """Broker selected by SNAPSHOT_BROKER ('memory' or 'redis')"""
+    kind = config.get('SNAPSHOT_BROKER', '').lower()
+    maxlen = config.get('SNAPSHOT_STREAM_MAXLEN', 1000)
+    if kind == 'memory':
+        return InMemoryBroker(maxlen)
+    if kind == 'redis':
+        return RedisBroker(config.get('SNAPSHOT_BROKER_URL'), config.get('SNAPSHOT_CHANNEL', 'arbitrage:snapshots'),
+                           maxlen)
+    raise ValueError(f"Unknown snapshot broker '{kind}'")
+
+
+def init_snapshot_distribution(app):
+    """
+    Serve market snapshots received from the broker when SNAPSHOT_BROKER is set
+    and publish this node's data while holding the publisher lease (SNAPSHOT_PUBLISHER)
+    """
+    global _subscriber, _publisher
+    if not app.config.get('SNAPSHOT_BROKER'):
+        return
+
+    # One subscriber per process even when several apps are created (app.py and wsgi.py)
+    if _subscriber is None:
+        try:
+            broker = create_broker(app.config)
+        except (RuntimeError, ValueError) as e:
+            logger.error(f"Snapshot distribution disabled: {e}")
+            return
+        _subscriber = SnapshotSubscriber(broker)
+        if app.config.get('SNAPSHOT_PUBLISHER', True):
+            _publisher = SnapshotPublisher(
+                broker,
+                interval=app.config.get('SNAPSHOT_PUBLISH_INTERVAL', 1.0),
+                full_every=app.config.get('SNAPSHOT_FULL_EVERY', 30)
+            )
+        logger.info(f"Distributing market snapshots over {app.config['SNAPSHOT_BROKER']} broker")
+
+    snapshot_manager.source = _subscriber
+    _subscriber.start()
+    if _publisher is not None:
+        _publisher.start(app)
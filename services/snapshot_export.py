@@ -0,0 +1,111 @@
+"""
+Binary columnar export of market snapshots
+Arrow IPC (pyarrow) and msgpack encodings are built at most once per snapshot
+"""
+import logging
+from typing import Dict, List
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pyarrow = None
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+from .arbitrage import ArbitrageService
+from .snapshot import pin_market_snapshot
+
+
+logger = logging.getLogger(__name__)
+
+EXPORT_MIMETYPES = {
+    'arrow': 'application/vnd.apache.arrow.stream',
+    'msgpack': 'application/msgpack'
+}
+
+QUOTE_COLUMNS = ['exchange', 'symbol', 'bid', 'ask', 'last', 'volume', 'spread', 'price_change']
+OPPORTUNITY_COLUMNS = [
+    'symbol', 'buy_exchange', 'buy_price', 'sell_exchange', 'sell_price', 'spread', 'profit', 'volume'
+]
+EXPORT_DATASETS = ('quotes', 'opportunities')
+
+
+def get_available_formats() -> List[str]:
+    """Export formats whose libraries are installed"""
+    available = {'arrow': PYARROW_AVAILABLE, 'msgpack': MSGPACK_AVAILABLE}
+    return [fmt for fmt in EXPORT_MIMETYPES if available[fmt]]
+
+
+def _rows_to_columns(rows: List[Dict], columns: List[str]) -> Dict[str, list]:
+    """Transpose row dicts into column lists"""
+    return {column: [row[column] for row in rows] for column in columns}
+
+
+def build_columns(snapshot, dataset: str) -> Dict[str, list]:
+    """
+    Column lists of a snapshot dataset
+
+    Args:
+        snapshot: MarketSnapshot
+        dataset: 'quotes' (every market of every exchange) or 'opportunities'
+    """
+    if dataset == 'quotes':
+        return _rows_to_columns(snapshot.search_index.rows, QUOTE_COLUMNS)
+
+    # Opportunities of this snapshot with the configured minimum spread, networks omitted
+    with pin_market_snapshot(snapshot):
+        opportunities = ArbitrageService().find_arbitrage_opportunities()
+    return _rows_to_columns(opportunities, OPPORTUNITY_COLUMNS)
+
+
+def _encode_arrow(columns: Dict[str, list], metadata: Dict[str, str]) -> bytes:
+    """Encode columns as an Arrow IPC stream"""
+    table = pyarrow.table(columns).replace_schema_metadata(metadata)
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _encode_msgpack(columns: Dict[str, list], metadata: Dict[str, str]) -> bytes:
+    """Encode columns as a msgpack map"""
+    return msgpack.packb(dict(metadata, columns=columns), use_bin_type=True)
+
+
+def export_snapshot(snapshot, fmt: str, dataset: str = 'quotes') -> bytes:
+    """
+    Encoded snapshot dataset, memoized on the snapshot
+
+    Args:
+        snapshot: MarketSnapshot
+        fmt: 'arrow' or 'msgpack'
+        dataset: 'quotes' or 'opportunities'
+
+    Raises:
+        ValueError: If the format or dataset is unknown or its library is not installed
+    """
+    if fmt not in get_available_formats():
+        raise ValueError(f"Export format '{fmt}' is not available, use one of: {', '.join(get_available_formats())}")
+    if dataset not in EXPORT_DATASETS:
+        raise ValueError(f"Unknown dataset '{dataset}', use one of: {', '.join(EXPORT_DATASETS)}")
+
+    def build(snap) -> bytes:
+        columns = snap.get_derived(('export_columns', dataset), lambda s: build_columns(s, dataset))
+        metadata = {
+            'snapshot_version': str(snap.version),
+            'created_at': str(snap.created_at),
+            'dataset': dataset
+        }
+        payload = _encode_arrow(columns, metadata) if fmt == 'arrow' else _encode_msgpack(columns, metadata)
+        logger.debug(f"Encoded {dataset} of snapshot v{snap.version} as {fmt} ({len(payload)} bytes)")
+        return payload
+
+    return snapshot.get_derived(('export', fmt, dataset), build)
@@ -0,0 +1,120 @@
+"""
+Async snapshot change notifications for ASGI long-poll and streaming clients
+One watcher task per process checks the snapshot; waiting clients are parked
+coroutines instead of threads
+"""
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, Optional
+
+from .snapshot import snapshot_manager
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSnapshotWatcher:
+    """
+    Publishes the latest market snapshot summary to async waiters
+
+    A single background task reads the snapshot in a worker thread every
+    interval seconds (inside a Flask app context, so exchange services work
+    as usual) and wakes all waiters when its version changes.
+    """
+
+    def __init__(self, app, interval: float = 1.0):
+        self.app = app
+        self.interval = interval
+        self.summary: Optional[Dict[str, Any]] = None
+
+        self._changed: Optional[asyncio.Event] = None
+        self._ready: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def version(self) -> int:
+        """Version of the latest published snapshot (0 before the first check)"""
+        return self.summary['version'] if self.summary else 0
+
+    def _read_summary(self) -> Dict[str, Any]:
+        """Get current snapshot summary (runs in a worker thread)"""
+        with self.app.app_context():
+            return snapshot_manager.get_snapshot().summary()
+
+    async def refresh(self):
+        """Check the snapshot once and wake waiters if it changed"""
+        summary = await asyncio.to_thread(self._read_summary)
+        if self.summary is None or summary['version'] != self.summary['version']:
+            self.summary = summary
+            changed, self._changed = self._changed, asyncio.Event()
+            if changed is not None:
+                changed.set()
+
+    async def _run(self):
+        """Watcher loop"""
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Snapshot watcher error: {e}")
+            self._ready.set()
+            await asyncio.sleep(self.interval)
+
+    async def start(self, wait: bool = True):
+        """
+        Start the watcher task (idempotent)
+
+        Args:
+            wait: Also wait for the first snapshot check to finish
+        """
+        if self._task is None:
+            self._changed = asyncio.Event()
+            self._ready = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        if wait:
+            await self._ready.wait()
+
+    async def stop(self):
+        """Cancel the watcher task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def wait_for_update(self, since: int, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Wait until a snapshot newer than since is published or timeout expires
+
+        Returns:
+            Latest snapshot summary (None if no snapshot could be read yet)
+        """
+        await self.start()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        while self.version <= since:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self._changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+
+        return self.summary
+
+    async def updates(self, since: int = 0, heartbeat: float = 15.0) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Yield every snapshot summary newer than since
+        Yields None after heartbeat seconds without a change
+        """
+        while True:
+            summary = await self.wait_for_update(since, heartbeat)
+            if summary is not None and summary['version'] > since:
+                since = summary['version']
+                yield summary
+            else:
+                yield None
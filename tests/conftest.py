@@ -5,14 +5,64 @@ from flask import Flask
 
 # Додаємо корінь проєкту в PYTHONPATH
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Module-level app in app.py is created on import: use the testing config there too
+os.environ.setdefault('FLASK_CONFIG', 'testing')
 
 from app import create_app  # Тепер працює правильно
+from services.exchanges.base import BaseExchangeService, get_exchange_manager
 
 @pytest.fixture
 def app() -> Flask:
-    flask_app = create_app()
+    flask_app = create_app('testing')
     return flask_app
 
 @pytest.fixture
 def client(app: Flask):
     return app.test_client()
+
+
+class FakeExchangeService(BaseExchangeService):
+    """In-memory exchange service used by API tests"""
+
+    def __init__(self, name, trading_data, networks_data=None):
+        super().__init__(name)
+        self.trading_data = trading_data
+        self.networks_data = networks_data or {}
+
+    def _fetch_trading_data(self):
+        return dict(self.trading_data)
+
+    def _fetch_networks_data(self):
+        return dict(self.networks_data)
+
+
+@pytest.fixture
+def fake_exchanges(app, monkeypatch):
+    """Replace registered exchanges with two in-memory exchanges"""
+    with app.app_context():
+        services = {
+            'Binance': FakeExchangeService('Binance', {
+                'BTCUSDT': {'symbol': 'BTCUSDT', 'bid': 100.0, 'ask': 101.0, 'last': 100.5,
+                            'volume': 5000.0, 'priceChangePercent': 1.5},
+                'ETHUSDT': {'symbol': 'ETHUSDT', 'bid': 10.0, 'ask': 10.1, 'last': 10.05,
+                            'volume': 9000.0, 'priceChangePercent': -4.0},
+                'DOGEUSDT': {'symbol': 'DOGEUSDT', 'bid': 0.1, 'ask': 0.1002, 'last': 0.1001,
+                             'volume': 100.0, 'priceChangePercent': 0.5}
+            }, {
+                'BTC': [{'name': 'BTC', 'deposit': True, 'withdraw': True, 'fee': '0.0005', 'min_withdraw': '0.001'}],
+                'ETH': [{'name': 'ERC20', 'deposit': True, 'withdraw': True, 'fee': '0.005', 'min_withdraw': '0.01'},
+                        {'name': 'ARBITRUM', 'deposit': True, 'withdraw': True, 'fee': '0.0001', 'min_withdraw': '0.01'}]
+            }),
+            'KuCoin': FakeExchangeService('KuCoin', {
+                'BTCUSDT': {'symbol': 'BTC-USDT', 'bid': 103.0, 'ask': 104.0, 'last': 103.5,
+                            'volume': 3000.0, 'priceChangePercent': 2.0},
+                'ETHUSDT': {'symbol': 'ETH-USDT', 'bid': 10.2, 'ask': 10.3, 'last': 10.25,
+                            'volume': 7000.0, 'priceChangePercent': -3.0}
+            }, {
+                'BTC': [{'name': 'BTC', 'deposit': True, 'withdraw': True, 'fee': '0.0004', 'min_withdraw': '0.002'}],
+                'ETH': [{'name': 'ERC20', 'deposit': False, 'withdraw': True, 'fee': '0.004', 'min_withdraw': '0.01'}]
+            })
+        }
+
+    monkeypatch.setattr(get_exchange_manager(), '_exchanges', services)
+    return services
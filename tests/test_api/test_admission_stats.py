@@ -0,0 +1,33 @@
+"""
+Admission control API tests
+"""
+
+
+def test_saturated_budget_serves_stale_or_503(client, fake_exchanges, monkeypatch):
+    """Test shed requests get the last good response flagged stale, else 503 with Retry-After."""
+    from utils.admission import get_admission_controller
+
+    controller = get_admission_controller()
+    monkeypatch.setattr(controller, 'max_wait', 0.01)
+
+    fresh = client.get('/api/v1/arbitrage?min_spread=0.1')
+    assert fresh.status_code == 200
+
+    controller.acquire(controller.budget)
+    try:
+        stale = client.get('/api/v1/arbitrage?min_spread=0.1')
+        assert stale.status_code == 200
+        assert stale.headers['X-Stale'] == 'true'
+        body = stale.get_json()
+        assert body['stale'] is True
+        assert body['data'] == fresh.get_json()['data']
+
+        busy = client.get('/api/v1/arbitrage?min_spread=0.2')
+        assert busy.status_code == 503
+        assert busy.headers['Retry-After']
+    finally:
+        controller.release(controller.budget)
+
+    stats = client.get('/api/v1/admission/stats').get_json()['data']
+    assert stats['in_use'] == 0
+    assert stats['endpoints']['arbitrage.api_arbitrage']['served_stale'] >= 1
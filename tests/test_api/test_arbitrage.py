@@ -0,0 +1,51 @@
+"""
+Arbitrage API tests
+"""
+
+
+def test_arbitrage_display_format(client, fake_exchanges):
+    """Test /arbitrage returns display strings by default."""
+    response = client.get('/api/v1/arbitrage?min_spread=0')
+    assert response.status_code == 200
+
+    opportunity = response.get_json()['data']['opportunities'][0]
+    assert opportunity['symbol'] == 'BTCUSDT'
+    assert opportunity['buyExchange'] == 'Binance' and opportunity['sellExchange'] == 'KuCoin'
+    assert opportunity['buyPrice'] == '$101.000000'
+    assert opportunity['spread'] == '1.98%'
+
+
+def test_arbitrage_raw_format_with_fields(client, fake_exchanges):
+    """Test /arbitrage format=raw returns native numbers for projected fields only."""
+    response = client.get('/api/v1/arbitrage?min_spread=0&format=raw&fields=symbol,buyPrice,spread')
+    assert response.status_code == 200
+
+    opportunities = response.get_json()['data']['opportunities']
+    assert opportunities[0] == {
+        'symbol': 'BTCUSDT',
+        'buyPrice': 101.0,
+        'spread': (103.0 - 101.0) / 101.0 * 100
+    }
+    assert all(set(opp) == {'symbol', 'buyPrice', 'spread'} for opp in opportunities)
+
+
+def test_opportunity_rankings_cache_is_bounded(app, client, fake_exchanges):
+    """Test rankings are cached per matched exchange set and only for the latest networks version."""
+    from services.network_index import get_network_index
+    from services.snapshot import snapshot_manager
+
+    for i in range(20):
+        assert client.get(f'/api/v1/arbitrage?min_spread=0&exchange=x{i}').status_code == 200
+    client.get('/api/v1/arbitrage?min_spread=0')
+    client.get('/api/v1/arbitrage?min_spread=0&exchange=')
+
+    with app.app_context():
+        snapshot = snapshot_manager.get_snapshot()
+        keys = [key for key in snapshot._derived if key[0] == 'opportunities']
+        assert keys == [('opportunities', ('Binance', 'KuCoin'))]
+
+        network_index = get_network_index()
+        network_index.version += 1
+        client.get('/api/v1/arbitrage?min_spread=0')
+        assert snapshot._derived[keys[0]][0] == network_index.version
+        assert len([key for key in snapshot._derived if key[0] == 'opportunities']) == 1
@@ -0,0 +1,73 @@
+"""
+Batch API tests
+"""
+from services import ArbitrageService, get_market_snapshot
+
+
+def test_batch_runs_queries_on_one_snapshot(app, client, fake_exchanges):
+    """Test /batch answers every sub-query with the views' own responses."""
+    response = client.post('/api/v1/batch', json={'queries': [
+        {'id': 'arbitrage', 'path': '/arbitrage', 'params': {'min_spread': 0, 'limit': 5}},
+        {'id': 'stats', 'path': '/arbitrage/stats'},
+        {'id': 'exchanges', 'path': '/api/v1/exchanges'},
+        {'id': 'top', 'path': '/tokens/top?metric=volume&limit=1'}
+    ]})
+    assert response.status_code == 200
+
+    data = response.get_json()['data']
+    results = {r['id']: r for r in data['results']}
+    assert all(r['status_code'] == 200 for r in results.values())
+    assert results['arbitrage']['body'] == client.get('/api/v1/arbitrage?min_spread=0&limit=5').get_json()
+    assert results['exchanges']['body']['data']['active'] == 2
+    assert results['top']['body']['data']['tokens'][0]['symbol'] == 'ETHUSDT'
+    with app.app_context():
+        assert data['snapshot_version'] == get_market_snapshot().version
+
+
+def test_batch_rejects_unsupported_queries(client, fake_exchanges):
+    """Test /batch refuses side-effecting or unknown paths and malformed bodies."""
+    results = client.post('/api/v1/batch', json={'queries': [
+        {'path': '/refresh'}, {'path': '/nope'}
+    ]}).get_json()['data']['results']
+    assert [r['status_code'] for r in results] == [404, 404]
+
+    assert client.post('/api/v1/batch', json={'queries': []}).status_code == 400
+    assert client.post('/api/v1/batch', json={'queries': ['/arbitrage']}).status_code == 400
+
+    response = client.post('/api/v1/batch', json=[{'path': '/tokens'}])
+    assert response.status_code == 400
+    assert response.get_json()['message'] == 'queries must be a non-empty list'
+
+
+def test_opportunities_memoized_per_snapshot(app, fake_exchanges):
+    """Test min_spread filters are prefixes of one ranking computed per snapshot."""
+    service = ArbitrageService()
+    with app.app_context():
+        everything = service.find_arbitrage_opportunities(min_spread=-100)
+        assert [op['symbol'] for op in everything] == ['BTCUSDT', 'ETHUSDT']
+        assert [op['symbol'] for op in service.find_arbitrage_opportunities(min_spread=1)] == ['BTCUSDT']
+        assert service.find_arbitrage_opportunities(min_spread=-100)[0] is everything[0]
+        assert everything[0]['networks'] == [
+            {'exchange': 'Binance', 'networks': 'BTC'}, {'exchange': 'KuCoin', 'networks': 'BTC'}
+        ]
+
+
+def test_batch_freshness_and_cost_cover_sub_queries(app, client, fake_exchanges, monkeypatch):
+    """Test per-query max_age is refused and admission charges the summed sub-query costs."""
+    from utils.admission import get_admission_controller
+
+    results = client.post('/api/v1/batch', json={'queries': [
+        {'path': '/arbitrage', 'params': {'max_age': 5}}, {'path': '/tokens/top?max_wait=1'}
+    ]}).get_json()['data']['results']
+    assert [r['status_code'] for r in results] == [400, 400]
+
+    controller = get_admission_controller()
+    charged = []
+    acquire = controller.acquire
+    monkeypatch.setattr(controller, 'acquire', lambda cost, timeout=None: (charged.append(cost), acquire(cost, timeout))[1])
+    client.post('/api/v1/batch', json={'queries': [{'path': '/arbitrage'}] * 3 + [{'path': '/nope'}]})
+    client.post('/api/v1/batch', json={'queries': [{'path': '/exchanges'}]})
+    assert charged == [12, 8]
+
+    response = client.post('/api/v1/batch?max_age=3600', json={'queries': [{'path': '/exchanges'}]})
+    assert response.status_code == 200
@@ -0,0 +1,60 @@
+
+
+def test_failing_exchange_serves_last_good_data(client, fake_exchanges, monkeypatch):
+    """Test a failing exchange keeps its last data, marked stale, without being retried per request."""
+    from services.snapshot import snapshot_manager
+
+    kucoin = fake_exchanges['KuCoin']
+    client.get('/api/v1/snapshot')
+    calls = []
+
+    def failing_fetch():
+        calls.append(1)
+        raise ConnectionError('timeout')
+
+    monkeypatch.setattr(kucoin, '_fetch_trading_data', failing_fetch)
+    kucoin._trading_cache_time = 1
+    snapshot_manager.clear()
+
+    response = client.get('/api/v1/tokens/compare/BTCUSDT')
+    assert response.headers['X-Stale-Exchanges'] == 'KuCoin'
+    quotes = {q['exchange']: q for q in response.get_json()['data']['comparisons']}
+    assert quotes['KuCoin']['bid'] == 103.0
+
+    client.get('/api/v1/tokens/compare/BTCUSDT')
+    assert len(calls) == 1
+
+    exchanges = {ex['name']: ex for ex in client.get('/api/v1/exchanges').get_json()['data']['exchanges']}
+    assert exchanges['KuCoin']['stale'] is True
+    assert exchanges['Binance']['circuit'] == 'closed'
+
+
+def test_refresh_deferred_by_rate_budget(client, fake_exchanges):
+    """Test a fetch over the exchange's rate budget is deferred and the cached data kept."""
+    binance = fake_exchanges['Binance']
+    binance.get_cached_trading_data()
+    binance._rate_budget.update_from_headers({'Retry-After': '60'}, status_code=429)
+
+    binance.trading_data['BTCUSDT'] = dict(binance.trading_data['BTCUSDT'], bid=50.0)
+    binance._trading_cache_time = 1
+    assert binance.get_cached_trading_data()['BTCUSDT']['bid'] == 100.0
+
+    budgets = {ex['name']: ex for ex in client.get('/api/v1/exchanges/rate-budget').get_json()['data']['exchanges']}
+    assert budgets['Binance']['deferred'] == 1
+    assert budgets['Binance']['trading_refresh_in'] > 59
+    assert budgets['KuCoin']['trading_refresh_in'] == 0
+
+
+def test_exchanges_reads_cached_state(app, client, fake_exchanges):
+    """Test /exchanges and /exchanges/health report stored state without fetching."""
+    data = client.get('/api/v1/exchanges').get_json()['data']
+    assert data['active'] == 0
+    assert fake_exchanges['Binance']._trading_cache_time == 0
+
+    with app.app_context():
+        fake_exchanges['Binance'].get_cached_trading_data()
+    data = client.get('/api/v1/exchanges').get_json()['data']
+    assert [ex['symbol_count'] for ex in data['exchanges']] == [3, 0]
+
+    health = client.get('/api/v1/exchanges/health').get_json()['data']
+    assert [ex['name'] for ex in health['exchanges']] == ['Binance', 'KuCoin']
@@ -0,0 +1,61 @@
+"""
+Networks API tests
+"""
+
+
+def test_networks_raw_format(client, fake_exchanges):
+    """Test /networks format=raw converts fees and limits to numbers."""
+    response = client.get('/api/v1/networks?format=raw&fields=token,exchange,network,fee')
+    assert response.status_code == 200
+
+    networks = response.get_json()['data']['networks']
+    btc = next(n for n in networks if n['token'] == 'BTC' and n['exchange'] == 'Binance')
+    assert btc == {'token': 'BTC', 'exchange': 'Binance', 'network': 'BTC', 'fee': 0.0005}
+
+
+def test_networks_default_format_keeps_strings(client, fake_exchanges):
+    """Test /networks keeps exchange fee strings by default."""
+    response = client.get('/api/v1/networks')
+    networks = response.get_json()['data']['networks']
+    assert all(isinstance(n['fee'], str) for n in networks)
+
+
+def test_compare_network_fees(client, fake_exchanges):
+    """Test /networks/compare/<token> lists withdraw options sorted by fee."""
+    response = client.get('/api/v1/networks/compare/eth')
+    assert response.status_code == 200
+
+    data = response.get_json()['data']
+    assert [(o['exchange'], o['network'], o['fee']) for o in data['fee_comparison']] == [
+        ('Binance', 'ARBITRUM', 0.0001), ('KuCoin', 'ERC20', 0.004), ('Binance', 'ERC20', 0.005)
+    ]
+    assert data['statistics']['lowest_fee'] == 0.0001
+
+    filtered = client.get('/api/v1/networks/compare/ETH?network=erc').get_json()['data']
+    assert [o['exchange'] for o in filtered['fee_comparison']] == ['KuCoin', 'Binance']
+
+    assert client.get('/api/v1/networks/compare/NOPE').status_code == 404
+
+
+def test_cheapest_networks(client, fake_exchanges):
+    """Test /networks/cheapest returns the cheapest option per token."""
+    data = client.get('/api/v1/networks/cheapest').get_json()['data']
+    assert [(o['token'], o['exchange'], o['network']) for o in data['cheapest_options']] == [
+        ('ETH', 'Binance', 'ARBITRUM'), ('BTC', 'KuCoin', 'BTC')
+    ]
+
+    data = client.get('/api/v1/networks/cheapest?network=erc20&limit=1').get_json()['data']
+    assert data['total_analyzed'] == 1 and data['returned'] == 1
+    assert data['cheapest_options'][0]['exchange'] == 'KuCoin'
+
+
+def test_supported_networks_and_status(client, fake_exchanges):
+    """Test /networks/supported and /networks/status serve deterministic aggregates."""
+    supported = client.get('/api/v1/networks/supported').get_json()['data']
+    assert [n['network'] for n in supported['networks']] == ['BTC', 'ERC20', 'ARBITRUM']
+    assert supported['most_popular']['supported_exchanges'] == ['Binance', 'KuCoin']
+
+    status = client.get('/api/v1/networks/status').get_json()['data']
+    assert list(status['exchanges']) == ['Binance', 'KuCoin']
+    assert status['exchanges']['KuCoin']['deposit_enabled'] == 1
+    assert status['totals']['unique_networks'] == 3
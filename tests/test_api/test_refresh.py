@@ -0,0 +1,31 @@
+"""
+Refresh API tests
+"""
+import time
+
+
+def test_refresh_runs_as_background_job(app, client, fake_exchanges):
+    """Test /refresh returns a job ID at once and keeps data an exchange failed to refresh."""
+    with app.app_context():
+        kucoin = fake_exchanges['KuCoin']
+        cached = kucoin.get_cached_trading_data()
+    kucoin.trading_data = {}
+
+    response = client.post('/api/v1/refresh')
+    assert response.status_code == 202
+    job_id = response.get_json()['data']['job_id']
+
+    for _ in range(200):
+        job = client.get(f'/api/v1/refresh/{job_id}').get_json()['data']
+        if job['finished_at'] is not None:
+            break
+        time.sleep(0.01)
+
+    assert job['status'] == 'completed_with_errors'
+    assert job['refreshed'] == ['Binance']
+    assert [e['exchange'] for e in job['errors']] == ['KuCoin']
+    assert job['exchanges']['Binance']['trading']['count'] == 3
+    assert 'duration' in job['exchanges']['KuCoin']['networks']
+    assert kucoin.get_cached_trading_data() is cached
+
+    assert client.get('/api/v1/refresh/unknown').status_code == 404
@@ -0,0 +1,167 @@
+"""
+Snapshot API tests
+"""
+import asyncio
+import json
+
+import pytest
+
+
+def test_snapshot_poll_returns_newer_snapshot(client, fake_exchanges):
+    """Test /snapshot/poll answers at once when the client is behind."""
+    data = client.get('/api/v1/snapshot/poll?since=0&timeout=5').get_json()['data']
+    assert data['changed'] is True
+    assert data['exchanges'] == {'Binance': 3, 'KuCoin': 2}
+
+    data = client.get(f"/api/v1/snapshot/poll?since={data['version']}&timeout=0").get_json()['data']
+    assert data['changed'] is False
+
+    assert client.get('/api/v1/snapshot/poll?since=abc').status_code == 400
+    for timeout in ('nan', 'inf', '-inf'):
+        assert client.get(f'/api/v1/snapshot/poll?since=999&timeout={timeout}').status_code == 400
+
+
+def test_asgi_long_poll_rejects_non_finite_timeout(app):
+    """Test the async long-poll and stream refuse NaN timeouts instead of waiting forever."""
+    pytest.importorskip('asgiref')
+    from utils.asgi import AsgiApplication
+
+    asgi_app = AsgiApplication(app)
+
+    async def request(path):
+        messages = []
+
+        async def receive():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {'type': 'http', 'method': 'GET', 'path': path, 'query_string': b'since=999&timeout=nan'}
+        await asyncio.wait_for(asgi_app(scope, receive, send), 2)
+        return messages[0]['status']
+
+    assert asyncio.run(request('/api/v1/snapshot/poll')) == 400
+    assert asyncio.run(request('/api/v1/snapshot/stream')) == 400
+
+
+def test_asgi_long_poll_wakes_on_new_snapshot(app, fake_exchanges):
+    """Test the async long-poll is woken by the watcher when an exchange refreshes."""
+    pytest.importorskip('asgiref')
+    from utils.asgi import AsgiApplication
+
+    asgi_app = AsgiApplication(app)
+    asgi_app.watcher.interval = 0.01
+
+    async def poll(since):
+        messages = []
+
+        async def receive():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {'type': 'http', 'method': 'GET', 'path': '/api/v1/snapshot/poll',
+                 'query_string': f'since={since}&timeout=5'.encode()}
+        await asgi_app(scope, receive, send)
+        return messages[0]['status'], json.loads(messages[1]['body'])['data']
+
+    async def scenario():
+        await asgi_app.watcher.start()
+        version = asgi_app.watcher.version
+
+        waiter = asyncio.create_task(poll(version))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        fake_exchanges['KuCoin'].clear_cache()
+        status, data = await asyncio.wait_for(waiter, 2)
+        await asgi_app.watcher.stop()
+        return version, status, data
+
+    version, status, data = asyncio.run(scenario())
+    assert status == 200
+    assert data['changed'] is True and data['version'] > version
+
+
+def test_snapshot_export_formats(client, fake_exchanges):
+    """Test /snapshot/export serves Arrow and msgpack columns with a version ETag."""
+    pyarrow = pytest.importorskip('pyarrow')
+    msgpack = pytest.importorskip('msgpack')
+
+    response = client.get('/api/v1/snapshot/export?format=arrow')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/vnd.apache.arrow.stream'
+    table = pyarrow.ipc.open_stream(response.data).read_all()
+    assert table.num_rows == 5
+    assert table.column('symbol').to_pylist()[:3] == ['BTCUSDT', 'ETHUSDT', 'DOGEUSDT']
+    assert table.schema.metadata[b'dataset'] == b'quotes'
+
+    etag = response.headers['ETag']
+    assert client.get('/api/v1/snapshot/export?format=arrow', headers={'If-None-Match': etag}).status_code == 304
+
+    payload = msgpack.unpackb(client.get('/api/v1/snapshot/export?format=msgpack&dataset=opportunities').data)
+    assert payload['dataset'] == 'opportunities'
+    assert payload['columns']['symbol'] == ['BTCUSDT', 'ETHUSDT']
+
+    assert client.get('/api/v1/snapshot/export?format=csv').status_code == 400
+
+
+def test_refetched_unchanged_data_keeps_snapshot_version(client, fake_exchanges):
+    """Test re-fetched identical data advances fetch times on a new snapshot of the same version."""
+    from services.snapshot import snapshot_manager
+
+    snapshot_manager.clear()
+    first = snapshot_manager.get_snapshot()
+    index = first.search_index
+    binance = fake_exchanges['Binance']
+    fetched_at = first.data_times['Binance']
+    binance._trading_cache_time = fetched_at + 60
+
+    second = snapshot_manager.get_snapshot()
+    assert second is not first
+    assert second.version == first.version
+    assert second.data_times['Binance'] == fetched_at + 60
+    assert second.search_index is index
+    # Requests that pinned the first snapshot keep its times
+    assert first.data_times['Binance'] == fetched_at
+    assert snapshot_manager.get_snapshot() is second
+
+
+def test_max_age_refreshes_stale_exchange_data(client, fake_exchanges, monkeypatch):
+    """Test max_age triggers a targeted refresh and responses report per-exchange data age."""
+    import time
+    from services.snapshot import snapshot_manager
+
+    client.get('/api/v1/tokens/search?q=BTC')
+    binance = fake_exchanges['Binance']
+    binance._trading_cache_time -= 120
+    binance.trading_data['BTCUSDT'] = dict(binance.trading_data['BTCUSDT'], bid=99.0)
+    snapshot_manager.clear()
+
+    response = client.get('/api/v1/snapshot')
+    assert float(response.get_json()['data']['data_age']['Binance']) >= 120
+
+    response = client.get('/api/v1/tokens/compare/BTCUSDT?max_age=5')
+    assert response.headers['X-Data-Fresh'] == 'true'
+    assert 'Binance=' in response.headers['X-Data-Age']
+    binance_quote = [q for q in response.get_json()['data']['comparisons'] if q['exchange'] == 'Binance']
+    assert binance_quote[0]['bid'] == 99.0
+
+    # A refresh slower than max_wait serves the current data flagged not fresh
+    fetch = binance._fetch_trading_data
+    monkeypatch.setattr(binance, '_fetch_trading_data', lambda: time.sleep(0.3) or fetch())
+    binance._trading_cache_time -= 120
+    snapshot_manager.clear()
+    start = time.monotonic()
+    response = client.get('/api/v1/tokens/compare/BTCUSDT?max_age=5&max_wait=0.05')
+    assert time.monotonic() - start < 0.25
+    assert response.status_code == 200
+    assert response.headers['X-Data-Fresh'] == 'false'
+    binance.request_trading_refresh().result(timeout=2)
+
+    assert client.get('/api/v1/tokens/compare/BTCUSDT?max_age=-1').status_code == 400
+    for query in ('max_age=nan', 'max_age=5&max_wait=nan', 'max_age=5&max_wait=inf'):
+        assert client.get(f'/api/v1/tokens/compare/BTCUSDT?{query}').status_code == 400
+    assert client.get('/api/v1/tokens/compare/BTCUSDT?max_age=inf').status_code == 200
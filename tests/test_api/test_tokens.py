@@ -0,0 +1,114 @@
+"""
+Tokens API tests
+"""
+from services import get_market_snapshot
+
+
+def test_search_tokens(client, fake_exchanges):
+    """Test /tokens/search returns matches sorted by volume."""
+    response = client.get('/api/v1/tokens/search?q=btc')
+    assert response.status_code == 200
+
+    data = response.get_json()['data']
+    assert data['total_found'] == 2
+    assert [(t['exchange'], t['symbol']) for t in data['tokens']] == [('Binance', 'BTCUSDT'), ('KuCoin', 'BTCUSDT')]
+
+
+def test_search_tokens_requires_query(client, fake_exchanges):
+    """Test /tokens/search rejects an empty query."""
+    assert client.get('/api/v1/tokens/search').status_code == 400
+
+
+def test_snapshot_reused_until_refresh(app, fake_exchanges):
+    """Test the market snapshot is rebuilt only after an exchange refresh."""
+    with app.app_context():
+        first = get_market_snapshot()
+        assert get_market_snapshot() is first
+        assert first.search_index is first.search_index
+
+        fake_exchanges['Binance'].clear_cache()
+        second = get_market_snapshot()
+        assert second is not first and second.version > first.version
+
+
+def test_compare_token(client, fake_exchanges):
+    """Test /tokens/compare/<symbol> matches normalized symbols on every exchange."""
+    response = client.get('/api/v1/tokens/compare/btc-usdt')
+    assert response.status_code == 200
+
+    data = response.get_json()['data']
+    assert [c['exchange'] for c in data['comparisons'] if c['available']] == ['Binance', 'KuCoin']
+    assert data['statistics']['highest_bid'] == 103.0 and data['statistics']['lowest_ask'] == 101.0
+
+
+def test_compare_tokens_batch(client, fake_exchanges):
+    """Test /tokens/compare?symbols= answers several symbols from one snapshot."""
+    response = client.get('/api/v1/tokens/compare?symbols=BTCUSDT,dogeusdt,NOPEUSDT')
+    assert response.status_code == 200
+
+    results = response.get_json()['data']['results']
+    assert list(results) == ['BTCUSDT', 'DOGEUSDT', 'NOPEUSDT']
+    assert results['BTCUSDT']['statistics']['available_exchanges'] == 2
+    assert [c['available'] for c in results['DOGEUSDT']['comparisons']] == [True, False]
+    assert results['NOPEUSDT']['statistics'] == {}
+
+    assert client.get('/api/v1/tokens/compare').status_code == 400
+
+
+def test_top_tokens(client, fake_exchanges):
+    """Test /tokens/top ranks markets by the requested metric."""
+    data = client.get('/api/v1/tokens/top?metric=price_change&limit=2').get_json()['data']
+    assert [(t['exchange'], t['symbol']) for t in data['tokens']] == [('Binance', 'ETHUSDT'), ('KuCoin', 'ETHUSDT')]
+    assert data['total_analyzed'] == 5 and data['returned'] == 2
+
+    data = client.get('/api/v1/tokens/top?exchange=kucoin').get_json()['data']
+    assert [t['symbol'] for t in data['tokens']] == ['ETHUSDT', 'BTCUSDT']
+
+
+def test_exchange_tokens_table_cached_until_refresh(app, client, fake_exchanges):
+    """Test /tokens/<exchange_id> reuses the formatted table until exchange data changes."""
+    data = client.get('/api/v1/tokens/binance').get_json()['data']
+    assert [t['symbol'] for t in data['tokens']] == ['BTCUSDT', 'DOGEUSDT', 'ETHUSDT']
+    assert data['tokens'][2]['networks'] == [
+        {'name': 'ERC20', 'label': 'ERC20 (0.005 USDT)'},
+        {'name': 'ARBITRUM', 'label': 'ARBITRUM (0.0001 USDT)'}
+    ]
+
+    service = fake_exchanges['Binance']
+    with app.app_context():
+        table = service.format_token_data(service.get_cached_trading_data())
+        assert service.format_token_data(service.get_cached_trading_data()) is table
+
+        service.clear_cache()
+        assert service.format_token_data(service.get_cached_trading_data()) is not table
+
+
+def test_exchange_without_data_keeps_its_tokens_table(app, client, fake_exchanges, monkeypatch):
+    """Test /tokens does not format missing exchange data over the exchange's cached table."""
+    from types import SimpleNamespace
+
+    from routes.tokens import api_all_tokens
+    from services.snapshot import MarketSnapshot, snapshot_manager
+
+    kucoin = fake_exchanges['KuCoin']
+    client.get('/api/v1/tokens/kucoin')
+    table = kucoin._formatted_tokens_cache
+
+    with app.app_context():
+        binance_only = MarketSnapshot(1, {'Binance': fake_exchanges['Binance'].get_cached_trading_data()})
+    monkeypatch.setattr(snapshot_manager, 'source',
+                        SimpleNamespace(get_snapshot=lambda max_age, wait: binance_only))
+
+    # Called directly: the arbitrage blueprint's /tokens view is matched first for the URL
+    for _ in range(2):
+        with app.test_request_context('/api/v1/tokens'):
+            data = api_all_tokens().get_json()['data']
+        assert data['exchanges']['kucoin']['count'] == 0
+    assert kucoin._formatted_tokens_cache is table
+def test_tokens_fields_projection(client, fake_exchanges):
+    """Test /tokens keeps only requested fields of token rows."""
+    response = client.get('/api/v1/tokens?fields=symbol,best_spread')
+    assert response.status_code == 200
+
+    tokens = response.get_json()['data']['tokens']
+    assert tokens and all(set(token) == {'symbol', 'best_spread'} for token in tokens)
@@ -1,6 +1,7 @@
 import pytest
 from types import SimpleNamespace
 from services.exchanges.binance import BinanceService
+from services.health import get_health_monitor
 
 def test_binance_fetch_trading_data_success(app):
     """Test BinanceService._fetch_trading_data returns filtered and normalized data for USDT pairs."""
@@ -163,8 +164,9 @@ def test_binance_get_health_status(app):
     """Test BinanceService.get_health_status reflects client and connection status."""
     service = BinanceService()
     service.client = object()  # Simulate client initialized
-    # Case 1: connected
+    # Case 1: connected (status reads the latest scheduled probe)
     service.test_connection = lambda: True
+    get_health_monitor().probe(service)
     status = service.get_health_status()
     assert status["name"] == "Binance"
     assert status["available"] is True  # BINANCE_AVAILABLE should be True if library installed
@@ -173,6 +175,8 @@ def test_binance_get_health_status(app):
     assert status["last_error"] is None
     # Case 2: disconnected
     service.test_connection = lambda: False
+    get_health_monitor().probe(service)
     status2 = service.get_health_status()
     assert status2["connected"] is False
+    assert status2["last_error"] == "Connection test failed"
 
@@ -1,5 +1,4 @@
 import pytest
-import requests
 from services.exchanges.stub_services import BitgetService
 
 class DummyResponse:
@@ -19,7 +18,7 @@ def test_bitget_fetch_trading_data_success(app, monkeypatch):
             {"symbol": "ZERO_USDT", "bidPrice": "0", "askPrice": "1", "close": "1", "volume": "50"}
         ]
     }
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse(dummy_data))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse(dummy_data))
     data = service._fetch_trading_data()
     # Only BTCUSDT should be included
     assert "BTCUSDT" in data and data["BTCUSDT"]["bid"] == 500.0 and data["BTCUSDT"]["ask"] == 505.0
@@ -29,14 +28,14 @@ def test_bitget_fetch_trading_data_success(app, monkeypatch):
 def test_bitget_fetch_trading_data_bad_status(app, monkeypatch):
     """Test BitgetService._fetch_trading_data returns empty dict on HTTP status != 200."""
     service = BitgetService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse({"data": []}, status=503))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse({"data": []}, status=503))
     data = service._fetch_trading_data()
     assert data == {}
 
 def test_bitget_fetch_trading_data_error(app, monkeypatch):
     """Test BitgetService._fetch_trading_data returns empty dict on exception."""
     service = BitgetService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: (_ for _ in ()).throw(Exception("Network error")))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: (_ for _ in ()).throw(Exception("Network error")))
     data = service._fetch_trading_data()
     assert data == {}
 
@@ -56,7 +55,7 @@ def test_bitget_fetch_networks_data_success(app, monkeypatch):
             {"foo": "bar"}
         ]
     }
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse(dummy_data))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse(dummy_data))
     data = service._fetch_networks_data()
     # BTC should be included with both chains
     assert "BTC" in data and isinstance(data["BTC"], list)
@@ -75,14 +74,14 @@ def test_bitget_fetch_networks_data_success(app, monkeypatch):
 def test_bitget_fetch_networks_data_bad_status(app, monkeypatch):
     """Test BitgetService._fetch_networks_data returns empty dict on HTTP status != 200."""
     service = BitgetService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse({}, status=400))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse({}, status=400))
     data = service._fetch_networks_data()
     assert data == {}
 
 def test_bitget_fetch_networks_data_error(app, monkeypatch):
     """Test BitgetService._fetch_networks_data returns empty dict on exception."""
     service = BitgetService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: (_ for _ in ()).throw(Exception("Network error")))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: (_ for _ in ()).throw(Exception("Network error")))
     data = service._fetch_networks_data()
     assert data == {}
 
@@ -0,0 +1,32 @@
+from unittest.mock import patch
+
+from services.exchanges.circuit_breaker import CircuitBreaker
+
+
+def test_circuit_breaker_opens_and_backs_off():
+    """Test failures are negatively cached, open the circuit and double the backoff per failed trial."""
+    breaker = CircuitBreaker(failure_threshold=2, base_backoff=10, max_backoff=30, negative_ttl=1)
+
+    with patch('services.exchanges.circuit_breaker.time.time', return_value=100.0):
+        assert breaker.allow_request()
+        breaker.record_failure('timeout')
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert not breaker.allow_request()
+
+    with patch('services.exchanges.circuit_breaker.time.time', return_value=101.5):
+        assert breaker.allow_request()
+        breaker.record_failure('timeout')
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.get_status()['retry_at'] == 111.5
+
+    with patch('services.exchanges.circuit_breaker.time.time', return_value=112.0):
+        assert breaker.allow_request()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert not breaker.allow_request()
+        breaker.record_failure('timeout')
+        assert breaker.backoff == 20
+
+    with patch('services.exchanges.circuit_breaker.time.time', return_value=133.0):
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.is_closed and breaker.allow_request()
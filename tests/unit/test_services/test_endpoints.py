@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import requests
+
+from services.exchanges.endpoints import EndpointSelector
+from services.exchanges.stub_services import HuobiService
+
+
+def test_endpoint_selector_prefers_fastest_healthy_host():
+    """Test hosts are ranked by measured latency with unhealthy hosts last."""
+    selector = EndpointSelector(['https://a', 'https://b', 'https://c'])
+    assert selector.choose() == 'https://a'
+
+    selector.record_latency('https://a', 0.2)
+    selector.record_latency('https://b', 0.05)
+    assert selector.ordered() == ['https://b', 'https://a', 'https://c']
+
+    selector.record_failure('https://b', 'timeout')
+    assert selector.ordered() == ['https://a', 'https://c', 'https://b']
+
+    selector.record_latency('https://b', 0.05)
+    assert selector.choose() == 'https://b'
+
+
+def test_api_get_fails_over_to_next_host(app, monkeypatch):
+    """Test a connection error on the preferred host retries the request on the next one."""
+    with app.app_context():
+        service = HuobiService()
+    calls = []
+
+    def get(url, timeout=None):
+        calls.append(url)
+        if url.startswith('https://api.huobi.pro'):
+            raise requests.ConnectionError('connection refused')
+        return SimpleNamespace(status_code=200, headers={}, json=lambda: {'status': 'ok', 'data': 1})
+
+    monkeypatch.setattr(service.session, 'get', get)
+    assert service._api_get('/v1/common/timestamp').status_code == 200
+    assert calls == ['https://api.huobi.pro/v1/common/timestamp', 'https://api-aws.huobi.pro/v1/common/timestamp']
+
+    service._api_get('/v1/common/timestamp')
+    assert calls[-1].startswith('https://api-aws.huobi.pro')
+    assert service.get_endpoint_status()[-1]['healthy'] is False
+
+
+def test_binance_client_calls_keep_their_host(app):
+    """Test concurrent SDK calls never run on a host set by another thread."""
+    import threading
+    import time
+
+    from services.exchanges.binance import BinanceService
+
+    with app.app_context():
+        service = BinanceService()
+    mismatches = []
+
+    def call():
+        host = service.client.API_URL
+        time.sleep(0.001)
+        if service.client.API_URL != host:
+            mismatches.append(host)
+        return {}
+
+    service.client = SimpleNamespace(API_URL=None, MARGIN_API_URL=None, ping=call)
+    orders = [service._endpoints.hosts, list(reversed(service._endpoints.hosts))]
+
+    def worker(order):
+        for _ in range(20):
+            service._endpoints.ordered = lambda: order
+            service._client_call('ping')
+
+    threads = [threading.Thread(target=worker, args=(order,)) for order in orders]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert mismatches == []
@@ -1,5 +1,4 @@
 import pytest
-import requests
 from services.exchanges.stub_services import GateioService
 
 class DummyResponse:
@@ -17,7 +16,7 @@ def test_gateio_fetch_trading_data_success(app, monkeypatch):
         {"currency_pair": "ETH_BTC", "bid": "10", "ask": "11", "last": "10.5", "quote_volume": "500"},
         {"currency_pair": "ZERO_USDT", "bid": "0", "ask": "1", "last": "1", "quote_volume": "10"}
     ]
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse(dummy_data))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse(dummy_data))
     data = service._fetch_trading_data()
     # Only BTCUSDT should be included
     assert isinstance(data, dict)
@@ -28,14 +27,14 @@ def test_gateio_fetch_trading_data_success(app, monkeypatch):
 def test_gateio_fetch_trading_data_bad_status(app, monkeypatch):
     """Test GateioService._fetch_trading_data returns empty dict on HTTP status != 200."""
     service = GateioService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse([], status=404))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse([], status=404))
     data = service._fetch_trading_data()
     assert data == {}
 
 def test_gateio_fetch_trading_data_error(app, monkeypatch):
     """Test GateioService._fetch_trading_data returns empty dict on request exception."""
     service = GateioService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: (_ for _ in ()).throw(Exception("Network error")))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: (_ for _ in ()).throw(Exception("Network error")))
     data = service._fetch_trading_data()
     assert data == {}
 
@@ -47,7 +46,7 @@ def test_gateio_fetch_networks_data_success(app, monkeypatch):
         {"currency": "BTC", "chain": "Lightning", "is_deposit_disabled": 1, "is_withdraw_disabled": 1, "withdraw_fee": "0.0001"},
         {"currency": "ETH", "chain": "ETH", "is_deposit_disabled": 0, "is_withdraw_disabled": 0, "withdraw_fee": "0.01"}
     ]
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse(dummy_data))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse(dummy_data))
     data = service._fetch_networks_data()
     # Should group networks by currency
     assert "BTC" in data and "ETH" in data
@@ -66,14 +65,14 @@ def test_gateio_fetch_networks_data_success(app, monkeypatch):
 def test_gateio_fetch_networks_data_bad_status(app, monkeypatch):
     """Test GateioService._fetch_networks_data returns empty dict on HTTP status != 200."""
     service = GateioService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse([], status=500))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse([], status=500))
     data = service._fetch_networks_data()
     assert data == {}
 
 def test_gateio_fetch_networks_data_error(app, monkeypatch):
     """Test GateioService._fetch_networks_data returns empty dict on exception."""
     service = GateioService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: (_ for _ in ()).throw(Exception("Network error")))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: (_ for _ in ()).throw(Exception("Network error")))
     data = service._fetch_networks_data()
     assert data == {}
 
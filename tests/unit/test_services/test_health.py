@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+
+from services.health import HealthMonitor
+
+
+def make_service(name, result):
+    def test_connection():
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return SimpleNamespace(name=name, test_connection=test_connection)
+
+
+def test_health_monitor_records_probe_results():
+    """Test probes store latency, last success and consecutive failures."""
+    monitor = HealthMonitor()
+    assert monitor.get_status('A') is None
+
+    ok = monitor.probe(make_service('A', True))
+    assert ok['connected'] is True and ok['last_success'] == ok['last_checked']
+    assert ok['latency_ms'] >= 0
+
+    failed = monitor.probe(make_service('A', ConnectionError('timeout')))
+    assert failed['connected'] is False
+    assert failed['last_error'] == 'timeout'
+    assert failed['last_success'] == ok['last_success']
+    assert monitor.probe(make_service('A', False))['consecutive_failures'] == 2
+
+    assert monitor.get_all()['A']['last_error'] == 'Connection test failed'
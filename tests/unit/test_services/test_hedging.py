@@ -0,0 +1,46 @@
+import itertools
+import time
+
+from services.exchanges.hedging import LatencyTracker, RequestHedger
+
+
+def make_hedger():
+    tracker = LatencyTracker(min_samples=5)
+    for _ in range(10):
+        tracker.record(0.01)
+    return RequestHedger(enabled=True, percentile=95, min_delay=0.01, tracker=tracker)
+
+
+def slow_then_fast():
+    """send() whose first call stalls and later calls answer at once"""
+    calls = itertools.count()
+
+    def send():
+        if next(calls) == 0:
+            time.sleep(0.5)
+            return 'slow'
+        return 'fast'
+    return send
+
+
+def test_slow_request_is_hedged_and_fast_response_wins():
+    """Test a request slower than the latency percentile gets a duplicate that wins."""
+    hedger = make_hedger()
+    start = time.perf_counter()
+    assert hedger.call(slow_then_fast(), lambda: True) == 'fast'
+    assert time.perf_counter() - start < 0.3
+
+    stats = hedger.get_stats()
+    assert stats['hedged'] == 1 and stats['hedge_wins'] == 1
+    assert stats['hedge_delay_ms'] == 10.0
+
+
+def test_hedge_skipped_without_rate_budget():
+    """Test no duplicate is sent when the rate budget refuses it."""
+    hedger = make_hedger()
+    assert hedger.call(slow_then_fast(), lambda: False) == 'slow'
+    assert hedger.get_stats()['skipped_budget'] == 1
+    assert hedger.get_stats()['hedged'] == 0
+
+    hedger.enabled = False
+    assert hedger.call(lambda: 'plain', lambda: True) == 'plain'
@@ -1,5 +1,4 @@
 import pytest
-import requests
 from services.exchanges.stub_services import HuobiService
 
 class DummyResponse:
@@ -19,7 +18,7 @@ def test_huobi_fetch_trading_data_success(app, monkeypatch):
             {"symbol": "zerousdt", "bid": 0, "ask": 1, "close": "1", "vol": "10"}
         ]
     }
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse(dummy_data))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse(dummy_data))
     data = service._fetch_trading_data()
     # Should include only BTCUSDT
     assert "BTCUSDT" in data and data["BTCUSDT"]["bid"] == 101.0 and data["BTCUSDT"]["ask"] == 102.0
@@ -29,14 +28,14 @@ def test_huobi_fetch_trading_data_success(app, monkeypatch):
 def test_huobi_fetch_trading_data_bad_status(app, monkeypatch):
     """Test HuobiService._fetch_trading_data returns empty dict on HTTP status != 200."""
     service = HuobiService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse({}, status=500))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse({}, status=500))
     data = service._fetch_trading_data()
     assert data == {}
 
 def test_huobi_fetch_trading_data_error(app, monkeypatch):
     """Test HuobiService._fetch_trading_data returns empty dict on exception."""
     service = HuobiService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: (_ for _ in ()).throw(Exception("Network error")))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: (_ for _ in ()).throw(Exception("Network error")))
     data = service._fetch_trading_data()
     assert data == {}
 
@@ -55,7 +54,7 @@ def test_huobi_fetch_networks_data_success(app, monkeypatch):
             {"currency": "eth", "chains": []}
         ]
     }
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse(dummy_data))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse(dummy_data))
     data = service._fetch_networks_data()
     # BTC should be included with both chains
     assert "BTC" in data and isinstance(data["BTC"], list)
@@ -72,14 +71,14 @@ def test_huobi_fetch_networks_data_success(app, monkeypatch):
 def test_huobi_fetch_networks_data_bad_status(app, monkeypatch):
     """Test HuobiService._fetch_networks_data returns empty dict on HTTP status != 200."""
     service = HuobiService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse({}, status=404))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse({}, status=404))
     data = service._fetch_networks_data()
     assert data == {}
 
 def test_huobi_fetch_networks_data_error(app, monkeypatch):
     """Test HuobiService._fetch_networks_data returns empty dict on exception."""
     service = HuobiService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: (_ for _ in ()).throw(Exception("Network error")))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: (_ for _ in ()).throw(Exception("Network error")))
     data = service._fetch_networks_data()
     assert data == {}
 
@@ -1,5 +1,4 @@
 import pytest
-import requests
 from types import SimpleNamespace
 from services.exchanges.kucoin import KucoinService
 
@@ -64,7 +63,7 @@ def test_kucoin_fetch_networks_data_success(app, monkeypatch):
             }
         ]
     }
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse(dummy_data))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse(dummy_data))
     data = service._fetch_networks_data()
     # BTC should be included with both networks (BTC and Lightning)
     assert "BTC" in data
@@ -77,7 +76,7 @@ def test_kucoin_fetch_networks_data_success(app, monkeypatch):
 def test_kucoin_fetch_networks_data_bad_status(app, monkeypatch):
     """Test KucoinService._fetch_networks_data returns empty on HTTP status != 200."""
     service = KucoinService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse({}, status=500))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse({}, status=500))
     data = service._fetch_networks_data()
     assert data == {}
 
@@ -85,14 +84,14 @@ def test_kucoin_fetch_networks_data_invalid_code(app, monkeypatch):
     """Test KucoinService._fetch_networks_data returns empty if API returns error code."""
     service = KucoinService()
     dummy_data = {"code": "400100", "data": []}
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse(dummy_data))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse(dummy_data))
     data = service._fetch_networks_data()
     assert data == {}
 
 def test_kucoin_fetch_networks_data_error(app, monkeypatch):
     """Test KucoinService._fetch_networks_data returns empty dict on exception."""
     service = KucoinService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: (_ for _ in ()).throw(Exception("Network error")))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: (_ for _ in ()).throw(Exception("Network error")))
     data = service._fetch_networks_data()
     assert data == {}
 
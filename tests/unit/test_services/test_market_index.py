@@ -0,0 +1,105 @@
+from services.market_index import SymbolSearchIndex, TokenRankings, QuoteIndex
+from services.snapshot import MarketSnapshot
+
+
+def make_index():
+    snapshot = MarketSnapshot(1, {
+        'Binance': {
+            'BTCUSDT': {'bid': 100.0, 'ask': 101.0, 'last': 100.5, 'volume': 500.0},
+            'BTCDOMUSDT': {'bid': 10.0, 'ask': 10.0, 'last': 10.0, 'volume': 50.0},
+            'ETHUSDT': {'bid': 10.0, 'ask': 10.1, 'last': 10.05, 'volume': 900.0}
+        },
+        'KuCoin': {
+            'BTCUSDT': {'bid': 103.0, 'ask': 104.0, 'last': 103.5, 'volume': 300.0},
+            'WBTCUSDT': {'bid': 99.0, 'ask': 100.0, 'last': 99.5, 'volume': 10.0}
+        }
+    })
+    return SymbolSearchIndex.build(snapshot)
+
+
+def brute_force(index, query, exchange=None, min_volume=0):
+    """Reference implementation mirroring the original linear scan"""
+    return sorted(
+        (row for row in index.rows
+         if query in row['symbol']
+         and (not exchange or row['exchange'].lower() == exchange.lower())
+         and row['volume'] >= min_volume),
+        key=lambda row: row['volume'], reverse=True
+    )
+
+
+def test_search_substring_matches_linear_scan():
+    """Test n-gram substring search returns the same rows as a full scan."""
+    index = make_index()
+    for query in ('B', 'BTC', 'BTCU', 'TCUSDT', 'USDT', 'XYZ', 'BTCDOMUSDT'):
+        rows, total = index.search(query, limit=100)
+        assert rows == brute_force(index, query), query
+        assert total == len(rows)
+
+
+def test_search_prefix_and_filters():
+    """Test prefix matching, exchange posting lists and volume filter."""
+    index = make_index()
+
+    rows, total = index.search('BTC', match='prefix')
+    assert [(r['exchange'], r['symbol']) for r in rows] == [
+        ('Binance', 'BTCUSDT'), ('KuCoin', 'BTCUSDT'), ('Binance', 'BTCDOMUSDT')
+    ]
+
+    rows, total = index.search('BTC', exchange='kucoin')
+    assert {r['symbol'] for r in rows} == {'BTCUSDT', 'WBTCUSDT'}
+
+    rows, total = index.search('BTC', min_volume=100, limit=1)
+    assert total == 2 and rows[0]['symbol'] == 'BTCUSDT' and rows[0]['exchange'] == 'Binance'
+
+
+def test_search_precomputes_spread():
+    """Test rows carry the internal spread and can be ranked by it."""
+    index = make_index()
+    rows, _ = index.search('USDT', sort_by='spread', limit=1)
+    assert rows[0]['symbol'] == 'BTCDOMUSDT' and rows[0]['spread'] == 0
+
+
+def test_quote_index_lookup_normalizes_symbols():
+    """Test QuoteIndex returns every exchange's quote for a canonical symbol."""
+    snapshot = MarketSnapshot(1, {
+        'Binance': {'BTCUSDT': {'bid': 1.0}},
+        'Gate.io': {'BTC_USDT': {'bid': 2.0}, 'BTCUSDT': {'bid': 3.0}}
+    })
+    index = QuoteIndex.build(snapshot)
+
+    assert index.lookup('btc/usdt') == {'Binance': {'bid': 1.0}, 'Gate.io': {'bid': 2.0}}
+    assert index.lookup('ETHUSDT') == {}
+
+
+def test_rankings_match_full_sort():
+    """Test partial-sort rankings equal a full stable sort for every metric."""
+    index = make_index()
+    index.price_changes[:] = [5.0, -7.0, 1.0, -7.0, 0.0]
+    rankings = TokenRankings(index)
+    rankings.DEPTH = 2
+
+    for metric, column in (('volume', index.volumes),
+                           ('price_change', [abs(v) for v in index.price_changes]),
+                           ('spread', [abs(v) for v in index.spreads])):
+        expected = sorted(range(len(index.rows)), key=lambda r: column[r], reverse=True)
+        for limit in (1, 2, 5):
+            rows, total = rankings.top(metric, limit=limit)
+            assert rows == [index.rows[r] for r in expected[:limit]], (metric, limit)
+            assert total == 5
+
+    rows, total = rankings.top('volume', limit=10, exchange='KUCOIN')
+    assert [r['symbol'] for r in rows] == ['BTCUSDT', 'WBTCUSDT'] and total == 2
+
+
+def test_rankings_do_not_cache_unknown_filters():
+    """Test unlisted exchanges and unknown metrics do not add cached views."""
+    rankings = TokenRankings(make_index())
+    rankings.top('volume', exchange='binance')
+    cached = len(rankings._views)
+
+    for i in range(50):
+        assert rankings.top('volume', exchange=f"nope-{i}") == ([], 0)
+        rankings.top(f"metric-{i}", limit=1)
+
+    assert len(rankings._views) == cached + 1
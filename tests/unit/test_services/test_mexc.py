@@ -1,5 +1,4 @@
 import pytest
-import requests
 from services.exchanges.stub_services import MexcService
 
 class DummyResponse:
@@ -17,7 +16,7 @@ def test_mexc_fetch_trading_data_success(app, monkeypatch):
         {"symbol": "ETHBTC", "bidPrice": "0.01", "askPrice": "0.011", "lastPrice": "0.0105", "volume": "100"},
         {"symbol": "ZEROUSDT", "bidPrice": "0", "askPrice": "1", "lastPrice": "1", "volume": "10"}
     ]
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse(dummy_data))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse(dummy_data))
     data = service._fetch_trading_data()
     # Should include only BTCUSDT
     assert "BTCUSDT" in data and data["BTCUSDT"]["bid"] == 1000.0 and data["BTCUSDT"]["ask"] == 1005.0
@@ -27,14 +26,14 @@ def test_mexc_fetch_trading_data_success(app, monkeypatch):
 def test_mexc_fetch_trading_data_bad_status(app, monkeypatch):
     """Test MexcService._fetch_trading_data returns empty dict on HTTP status != 200."""
     service = MexcService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: DummyResponse([], status=404))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: DummyResponse([], status=404))
     data = service._fetch_trading_data()
     assert data == {}
 
 def test_mexc_fetch_trading_data_error(app, monkeypatch):
     """Test MexcService._fetch_trading_data returns empty dict on exception."""
     service = MexcService()
-    monkeypatch.setattr(requests, "get", lambda url, timeout=10: (_ for _ in ()).throw(Exception("Network error")))
+    monkeypatch.setattr(service.session, "get", lambda url, timeout=None: (_ for _ in ()).throw(Exception("Network error")))
     data = service._fetch_trading_data()
     assert data == {}
 
@@ -0,0 +1,144 @@
+from types import SimpleNamespace
+
+from services.network_index import NetworkIndex
+
+
+def make_exchange(networks_data):
+    exchange = SimpleNamespace(networks_data=networks_data)
+    exchange.get_cached_networks_data = lambda: exchange.networks_data
+    return exchange
+
+
+def test_network_index_parses_and_sorts_fees():
+    """Test options are sorted by parsed fee with non-numeric fees treated as zero."""
+    exchanges = {
+        'A': make_exchange({'USDT': [
+            {'name': 'ERC20', 'withdraw': True, 'fee': '5'},
+            {'name': 'MEMO', 'withdraw': True, 'fee': 'n/a'},
+            {'name': 'OFF', 'withdraw': False, 'fee': '0.1'}
+        ]}),
+        'B': make_exchange({'USDT': [{'name': 'TRC20', 'withdraw': True, 'fee': '1'}]})
+    }
+    index = NetworkIndex().sync(exchanges)
+
+    assert [(o['exchange'], o['network'], o['fee']) for o in index.get_token_options('USDT')] == [
+        ('A', 'MEMO', None), ('B', 'TRC20', 1.0), ('A', 'ERC20', 5.0)
+    ]
+    cheapest = index.get_cheapest_options()
+    assert cheapest[0]['network'] == 'TRC20'
+
+
+def test_network_index_recomputes_only_changed_exchange():
+    """Test a refreshed exchange replaces only its own contribution."""
+    exchanges = {
+        'A': make_exchange({'BTC': [{'name': 'BTC', 'withdraw': True, 'fee': '0.001'}]}),
+        'B': make_exchange({'BTC': [{'name': 'BTC', 'withdraw': True, 'fee': '0.002'}]})
+    }
+    index = NetworkIndex().sync(exchanges)
+    built = index._withdraw_options['B']
+
+    exchanges['A'].networks_data = {'BTC': [{'name': 'LN', 'withdraw': True, 'fee': '0.003'}]}
+    index.sync(exchanges)
+
+    assert index._withdraw_options['B'] is built
+    assert [o['network'] for o in index.get_token_options('BTC')] == ['BTC', 'LN']
+    assert index.get_cheapest_options()[0]['exchange'] == 'B'
+
+
+def test_network_aggregates_follow_exchange_refresh():
+    """Test coverage and status aggregates subtract the old contribution of a refreshed exchange."""
+    exchanges = {
+        'A': make_exchange({
+            'USDT': [{'name': 'TRC20', 'deposit': True, 'withdraw': True, 'fee': '1'},
+                     {'name': 'ERC20', 'deposit': True, 'withdraw': False, 'fee': '5'}],
+            'ETH': [{'name': 'ERC20', 'deposit': False, 'withdraw': True, 'fee': '0.01'}]
+        }),
+        'B': make_exchange({'USDT': [{'name': 'ERC20', 'deposit': True, 'withdraw': True, 'fee': '4'}]})
+    }
+    index = NetworkIndex().sync(exchanges)
+
+    supported = index.get_supported_networks()
+    assert supported[0] == {
+        'network': 'ERC20', 'supported_exchanges': ['A', 'B'], 'exchange_count': 2,
+        'supported_tokens': ['ETH', 'USDT'], 'token_count': 2, 'total_pairs': 3
+    }
+    status = index.get_status_summary()
+    assert status['exchanges']['A']['deposit_enabled'] == 2 and status['exchanges']['A']['withdraw_enabled'] == 2
+    assert status['totals'] == {'unique_tokens': 2, 'unique_networks': 2, 'total_exchanges': 2, 'active_exchanges': 2}
+
+    exchanges['A'].networks_data = {'USDT': [{'name': 'TRC20', 'deposit': True, 'withdraw': True, 'fee': '1'}]}
+    index.sync(exchanges)
+
+    erc20 = next(n for n in index.get_supported_networks() if n['network'] == 'ERC20')
+    assert erc20['supported_exchanges'] == ['B'] and erc20['supported_tokens'] == ['USDT'] and erc20['total_pairs'] == 1
+    assert index.get_status_summary()['totals']['unique_tokens'] == 1
+
+
+def test_exchange_networks_follow_refresh():
+    """Test per-exchange network names are rebuilt and the version bumped on refresh."""
+    exchanges = {
+        'A': make_exchange({'ETH': [{'name': 'ERC20'}, {'name': 'ARBITRUM'}]}),
+        'B': make_exchange({'ETH': []})
+    }
+    index = NetworkIndex().sync(exchanges)
+    version = index.version
+
+    assert index.get_exchange_networks('ETH') == [{'exchange': 'A', 'networks': 'ARBITRUM, ERC20'}]
+
+    exchanges['B'].networks_data = {'ETH': [{'name': 'ERC20'}]}
+    index.sync(exchanges)
+
+    assert index.version > version
+    assert [n['exchange'] for n in index.get_exchange_networks('ETH')] == ['A', 'B']
+
+
+def test_views_are_consistent_with_concurrent_syncs():
+    """Test readers never fail or cache views of older data while another thread syncs."""
+    import threading
+
+    exchanges = {name: make_exchange({}) for name in ('A', 'B')}
+    index = NetworkIndex().sync(exchanges)
+    errors = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            try:
+                index.get_supported_networks()
+                index.get_status_summary()
+                index.get_cheapest_options()
+                index.get_exchange_networks('T0')
+            except Exception as e:
+                errors.append(e)
+
+    readers = [threading.Thread(target=read) for _ in range(3)]
+    for reader in readers:
+        reader.start()
+    for i in range(200):
+        exchanges['A'].networks_data = {
+            f"T{j}": [{'name': f"N{i}-{j}", 'deposit': True, 'withdraw': True, 'fee': str(j)}] for j in range(20)
+        }
+        index.sync(exchanges)
+    done.set()
+    for reader in readers:
+        reader.join()
+
+    assert errors == []
+    assert {n['network'] for n in index.get_supported_networks()} == {f"N199-{j}" for j in range(20)}
+    assert index.get_exchange_networks('T0') == [{'exchange': 'A', 'networks': 'N199-0'}]
+
+
+def test_status_follows_refetch_of_unchanged_networks():
+    """Test re-fetched but unchanged networks advance the status fetch time without rebuilding the index."""
+    exchanges = {'A': make_exchange({'BTC': [{'name': 'BTC', 'withdraw': True, 'fee': '0.001'}]})}
+    exchanges['A']._networks_cache_time = 100.0
+    index = NetworkIndex().sync(exchanges)
+    version = index.version
+    before = index.get_status_summary()
+
+    exchanges['A']._networks_cache_time = 160.0
+    index.sync(exchanges)
+
+    assert index.version == version
+    assert index.get_status_summary()['exchanges']['A']['last_updated'] == 160.0
+    assert before['exchanges']['A']['last_updated'] == 100.0
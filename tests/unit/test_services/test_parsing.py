@@ -0,0 +1,62 @@
+import json
+
+from services.exchanges.parsing import (
+    columns_to_quotes, get_parse_pool, parse_ticker_data, parse_ticker_payload, shutdown_parse_pool
+)
+
+
+BINANCE_TICKERS = [
+    {'symbol': 'BTCUSDT', 'bidPrice': '50000.0', 'askPrice': '50001.0', 'lastPrice': '50000.5',
+     'volume': '100', 'quoteVolume': '5000000', 'priceChange': '10', 'priceChangePercent': '0.02', 'count': 42},
+    {'symbol': 'ETHBTC', 'bidPrice': '0.05', 'askPrice': '0.051'},
+    {'symbol': 'DEADUSDT', 'bidPrice': '0', 'askPrice': '1.0'}
+]
+
+HUOBI_TICKERS = {'data': [
+    {'symbol': 'ethusdt', 'bid': [3000.0, 1.5], 'ask': 3001.0, 'close': 3000.5, 'vol': 10},
+    {'symbol': 'ethbtc', 'bid': 0.05, 'ask': 0.051}
+]}
+
+
+def test_parse_binance_tickers():
+    """Test Binance tickers become quotes keyed by normalized symbol, filtering non-USDT and zero prices."""
+    quotes = columns_to_quotes(parse_ticker_data('binance', BINANCE_TICKERS))
+
+    assert list(quotes) == ['BTCUSDT']
+    assert quotes['BTCUSDT'] == {
+        'symbol': 'BTCUSDT', 'bid': 50000.0, 'ask': 50001.0, 'last': 50000.5, 'volume': 100.0,
+        'quoteVolume': 5000000.0, 'priceChange': 10.0, 'priceChangePercent': 0.02, 'count': 42
+    }
+
+
+def test_parse_pool_matches_inline_parsing():
+    """Test parsing a raw body in the process pool gives the same quotes as inline parsing."""
+    payload = json.dumps(HUOBI_TICKERS).encode()
+    try:
+        parsed = get_parse_pool(1).submit(parse_ticker_payload, 'huobi', payload).result(timeout=60)
+    finally:
+        shutdown_parse_pool()
+
+    expected = columns_to_quotes(parse_ticker_data('huobi', HUOBI_TICKERS))
+    assert columns_to_quotes(parsed) == expected
+    assert expected == {'ETHUSDT': {'symbol': 'ethusdt', 'bid': 3000.0, 'ask': 3001.0, 'last': 3000.5, 'volume': 10.0}}
+
+
+def test_binance_raw_tickers_feed_rate_budget_once(app, monkeypatch):
+    """Test the raw ticker path parses the body and reports its rate-limit headers once."""
+    from types import SimpleNamespace
+
+    from services.exchanges.binance import BinanceService
+
+    app.config.update(PARSE_POOL_ENABLED=True, PARSE_POOL_MIN_BYTES=1 << 30)
+    with app.app_context():
+        service = BinanceService()
+        body = json.dumps(BINANCE_TICKERS).encode()
+        response = SimpleNamespace(status_code=200, headers={'X-MBX-USED-WEIGHT-1M': '40'}, content=body,
+                                   json=lambda: json.loads(body))
+        monkeypatch.setattr(service.session, 'get', lambda url, timeout=None: response)
+        updates = []
+        monkeypatch.setattr(service._rate_budget, 'update_from_headers', lambda *args: updates.append(args))
+
+        assert list(service._fetch_trading_data()) == ['BTCUSDT']
+        assert len(updates) == 1
@@ -0,0 +1,103 @@
+import json
+
+from services.exchanges.stub_services import GateioService
+
+
+CHAINS = [
+    {"currency": "USDT", "chain": "TRX", "is_deposit_disabled": 0, "is_withdraw_disabled": 0, "withdraw_fee": "1"},
+    {"currency": "USDT", "chain": "ETH", "is_deposit_disabled": 0, "is_withdraw_disabled": 1, "withdraw_fee": "5"}
+]
+TICKERS = [
+    {"currency_pair": "BTC_USDT", "bid": "100.0", "ask": "101.0", "last": "100.5", "quote_volume": "1000"}
+]
+
+
+class RawResponse:
+    def __init__(self, data=None, status=200, headers=None):
+        self.content = json.dumps(data).encode() if data is not None else b''
+        self.status_code = status
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def test_unchanged_networks_body_is_not_reparsed(app, monkeypatch):
+    """Test an identical networks body returns the cached object and does not bump the networks version."""
+    with app.app_context():
+        service = GateioService()
+        monkeypatch.setattr(service.session, "get", lambda url, timeout=None: RawResponse(CHAINS))
+
+        service._set_networks_data(service._fetch_networks_data(), 0)
+        first = service._networks_data_cache
+        version = service._networks_version
+        assert first["USDT"][1] == {"name": "ETH", "deposit": True, "withdraw": False, "fee": "5"}
+
+        service._set_networks_data(service._fetch_networks_data(), 0)
+        assert service._networks_data_cache is first
+        assert service._networks_version == version
+        assert service.get_cache_stats()["payloads"] == {"parsed": 1, "unchanged": 1, "not_modified": 0}
+
+        changed = [dict(CHAINS[0], withdraw_fee="2"), CHAINS[1]]
+        monkeypatch.setattr(service.session, "get", lambda url, timeout=None: RawResponse(changed))
+        service._set_networks_data(service._fetch_networks_data(), 0)
+        assert service._networks_data_cache["USDT"][0]["fee"] == "2"
+        assert service._networks_version == version + 1
+
+
+def test_conditional_request_reuses_result_on_not_modified(app, monkeypatch):
+    """Test the cached ETag is sent back and a 304 returns the previously parsed result."""
+    with app.app_context():
+        service = GateioService()
+        requests = []
+
+        def get(url, timeout=None, headers=None):
+            requests.append(headers)
+            if headers:
+                return RawResponse(status=304)
+            return RawResponse(CHAINS, headers={"ETag": '"v1"'})
+
+        monkeypatch.setattr(service.session, "get", get)
+        first = service._fetch_networks_data()
+        assert service._fetch_networks_data() is first
+        assert requests == [None, {"If-None-Match": '"v1"'}]
+        assert service.get_cache_stats()["payloads"]["not_modified"] == 1
+
+
+def test_unchanged_tickers_keep_trading_data(app, monkeypatch):
+    """Test identical ticker bodies keep the same trading data object until the body changes."""
+    with app.app_context():
+        service = GateioService()
+        monkeypatch.setattr(service.session, "get", lambda url, timeout=None: RawResponse(TICKERS))
+        first = service._fetch_trading_data()
+        assert service._fetch_trading_data() is first
+
+        monkeypatch.setattr(service.session, "get", lambda url, timeout=None: RawResponse([dict(TICKERS[0], bid="99.5")]))
+        assert service._fetch_trading_data()["BTCUSDT"]["bid"] == 99.5
+
+
+def test_binance_networks_hash_only_their_own_response(app):
+    """Test Binance networks are compared by the response of their own call, not the client's last one."""
+    from types import SimpleNamespace
+
+    from services.exchanges.binance import BinanceService
+
+    coins = [{'coin': 'USDT', 'networkList': [{'network': 'TRX', 'withdrawEnable': True, 'withdrawFee': '1'}]}]
+    with app.app_context():
+        service = BinanceService()
+        client = SimpleNamespace(API_URL=None, MARGIN_API_URL=None, response=None)
+
+        def get_all_coins_info():
+            client.response = RawResponse(coins)
+            return coins
+
+        client.get_all_coins_info = get_all_coins_info
+        service.client = client
+
+        first = service._fetch_networks_data()
+        assert first['USDT'][0]['name'] == 'TRX'
+        assert service._fetch_networks_data() is first
+
+        # A call that leaves no response behind is parsed, never matched against an earlier body
+        client.get_all_coins_info = lambda: coins
+        assert service._fetch_networks_data() is not first
@@ -0,0 +1,34 @@
+from services.exchanges.rate_budget import RateBudget
+
+
+def test_rate_budget_defers_when_spent():
+    """Test endpoint weights drain the bucket down to the safety reserve."""
+    budget = RateBudget(capacity=100, window=100, weights={'trading': 40}, safety=0.9)
+
+    assert budget.try_acquire('trading')
+    assert budget.try_acquire('trading')
+    assert not budget.try_acquire('trading')
+    # 20 left, 10 reserved: 30 more weight needed at 1 per second
+    assert 29 < budget.time_until_available('trading') <= 30
+    assert budget.time_until_available('ping') == 0
+    assert budget.get_status()['deferred'] == 1
+
+
+def test_rate_budget_adapts_to_exchange_headers():
+    """Test used-weight and remaining headers reset the bucket and 429 blocks until Retry-After."""
+    budget = RateBudget(capacity=6000, window=60, weights={'trading': 80},
+                        used_weight_header='X-MBX-USED-WEIGHT-1M')
+    budget.update_from_headers({'x-mbx-used-weight-1m': '5900'})
+    assert not budget.try_acquire('trading')
+
+    budget.update_from_headers({'x-mbx-used-weight-1m': '100'})
+    assert budget.try_acquire('trading')
+
+    budget.update_from_headers({'Retry-After': '30'}, status_code=429)
+    assert budget.time_until_available('ping') > 29
+
+    remaining = RateBudget(capacity=600, window=5, remaining_header='X-Bapi-Limit-Status',
+                           limit_header='X-Bapi-Limit')
+    remaining.update_from_headers({'X-Bapi-Limit': '100', 'X-Bapi-Limit-Status': '5'})
+    assert remaining.capacity == 100
+    assert remaining.time_until_available('tickers') > 0
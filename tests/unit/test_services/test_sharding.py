@@ -0,0 +1,43 @@
+from services.arbitrage import rank_opportunities
+from services.sharding import HashRing, ShardedArbitrageEngine
+
+
+def make_trading_data(symbols=200):
+    return {
+        exchange: {
+            f"TKN{i}USDT": {'symbol': f"TKN{i}USDT", 'bid': 1.0 + offset + i % 7 / 100, 'ask': 1.01 + offset, 'volume': 10.0}
+            for i in range(symbols)
+        }
+        for exchange, offset in (('Binance', 0.0), ('KuCoin', 0.02), ('MEXC', 0.05))
+    }
+
+
+def test_adding_shard_moves_small_share_of_symbols():
+    """Test adding a fifth shard moves only the symbols it takes over, about a fifth of them."""
+    symbols = [f"TKN{i}USDT" for i in range(5000)]
+    ring = HashRing([f"shard-{i}" for i in range(4)])
+    before = {symbol: ring.get_shard(symbol) for symbol in symbols}
+
+    ring.add('shard-4')
+    moved = [symbol for symbol in symbols if ring.get_shard(symbol) != before[symbol]]
+
+    assert all(ring.get_shard(symbol) == 'shard-4' for symbol in moved)
+    assert 0.1 < len(moved) / len(symbols) < 0.3
+
+
+def test_sharded_ranking_matches_local_ranking():
+    """Test merging shard rankings gives the in-process ranking and top_k keeps the best."""
+    trading_data = make_trading_data()
+    expected = rank_opportunities(trading_data)
+    engine = ShardedArbitrageEngine(2, timeout=60)
+    try:
+        ranked = engine.rank(trading_data)
+        top = engine.rank(trading_data, top_k=5)
+        status = engine.get_status()
+    finally:
+        engine.shutdown()
+
+    assert sorted(ranked, key=lambda op: op['symbol']) == sorted(expected, key=lambda op: op['symbol'])
+    assert [op['spread'] for op in ranked] == [op['spread'] for op in expected]
+    assert [op['spread'] for op in top] == [op['spread'] for op in expected[:5]]
+    assert status['fallbacks'] == 0 and sum(status['shards'].values()) == 200
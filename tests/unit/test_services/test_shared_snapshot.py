@@ -0,0 +1,106 @@
+from types import SimpleNamespace
+
+import services.shared_snapshot as shared_snapshot
+from services.shared_snapshot import SharedSnapshotSource, SharedSnapshotStore, SnapshotIngestor
+
+
+QUOTE = {'symbol': 'BTCUSDT', 'bid': 50000.0, 'ask': 50001.0}
+
+
+def make_manager(trading_data, data_times=None, refreshes=None):
+    def get_all_trading_data(max_age=None, wait=None):
+        if refreshes is not None:
+            refreshes.append(max_age)
+        return trading_data
+
+    return SimpleNamespace(
+        get_all_trading_data=get_all_trading_data,
+        get_trading_data_times=lambda: dict(data_times or {name: 1700000000.0 for name in trading_data}),
+        get_stale_exchanges=lambda: ['Binance']
+    )
+
+
+def test_published_snapshot_is_mapped_by_other_processes(tmp_path):
+    """Test a snapshot published through one store is read through another, once per version."""
+    writer = SharedSnapshotStore(str(tmp_path))
+    reader = SharedSnapshotStore(str(tmp_path))
+    assert reader.get_snapshot() is None
+
+    writer.publish(7, {'Binance': {'BTCUSDT': QUOTE}}, {'Binance': 1700000000.0}, ['Binance'])
+    snapshot = reader.get_snapshot()
+    assert snapshot.version == 7
+    assert snapshot.trading_data == {'Binance': {'BTCUSDT': QUOTE}}
+    assert snapshot.summary()['stale_exchanges'] == ['Binance']
+    assert reader.get_snapshot() is snapshot
+
+    writer.publish(8, {'Binance': {}}, {'Binance': None}, [])
+    assert reader.get_snapshot().version == 8
+    assert SharedSnapshotSource(reader).get_snapshot().version == 8
+
+
+def test_single_ingestor_is_elected_and_publishes_changes(tmp_path, monkeypatch):
+    """Test only the lock holder ingests, unchanged data is not republished and versions continue after failover."""
+    trading_data = {'Binance': {'BTCUSDT': QUOTE}}
+    monkeypatch.setattr(shared_snapshot, 'get_exchange_manager', lambda: make_manager(trading_data))
+    store = SharedSnapshotStore(str(tmp_path))
+    first = SnapshotIngestor(store)
+    second = SnapshotIngestor(SharedSnapshotStore(str(tmp_path)))
+
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    assert first.ingest()
+    assert not first.ingest()
+    assert store.get_snapshot().version == 1
+
+    first.release()
+    assert second.try_acquire()
+    assert second.get_status()['role'] == 'ingestor'
+    assert second.ingest()
+    assert store.get_snapshot().version == 2
+    second.release()
+
+
+def test_refetched_data_republishes_fetch_times_only(tmp_path, monkeypatch):
+    """Test re-fetched identical data keeps its version and the readers' derived values but advances ages."""
+    trading_data = {'Binance': {'BTCUSDT': QUOTE}}
+    data_times = {'Binance': 1700000000.0}
+    monkeypatch.setattr(shared_snapshot, 'get_exchange_manager', lambda: make_manager(trading_data, data_times))
+    store = SharedSnapshotStore(str(tmp_path))
+    reader = SharedSnapshotStore(str(tmp_path))
+    ingestor = SnapshotIngestor(store)
+    assert ingestor.try_acquire()
+
+    assert ingestor.ingest()
+    first = reader.get_snapshot()
+    built = first.get_derived('index', lambda snap: object())
+
+    data_times['Binance'] = 1700000060.0
+    assert ingestor.ingest()
+    refreshed = reader.get_snapshot()
+    assert refreshed is not first and refreshed.version == first.version == 1
+    assert refreshed.data_times == {'Binance': 1700000060.0}
+    assert first.data_times == {'Binance': 1700000000.0}
+    assert refreshed.trading_data is first.trading_data
+    assert refreshed.get_derived('index', lambda snap: object()) is built
+    assert not ingestor.ingest()
+    ingestor.release()
+
+
+def test_readers_forward_refreshes_to_the_ingestor(tmp_path, monkeypatch):
+    """Test a max_age request of a reader makes the ingestor refresh at that age, once per request."""
+    refreshes = []
+    trading_data = {'Binance': {'BTCUSDT': QUOTE}}
+    monkeypatch.setattr(shared_snapshot, 'get_exchange_manager',
+                        lambda: make_manager(trading_data, refreshes=refreshes))
+    store = SharedSnapshotStore(str(tmp_path))
+    ingestor = SnapshotIngestor(store, refresh_interval=30)
+    assert ingestor.try_acquire()
+    ingestor.ingest()
+
+    source = SharedSnapshotSource(SharedSnapshotStore(str(tmp_path)))
+    assert source.get_snapshot(max_age=5, wait=0).version == 1
+    source.get_snapshot(max_age=5, wait=0)
+    ingestor.ingest()
+    ingestor.ingest()
+    assert refreshes == [30, 5, 30]
+    ingestor.release()
@@ -0,0 +1,147 @@
+from types import SimpleNamespace
+
+import services.snapshot_distribution as snapshot_distribution
+from services.snapshot_distribution import (
+    InMemoryBroker, SnapshotPublisher, SnapshotSubscriber, apply_delta, compute_delta
+)
+
+
+def quote(bid):
+    return {'symbol': 'BTCUSDT', 'bid': bid, 'ask': bid + 1}
+
+
+def make_manager(state):
+    return SimpleNamespace(
+        get_all_trading_data=lambda: state['data'],
+        get_trading_data_times=lambda: state.get('times') or {name: 1700000000.0 for name in state['data']},
+        get_stale_exchanges=lambda: []
+    )
+
+
+def make_publisher(broker, state, monkeypatch, full_every=30):
+    monkeypatch.setattr(snapshot_distribution, 'get_exchange_manager', lambda: make_manager(state))
+    publisher = SnapshotPublisher(broker, full_every=full_every)
+    assert publisher._take_lease()
+    return publisher
+
+
+def test_delta_round_trip():
+    """Test applying a computed delta reproduces the new data and keeps unchanged exchanges."""
+    kucoin = {'ETHUSDT': quote(3000.0)}
+    previous = {'Binance': {'BTCUSDT': quote(1.0), 'OLDUSDT': quote(2.0)}, 'KuCoin': kucoin, 'MEXC': {}}
+    current = {'Binance': {'BTCUSDT': quote(1.5), 'NEWUSDT': quote(3.0)}, 'KuCoin': kucoin}
+
+    changes = compute_delta(previous, current)
+    assert changes == {
+        'Binance': {'set': {'BTCUSDT': quote(1.5), 'NEWUSDT': quote(3.0)}, 'removed': ['OLDUSDT']},
+        'MEXC': None
+    }
+    applied = apply_delta(previous, changes)
+    assert applied == current
+    assert applied['KuCoin'] is kucoin
+
+
+def test_subscriber_applies_deltas_from_publisher(monkeypatch):
+    """Test a subscriber follows full snapshots and deltas, and a second publisher cannot take the lease."""
+    broker = InMemoryBroker()
+    state = {'data': {'Binance': {'BTCUSDT': quote(1.0)}}}
+    publisher = make_publisher(broker, state, monkeypatch)
+    subscriber = SnapshotSubscriber(broker)
+
+    assert publisher.publish() == 1
+    assert publisher.publish() is None
+    state['data'] = {'Binance': {'BTCUSDT': quote(2.0)}}
+    assert publisher.publish() == 2
+    assert not SnapshotPublisher(broker)._take_lease()
+
+    subscriber.poll(timeout=0)
+    snapshot = subscriber.get_snapshot()
+    assert snapshot.version == 2
+    assert snapshot.trading_data == {'Binance': {'BTCUSDT': quote(2.0)}}
+    assert subscriber.get_status()['full'] == 1 and subscriber.get_status()['deltas'] == 1
+
+
+def test_subscriber_catches_up_after_missed_messages(monkeypatch):
+    """Test a subscriber that missed deltas reloads the checkpoint and replays the stream."""
+    broker = InMemoryBroker()
+    state = {'data': {'Binance': {'BTCUSDT': quote(1.0)}}}
+    publisher = make_publisher(broker, state, monkeypatch)
+    subscriber = SnapshotSubscriber(broker)
+
+    publisher.publish()
+    subscriber.poll(timeout=0)
+    for bid in (2.0, 3.0, 4.0):
+        state['data'] = {'Binance': {'BTCUSDT': quote(bid)}}
+        publisher.publish()
+
+    # Lose version 2, the delta for version 3 no longer fits
+    subscriber.last_id = '2'
+    subscriber.poll(timeout=0)
+    assert subscriber.get_status()['catch_ups'] == 1
+    subscriber.poll(timeout=0)
+
+    snapshot = subscriber.get_snapshot()
+    assert snapshot.version == 4
+    assert snapshot.trading_data['Binance']['BTCUSDT']['bid'] == 4.0
+
+
+def test_publisher_failover_continues_after_deltas(monkeypatch):
+    """Test a new publisher continues after the last delta, so every node converges on its data."""
+    broker = InMemoryBroker()
+    state = {'data': {'Binance': {'BTCUSDT': quote(1.0)}}}
+    first = make_publisher(broker, state, monkeypatch)
+    subscriber = SnapshotSubscriber(broker)
+    for bid in (1.0, 2.0, 3.0):
+        state['data'] = {'Binance': {'BTCUSDT': quote(bid)}}
+        first.publish()
+    subscriber.poll(timeout=0)
+    assert subscriber.version == 3
+
+    first.stop()
+    second = make_publisher(broker, {'data': {'Binance': {'BTCUSDT': quote(9.0)}}}, monkeypatch)
+    assert second.publish() == 4
+
+    late = SnapshotSubscriber(broker)
+    assert late.catch_up()
+    for node in (subscriber, late):
+        node.poll(timeout=0)
+        snapshot = node.get_snapshot()
+        assert snapshot.version == 4
+        assert snapshot.trading_data['Binance']['BTCUSDT']['ask'] == 10.0
+
+
+def test_full_snapshot_of_new_publisher_replaces_newer_version():
+    """Test a full snapshot from another publisher is applied even when its version is not newer."""
+    subscriber = SnapshotSubscriber(InMemoryBroker())
+    base = {'type': 'full', 'created_at': 0.0, 'data_times': {}, 'stale_exchanges': []}
+    subscriber.apply(dict(base, version=5, publisher='a', trading_data={'Binance': {'BTCUSDT': quote(1.0)}}))
+    subscriber.apply(dict(base, version=5, publisher='a', trading_data={}))
+    assert subscriber.get_snapshot().trading_data == {'Binance': {'BTCUSDT': quote(1.0)}}
+
+    subscriber.apply(dict(base, version=2, publisher='b', trading_data={'Binance': {'BTCUSDT': quote(7.0)}}))
+    assert subscriber.version == 2
+    assert subscriber.get_snapshot().trading_data == {'Binance': {'BTCUSDT': quote(7.0)}}
+
+
+def test_refetched_unchanged_data_publishes_times(monkeypatch):
+    """Test new fetch times of unchanged data reach subscribers under the same version."""
+    broker = InMemoryBroker()
+    state = {'data': {'Binance': {'BTCUSDT': quote(1.0)}}}
+    publisher = make_publisher(broker, state, monkeypatch)
+    subscriber = SnapshotSubscriber(broker)
+
+    assert publisher.publish() == 1
+    subscriber.poll(timeout=0)
+    first = subscriber.get_snapshot()
+
+    state['times'] = {'Binance': 1700000060.0}
+    assert publisher.publish() is None
+    assert publisher.publish() is None
+    subscriber.poll(timeout=0)
+
+    snapshot = subscriber.get_snapshot()
+    assert snapshot.version == 1
+    assert snapshot.data_times == {'Binance': 1700000060.0}
+    assert first.data_times == {'Binance': 1700000000.0}
+    assert publisher.get_status()['times'] == 1
+    assert subscriber.get_status()['times'] == 1
@@ -0,0 +1,44 @@
+import threading
+import time
+
+from utils.admission import AdmissionController
+
+
+def test_admission_controller_sheds_when_budget_saturated():
+    """Test requests over the budget wait, then are shed after max_wait."""
+    controller = AdmissionController(budget=8, max_wait=0.05)
+
+    assert controller.acquire(6)[0] is True
+    assert controller.acquire(2)[0] is True
+    admitted, wait = controller.acquire(4)
+    assert admitted is False
+    assert wait >= 0.05
+
+    controller.release(6)
+    assert controller.acquire(4)[0] is True
+    assert controller.get_stats()['in_use'] == 6
+
+
+def test_admission_controller_admits_in_fifo_order():
+    """Test a queued heavy request is not overtaken by later light requests."""
+    controller = AdmissionController(budget=4, max_wait=2.0)
+    controller.acquire(3)
+    order = []
+
+    def worker(name, cost):
+        if controller.acquire(cost)[0]:
+            order.append(name)
+            controller.release(cost)
+
+    heavy = threading.Thread(target=worker, args=('heavy', 4))
+    heavy.start()
+    time.sleep(0.05)
+    light = threading.Thread(target=worker, args=('light', 1))
+    light.start()
+    time.sleep(0.05)
+    assert order == []
+
+    controller.release(3)
+    heavy.join()
+    light.join()
+    assert order == ['heavy', 'light']
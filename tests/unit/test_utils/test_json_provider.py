@@ -0,0 +1,62 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from utils.json_provider import OrjsonJSONProvider, ORJSON_AVAILABLE, init_json_provider
+
+pytestmark = pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")
+
+
+@pytest.fixture
+def json_app():
+    app = Flask(__name__)
+    app.json = OrjsonJSONProvider(app)
+    return app
+
+
+def test_orjson_response_matches_stdlib_output(json_app):
+    """Test OrjsonJSONProvider produces the same document as the default provider."""
+    payload = {
+        'status': 'success',
+        'data': {'tokens': [{'symbol': 'BTCUSDT', 'bid': 100.5, 'ask': 101.0, 'networks': []}], 'count': 1},
+        'updated': datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        'price': Decimal('1.25')
+    }
+    stdlib_app = Flask(__name__)
+    stdlib_app.json = DefaultJSONProvider(stdlib_app)
+
+    with json_app.app_context():
+        fast = json.loads(json_app.json.response(payload).get_data())
+    with stdlib_app.app_context():
+        slow = json.loads(stdlib_app.json.response(payload).get_data())
+
+    assert fast == slow
+    assert fast['updated'] == 'Thu, 02 Jan 2025 03:04:05 GMT'
+
+
+def test_orjson_dumps_falls_back_for_unsupported_values(json_app):
+    """Test integers wider than 64 bits are handled by the stdlib encoder."""
+    with json_app.app_context():
+        assert json.loads(json_app.json.dumps({'big': 2 ** 70})) == {'big': 2 ** 70}
+
+
+def test_orjson_dumps_honours_custom_kwargs(json_app):
+    """Test json.dumps-only arguments are passed through to the stdlib encoder."""
+    with json_app.app_context():
+        assert json_app.json.dumps({'b': 1, 'a': 2}, sort_keys=False) == '{"b": 1, "a": 2}'
+
+
+def test_init_json_provider_selects_by_config():
+    """Test init_json_provider honours the JSON_PROVIDER setting."""
+    app = Flask(__name__)
+    app.config['JSON_PROVIDER'] = 'stdlib'
+    init_json_provider(app)
+    assert type(app.json) is DefaultJSONProvider
+
+    app.config['JSON_PROVIDER'] = 'orjson'
+    init_json_provider(app)
+    assert isinstance(app.json, OrjsonJSONProvider)
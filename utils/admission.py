@@ -0,0 +1,242 @@
+"""
+Cost-aware admission control for expensive API routes
+Heavy routes share a weighted concurrency budget; when it stays saturated
+requests are shed with the last good response (flagged stale) or 503
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from typing import Dict, Optional, Tuple
+
+from flask import Flask, current_app, jsonify, request
+
+
+logger = logging.getLogger(__name__)
+
+ADMISSION_COST_KEY = 'arbitrage.admission_cost'
+
+# Cost weights of heavy endpoints; endpoints not listed bypass admission control
+ROUTE_COSTS = {
+    'arbitrage.api_tokens': 8,
+    'arbitrage.legacy_api_data': 6,
+    'arbitrage.api_arbitrage': 4,
+    'arbitrage.api_arbitrage_stats': 4,
+    'arbitrage.api_dashboard': 4,
+    'tokens.api_all_tokens': 8,
+    'tokens.api_tokens_by_exchange': 4,
+    'tokens.api_search_tokens': 2,
+    'tokens.api_top_tokens': 2,
+    'tokens.api_compare_tokens_batch': 2,
+    'networks.api_all_networks': 8,
+    'networks.api_token_networks': 2,
+    'networks.api_compare_network_fees': 2,
+    'networks.api_cheapest_networks': 2,
+    'networks.api_supported_networks': 2,
+    'networks.api_networks_status': 2,
+    'batch.api_batch': 8,
+    'snapshot.api_snapshot_export': 2,
+}
+
+
+class AdmissionController:
+    """
+    Weighted concurrency budget with a FIFO wait queue
+
+    A request of cost c is admitted when c budget units are free and it is
+    at the head of the queue. Requests that cannot be admitted within
+    max_wait seconds are shed. Queue wait, admissions and sheds are counted
+    per endpoint.
+    """
+
+    def __init__(self, budget: int = 16, max_wait: float = 2.0):
+        self.budget = budget
+        self.max_wait = max_wait
+        self._in_use = 0
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._metrics: Dict[str, Dict] = defaultdict(
+            lambda: {'admitted': 0, 'shed': 0, 'stale': 0, 'wait_total': 0.0, 'wait_max': 0.0}
+        )
+
+    def acquire(self, cost: int, timeout: Optional[float] = None) -> Tuple[bool, float]:
+        """
+        Wait for cost budget units
+
+        Returns:
+            Tuple of (admitted, seconds spent waiting)
+        """
+        cost = min(cost, self.budget)
+        timeout = self.max_wait if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+
+        with self._cond:
+            ticket = object()
+            self._queue.append(ticket)
+            try:
+                while self._queue[0] is not ticket or self._in_use + cost > self.budget:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False, time.monotonic() - start
+                    self._cond.wait(remaining)
+
+                self._in_use += cost
+                return True, time.monotonic() - start
+            finally:
+                self._queue.remove(ticket)
+                self._cond.notify_all()
+
+    def release(self, cost: int):
+        """Return cost budget units"""
+        with self._cond:
+            self._in_use -= min(cost, self.budget)
+            self._cond.notify_all()
+
+    def record(self, endpoint: str, admitted: bool, wait: float, stale: bool = False):
+        """Record the outcome of an admission attempt"""
+        with self._cond:
+            metrics = self._metrics[endpoint]
+            metrics['admitted' if admitted else 'shed'] += 1
+            if stale:
+                metrics['stale'] += 1
+            metrics['wait_total'] += wait
+            metrics['wait_max'] = max(metrics['wait_max'], wait)
+
+    def get_stats(self) -> Dict:
+        """Budget usage and per-endpoint admission metrics"""
+        with self._cond:
+            endpoints = {}
+            for endpoint, metrics in self._metrics.items():
+                attempts = metrics['admitted'] + metrics['shed']
+                endpoints[endpoint] = {
+                    'admitted': metrics['admitted'],
+                    'shed': metrics['shed'],
+                    'served_stale': metrics['stale'],
+                    'avg_wait_ms': round(metrics['wait_total'] / max(attempts, 1) * 1000, 3),
+                    'max_wait_ms': round(metrics['wait_max'] * 1000, 3)
+                }
+
+            return {
+                'budget': self.budget,
+                'in_use': self._in_use,
+                'queued': len(self._queue),
+                'max_wait': self.max_wait,
+                'endpoints': endpoints
+            }
+
+
+class StaleResponseCache:
+    """Last successful JSON response body per request path, LRU bounded"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, key: str, body: bytes):
+        """Store response body"""
+        with self._lock:
+            self._entries[key] = (body, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """Get (body, stored_at) of a path, None if not cached"""
+        with self._lock:
+            return self._entries.get(key)
+
+
+# Global admission control instances
+admission_controller = AdmissionController()
+stale_cache = StaleResponseCache()
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the global admission controller instance"""
+    return admission_controller
+
+
+def _shed_response(retry_after: int):
+    """Last good response flagged stale, or 503 with Retry-After"""
+    cached = stale_cache.get(request.full_path)
+    if cached is not None:
+        body, stored_at = cached
+        # Add a top-level "stale" flag without re-encoding the document
+        if body.startswith(b'{'):
+            body = b'{"stale":true,' + body[1:] if body[1:2] != b'}' else b'{"stale":true}'
+        response = current_app.response_class(body, mimetype='application/json')
+        response.headers['X-Stale'] = 'true'
+        response.headers['Age'] = str(int(time.time() - stored_at))
+        return response, True
+
+    response = jsonify({
+        'status': 'error',
+        'message': 'Server is busy, please retry later'
+    })
+    response.status_code = 503
+    response.headers['Retry-After'] = str(retry_after)
+    return response, False
+
+
+def _batch_cost(costs: Dict[str, int]) -> int:
+    """Summed cost of a batch request's sub-queries, at least the batch route's own cost"""
+    # Imported here: routes depend on this module
+    from routes.batch import MAX_BATCH_QUERIES, get_query_endpoint
+
+    base = costs.get('batch.api_batch', 0)
+    payload = request.get_json(silent=True)
+    queries = payload.get('queries') if isinstance(payload, dict) else None
+    if not isinstance(queries, list):
+        return base
+    return max(base, sum(costs.get(get_query_endpoint(query), 0) for query in queries[:MAX_BATCH_QUERIES]))
+
+
+def init_admission_control(app: Flask):
+    """
+    Install admission control hooks
+    Settings: ADMISSION_ENABLED, ADMISSION_BUDGET, ADMISSION_MAX_WAIT,
+    ADMISSION_RETRY_AFTER, ADMISSION_ROUTE_COSTS (overrides of ROUTE_COSTS)
+    """
+    if not app.config.get('ADMISSION_ENABLED', True):
+        return
+
+    admission_controller.budget = app.config.get('ADMISSION_BUDGET', admission_controller.budget)
+    admission_controller.max_wait = app.config.get('ADMISSION_MAX_WAIT', admission_controller.max_wait)
+    retry_after = app.config.get('ADMISSION_RETRY_AFTER', 2)
+    costs = dict(ROUTE_COSTS, **app.config.get('ADMISSION_ROUTE_COSTS', {}))
+
+    @app.before_request
+    def admit_request():
+        cost = costs.get(request.endpoint, 0)
+        if not cost or (request.method != 'GET' and request.endpoint != 'batch.api_batch'):
+            return None
+
+        if request.endpoint == 'batch.api_batch':
+            cost = _batch_cost(costs)
+
+        admitted, wait = admission_controller.acquire(cost)
+        if admitted:
+            # Kept on the WSGI environ: batch sub-requests share g but not the environ
+            request.environ[ADMISSION_COST_KEY] = cost
+            admission_controller.record(request.endpoint, True, wait)
+            return None
+
+        response, stale = _shed_response(retry_after)
+        admission_controller.record(request.endpoint, False, wait, stale=stale)
+        logger.warning(f"Shed {request.endpoint} after {wait:.2f}s in queue (stale={stale})")
+        return response
+
+    @app.after_request
+    def remember_response(response):
+        if (request.environ.get(ADMISSION_COST_KEY) and request.method == 'GET' and response.status_code == 200
+                and response.is_json and not response.direct_passthrough):
+            stale_cache.put(request.full_path, response.get_data())
+        return response
+
+    @app.teardown_request
+    def release_budget(exc=None):
+        cost = request.environ.pop(ADMISSION_COST_KEY, None)
+        if cost:
+            admission_controller.release(cost)
@@ -0,0 +1,117 @@
+"""
+ASGI adapter for the Flask app
+Existing blueprints are served through asgiref's WSGI adapter; snapshot
+long-poll and server-sent events are native async handlers, so an idle
+client costs a parked coroutine instead of a worker thread
+"""
+
+import asyncio
+import json
+from urllib.parse import parse_qs
+
+from asgiref.wsgi import WsgiToAsgi
+
+from routes.snapshot import get_long_poll_params
+from services.snapshot_stream import AsyncSnapshotWatcher
+
+
+class AsgiApplication:
+    """
+    ASGI application wrapping the Flask app
+    Routes snapshot poll/stream requests to async handlers and everything else to Flask
+    """
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.wsgi_app = WsgiToAsgi(flask_app)
+        self.watcher = AsyncSnapshotWatcher(flask_app, interval=flask_app.config.get('SNAPSHOT_POLL_INTERVAL', 1.0))
+        self.max_timeout = flask_app.config.get('LONG_POLL_TIMEOUT', 30)
+
+        self.routes = {
+            '/api/v1/snapshot/poll': self.snapshot_poll,
+            '/api/v1/snapshot/stream': self.snapshot_stream,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self.lifespan(receive, send)
+
+        handler = self.routes.get(scope.get('path')) if scope['type'] == 'http' else None
+        if handler is None:
+            return await self.wsgi_app(scope, receive, send)
+
+        if scope['method'] != 'GET':
+            return await self.send_json(send, 405, {'status': 'error', 'message': 'Method not allowed'})
+
+        query = {key: values[-1] for key, values in parse_qs(scope.get('query_string', b'').decode()).items()}
+        try:
+            since, timeout = get_long_poll_params(query, self.max_timeout)
+        except ValueError:
+            return await self.send_json(send, 400, {'status': 'error', 'message': 'since and timeout must be finite numbers'})
+
+        await handler(receive, send, since, timeout)
+
+    async def lifespan(self, receive, send):
+        """Start and stop the snapshot watcher with the server"""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await self.watcher.start(wait=False)
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.watcher.stop()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def snapshot_poll(self, receive, send, since: int, timeout: float):
+        """Async variant of GET /api/v1/snapshot/poll"""
+        summary = await self.watcher.wait_for_update(since, timeout)
+        if summary is None:
+            return await self.send_json(send, 503, {'status': 'error', 'message': 'Market snapshot not available'})
+
+        await self.send_json(send, 200, {
+            'status': 'success',
+            'data': dict(summary, changed=summary['version'] > since)
+        })
+
+    async def snapshot_stream(self, receive, send, since: int, timeout: float):
+        """
+        GET /api/v1/snapshot/stream (ASGI only)
+        Server-sent events: a 'snapshot' event per new version, comments as heartbeats
+        """
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'text/event-stream'),
+                (b'cache-control', b'no-cache'),
+                (b'x-accel-buffering', b'no'),
+            ]
+        })
+
+        async def push_events():
+            async for summary in self.watcher.updates(since, heartbeat=timeout or self.max_timeout):
+                if summary is None:
+                    chunk = b': heartbeat\n\n'
+                else:
+                    chunk = f"id: {summary['version']}\nevent: snapshot\ndata: {json.dumps(summary)}\n\n".encode()
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+
+        # Stream until the client disconnects
+        pusher = asyncio.create_task(push_events())
+        try:
+            while (await receive())['type'] != 'http.disconnect':
+                pass
+        finally:
+            pusher.cancel()
+
+    @staticmethod
+    async def send_json(send, status: int, payload: dict):
+        """Send a complete JSON response"""
+        body = json.dumps(payload).encode()
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())]
+        })
+        await send({'type': 'http.response.body', 'body': body})
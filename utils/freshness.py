@@ -0,0 +1,65 @@
+"""
+Per-request data freshness
+A max_age query parameter bounds the age of exchange data a request is served
+from; responses report the per-exchange data age of the snapshot they used and
+the exchanges served from last good data while their API calls fail
+"""
+import logging
+
+from flask import Flask, g, jsonify, request
+
+from services import get_exchange_manager, get_market_snapshot
+from utils.helpers import get_freshness_params
+
+
+logger = logging.getLogger(__name__)
+
+
+def format_data_ages(ages: dict) -> str:
+    """Header value of per-exchange data ages, e.g. 'Binance=1.25, KuCoin=unknown'"""
+    return ', '.join(f"{name}={'unknown' if age is None else age}" for name, age in ages.items())
+
+
+def init_freshness_control(app: Flask):
+    """
+    Install max_age hooks
+    Query: max_age (seconds), max_wait (seconds to wait for refreshes, capped by
+    FRESHNESS_MAX_WAIT, default FRESHNESS_DEFAULT_WAIT)
+    """
+    max_wait = app.config.get('FRESHNESS_MAX_WAIT', 10.0)
+    default_wait = app.config.get('FRESHNESS_DEFAULT_WAIT', 2.0)
+
+    @app.before_request
+    def pin_fresh_snapshot():
+        try:
+            freshness = get_freshness_params(request.args, max_wait, default_wait)
+        except ValueError:
+            return jsonify({
+                'status': 'error',
+                'message': 'max_age and max_wait must be non-negative numbers'
+            }), 400
+
+        if freshness is None:
+            return None
+
+        # Every read of this request uses the snapshot built for its max_age
+        g.freshness = freshness
+        g.pinned_market_snapshot = get_market_snapshot(freshness['max_age'], freshness['wait'])
+        return None
+
+    @app.after_request
+    def report_data_age(response):
+        snapshot = g.get('served_market_snapshot')
+        if snapshot is not None:
+            response.headers['X-Data-Age'] = format_data_ages(snapshot.get_data_ages())
+            stale = get_exchange_manager().get_stale_exchanges()
+            if stale:
+                # Last good data of exchanges whose API calls currently fail
+                response.headers['X-Stale-Exchanges'] = ', '.join(stale)
+            freshness = g.get('freshness')
+            if freshness is not None:
+                fresh = snapshot.is_fresh(freshness['max_age'])
+                response.headers['X-Data-Fresh'] = 'true' if fresh else 'false'
+                if not fresh:
+                    logger.warning(f"Served data older than max_age={freshness['max_age']}s to {request.path}")
+        return response
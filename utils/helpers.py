@@ -2,6 +2,7 @@
 Helper utilities for the application
 """
 import re
+import math
 import time
 import logging
 from typing import Any, Dict, List, Optional, Union
@@ -113,6 +114,63 @@ def validate_sort_params(request_args, valid_fields: List[str]) -> Dict[str, str
     }
 
 
+def get_projection_params(request_args) -> Dict[str, Any]:
+    """
+    Extract response shaping parameters
+
+    Args:
+        request_args: Flask request.args
+
+    Returns:
+        Dict with 'fields' (list of row fields or None for all) and
+        'raw' (True when native numbers are requested via format=raw)
+    """
+    fields = [f.strip() for f in request_args.get('fields', '').split(',') if f.strip()]
+
+    return {
+        'fields': fields or None,
+        'raw': request_args.get('format', '').lower() == 'raw'
+    }
+
+
+def get_freshness_params(request_args, max_wait: float, default_wait: float) -> Optional[Dict[str, float]]:
+    """
+    Extract data freshness parameters
+
+    Args:
+        request_args: Flask request.args
+        max_wait: Upper bound of the wait parameter in seconds
+        default_wait: Wait used when only max_age is given
+
+    Returns:
+        Dict with 'max_age' and 'wait' (seconds), None if max_age is not given
+
+    Raises:
+        ValueError: If a parameter is not a non-negative number (max_age may
+            be infinite, max_wait must be finite)
+    """
+    if 'max_age' not in request_args:
+        return None
+
+    max_age = float(request_args['max_age'])
+    wait = float(request_args.get('max_wait', default_wait))
+    # NaN passes every comparison below and would turn into a never-ending wait
+    if math.isnan(max_age) or not math.isfinite(wait):
+        raise ValueError('max_age must be a number and max_wait a finite number')
+    if max_age < 0 or wait < 0:
+        raise ValueError('max_age and max_wait must not be negative')
+
+    return {'max_age': max_age, 'wait': min(wait, max_wait)}
+
+
+def project_fields(items: List[Dict], fields: Optional[List[str]]) -> List[Dict]:
+    """Keep only the requested fields of each row (all rows unchanged if fields is empty)"""
+    if not fields:
+        return items
+
+    return [{field: item[field] for field in fields if field in item} for item in items]
+
+
 def normalize_symbol(symbol: str) -> str:
     """
     Normalize trading pair symbol
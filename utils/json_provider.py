@@ -0,0 +1,89 @@
+"""
+Fast JSON provider for Flask responses
+Uses orjson when it is installed and falls back to the stdlib encoder otherwise
+"""
+import logging
+from typing import Any, Union
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson
+    Keeps DefaultJSONProvider semantics (sorted keys, RFC 822 dates, compact
+    output outside debug) and delegates to the stdlib encoder for anything
+    orjson refuses to serialize
+    """
+
+    def _orjson_options(self, indent: bool = False) -> int:
+        """Build orjson option flags matching the provider settings"""
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps_bytes(self, obj: Any, indent: bool = False) -> bytes:
+        """Serialize data as UTF-8 encoded JSON bytes"""
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._orjson_options(indent))
+        except TypeError as e:
+            # Integers wider than 64 bits and similar edge cases
+            logger.debug(f"orjson could not serialize payload, using stdlib encoder: {e}")
+            kwargs = {'indent': 2} if indent else {'separators': (',', ':')}
+            return super().dumps(obj, **kwargs).encode('utf-8')
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON to a string
+        Custom json.dumps arguments are honoured by the stdlib encoder
+        """
+        if set(kwargs) - {'indent', 'separators'}:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj, indent=bool(kwargs.get('indent'))).decode('utf-8')
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize JSON from a string or bytes"""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Serialize arguments straight to response bytes, skipping the str round-trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self.dumps_bytes(obj, indent=indent) + b"\n",
+            mimetype=self.mimetype
+        )
+
+
+def init_json_provider(app: Flask) -> None:
+    """
+    Install the JSON provider selected by the JSON_PROVIDER config value
+    Supported values: 'orjson' (default) and 'stdlib'
+    """
+    provider_name = app.config.get('JSON_PROVIDER', 'orjson')
+
+    if provider_name == 'orjson':
+        if ORJSON_AVAILABLE:
+            app.json = OrjsonJSONProvider(app)
+            return
+        app.logger.warning("orjson not available, using stdlib JSON encoder")
+    elif provider_name != 'stdlib':
+        app.logger.warning(f"Unknown JSON_PROVIDER '{provider_name}', using stdlib JSON encoder")
+
+    app.json = DefaultJSONProvider(app)